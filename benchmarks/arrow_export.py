@@ -0,0 +1,172 @@
+"""
+Time and peak memory to turn a charge listing into an Arrow table.
+
+A simulated transport serves cursor-paginated 2021-11 charge pages as JSON
+text. "models" is the usual analysis path: ``list_all()``, ``model_dump()``
+every charge, then build a table from the dicts (what ``pandas.DataFrame``
+does with them, without needing pandas). "arrow" is ``recharge.arrow.to_table``,
+which converts each decoded page straight into a record batch. Both tables
+hold the same rows; the arrow one has decimal money columns.
+
+Peak memory is the Python heap high-water mark (tracemalloc) plus the size
+of the finished table, measured in a separate pass from the timings.
+
+Usage:
+    python benchmarks/arrow_export.py --records 20000
+"""
+
+import argparse
+import gc
+import json
+import logging
+import time
+import tracemalloc
+from typing import Callable
+
+import pyarrow as pa
+
+from recharge.api.v2.charges import ChargeResource
+from recharge.arrow import to_table
+from recharge.client import RechargeClient
+from recharge.retry import ExponentialBackoffRetry
+
+
+def charge_record(i: int) -> dict:
+    line_item = {
+        "purchase_item_id": i,
+        "external_product_id": {"ecommerce": "7123456789"},
+        "external_variant_id": {"ecommerce": "41234567890"},
+        "properties": [{"name": "grind", "value": "whole"}],
+        "purchase_item_type": "subscription",
+        "quantity": 1,
+        "sku": "COFFEE-1LB",
+        "tax_lines": [{"price": "1.44", "rate": "0.08", "title": "State tax"}],
+        "taxable": True,
+        "title": "Coffee subscription",
+        "total_price": "18.00",
+        "unit_price": "18.00",
+        "variant_title": "1 lb / Whole bean",
+    }
+    address = {"address1": "1 Main St", "city": "Springfield", "country_code": "US"}
+    return {
+        "id": 100000 + i,
+        "address_id": 200000 + i,
+        "billing_address": address,
+        "customer": {"id": 300000 + i, "email": f"customer{i}@example.com"},
+        "created_at": "2024-03-01T10:00:00+00:00",
+        "currency": "USD",
+        "discounts": [],
+        "line_items": [line_item, {**line_item, "purchase_item_id": i + 1}],
+        "scheduled_at": "2024-04-01",
+        "shipping_address": address,
+        "status": "QUEUED",
+        "subtotal_price": "36.00",
+        "tags": "subscription",
+        "tax_lines": [],
+        "total_price": "40.32",
+        "total_tax": "2.88",
+        "type": "RECURRING",
+        "updated_at": "2024-03-02T10:00:00+00:00",
+    }
+
+
+class _Response:
+    def __init__(self, text: str, url: str) -> None:
+        self.status_code = 200
+        self.headers: dict = {}
+        self.text = text
+        self.url = url
+        self.links: dict = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _ChargeStore:
+    """Transport serving ``records`` charges, ``page_size`` per page, as JSON text."""
+
+    def __init__(self, records: int, page_size: int) -> None:
+        self._records = records
+        self._page_size = page_size
+        pages = -(-records // page_size)
+        self._pages = [
+            json.dumps(
+                {
+                    "charges": [
+                        charge_record(i)
+                        for i in range(page * page_size, min((page + 1) * page_size, records))
+                    ],
+                    "next_cursor": str(page + 1) if page + 1 < pages else None,
+                }
+            )
+            for page in range(pages)
+        ]
+
+    def send(self, method, url, headers, params, json_body):
+        page = int(url.rsplit("cursor=", 1)[1]) if "cursor=" in url else 0
+        return _Response(self._pages[page], url)
+
+
+def via_models(resource: ChargeResource, query: dict) -> pa.Table:
+    return pa.Table.from_pylist([charge.model_dump() for charge in resource.list_all(query)])
+
+
+STRATEGIES: dict[str, Callable[[ChargeResource, dict], pa.Table]] = {
+    "models": via_models,
+    "arrow": to_table,
+}
+
+
+def peak_memory(strategy: str, resource: ChargeResource, query: dict) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        table = STRATEGIES[strategy](resource, query)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak + table.nbytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--page-size", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    client = RechargeClient(
+        "benchmark",
+        transport=_ChargeStore(args.records, args.page_size),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+    )
+    resource = ChargeResource(client, scopes=["read_orders"])
+    query = {"limit": str(args.page_size)}
+
+    best = dict.fromkeys(STRATEGIES, float("inf"))
+    for _ in range(args.repeat):
+        for name, strategy in STRATEGIES.items():
+            gc.collect()
+            start = time.perf_counter()
+            table = strategy(resource, query)
+            best[name] = min(best[name], time.perf_counter() - start)
+            assert table.num_rows == args.records
+            del table
+
+    print(f"{args.records:,} charges, {args.page_size} per page, best of {args.repeat}\n")
+    print(f"{'path':<7} {'total':>8} {'records/s':>10} {'speedup':>8} {'peak memory':>12}")
+    for name in STRATEGIES:
+        elapsed = best[name]
+        peak = peak_memory(name, resource, query)
+        print(
+            f"{name:<7} {elapsed:>7.2f}s {args.records / elapsed:>10,.0f} "
+            f"{best['models'] / elapsed:>7.2f}x {peak / 2**20:>9.1f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
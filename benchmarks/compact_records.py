@@ -0,0 +1,169 @@
+"""
+Memory kept alive by a large subscription ``list_all``, with and without compact mode.
+
+A simulated transport serves cursor-paginated 2021-11 subscription pages as
+JSON text, so every page is decoded into fresh string objects exactly as a
+real response would be. Records draw their SKUs, titles, prices, statuses
+and intervals from a small catalog and carry a few keys the models do not
+declare. For each validation mode the listing is fetched once normally and
+once with ``compact=True``; retained memory is what the returned list keeps
+alive, measured with tracemalloc.
+
+1M records need several GiB for the non-compact modes; scale down with
+``--records`` on smaller machines, memory grows linearly.
+
+Usage:
+    python benchmarks/compact_records.py --records 1000000
+"""
+
+import argparse
+import gc
+import json
+import logging
+import random
+import time
+import tracemalloc
+
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.client import RechargeClient
+from recharge.retry import ExponentialBackoffRetry
+
+URL = "https://api.rechargeapps.com/subscriptions"
+
+CATALOG = [
+    {
+        "sku": f"{roast}-{size}",
+        "product_title": f"{roast.title()} roast coffee subscription",
+        "variant_title": f"{size} / Whole bean",
+        "price": f"{price:.2f}",
+        "external_product_id": {"ecommerce": str(7123456000 + index)},
+        "external_variant_id": {"ecommerce": str(41234567000 + index * 10 + s)},
+    }
+    for index, roast in enumerate(["LIGHT", "MEDIUM", "DARK", "DECAF", "ESPRESSO"])
+    for s, (size, price) in enumerate([("250G", 9.5), ("500G", 16.0), ("1KG", 28.0)])
+]
+
+
+def subscription_record(i: int, rng: random.Random) -> dict:
+    product = rng.choice(CATALOG)
+    unit, frequency = rng.choice([("week", 2), ("week", 4), ("month", 1), ("month", 2)])
+    created = 1_600_000_000 + i * 37
+    return {
+        "id": 400000 + i,
+        "address_id": 200000 + i,
+        "customer_id": 300000 + i // 2,
+        "analytics_data": {"utm_params": []},
+        "cancellation_reason": None,
+        "cancelled_at": None,
+        "charge_interval_frequency": frequency,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(created)),
+        "has_queued_charges": True,
+        "is_prepaid": False,
+        "is_skippable": True,
+        "is_swappable": True,
+        "max_retries_reached": False,
+        "next_charge_scheduled_at": f"2024-04-{rng.randint(1, 30):02d}",
+        "order_day_of_month": None,
+        "order_day_of_week": None,
+        "order_interval_frequency": frequency,
+        "order_interval_unit": unit,
+        "presentment_currency": "USD",
+        "properties": [],
+        "quantity": rng.choice([1, 1, 1, 2]),
+        "sku_override": False,
+        "status": rng.choice(["active", "active", "active", "cancelled"]),
+        "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(created + 86400)),
+        **product,
+        # Returned by the API but not declared on the model.
+        "commit_update": False,
+        "locked_pricing": True,
+        "shopify_product_id": int(product["external_product_id"]["ecommerce"]),
+        "shopify_variant_id": int(product["external_variant_id"]["ecommerce"]),
+    }
+
+
+class _Response:
+    def __init__(self, text: str, url: str) -> None:
+        self.status_code = 200
+        self.headers: dict = {}
+        self.text = text
+        self.url = url
+        self.links: dict = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _SubscriptionStore:
+    """Transport serving ``records`` subscriptions, ``page_size`` per page, as JSON text."""
+
+    def __init__(self, records: int, page_size: int) -> None:
+        self._records = records
+        self._page_size = page_size
+
+    def send(self, method, url, headers, params, json_body):
+        page = int(url.rsplit("cursor=", 1)[1]) if "cursor=" in url else 0
+        first = page * self._page_size
+        last = min(first + self._page_size, self._records)
+        rng = random.Random(page)
+        body = {
+            "subscriptions": [subscription_record(i, rng) for i in range(first, last)],
+            "next_cursor": str(page + 1) if last < self._records else None,
+        }
+        return _Response(json.dumps(body), url)
+
+
+def run(validation: str, compact: bool, args: argparse.Namespace) -> tuple[int, float, float]:
+    """Records, retained bytes and elapsed seconds for one full listing."""
+    client = RechargeClient(
+        "benchmark",
+        transport=_SubscriptionStore(args.records, args.page_size),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+        validation=validation,
+        compact=compact,
+    )
+    resource = SubscriptionResource(client, scopes=["read_subscriptions"])
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        subscriptions = resource.list_all({"limit": str(args.page_size)})
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    count = len(subscriptions)
+    del subscriptions
+    return count, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=250)
+    parser.add_argument("--modes", default="full,none,lazy", help="validation modes")
+    args = parser.parse_args()
+
+    print(f"list_all of {args.records:,} subscriptions, {args.page_size} per page\n")
+    print(
+        f"{'validation':<11} {'compact':<8} {'retained':>10} {'per record':>11} "
+        f"{'saved':>6} {'elapsed':>8}"
+    )
+    for validation in args.modes.split(","):
+        baseline = None
+        for compact in (False, True):
+            count, size, elapsed = run(validation, compact, args)
+            baseline = baseline or size
+            print(
+                f"{validation:<11} {'yes' if compact else 'no':<8} {size / 2**20:>7.1f}MiB "
+                f"{size / count:>9.0f} B {1 - size / baseline:>6.0%} {elapsed:>7.1f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+API calls and lookup latency when worker processes start cold, with and without a shared cache.
+
+Each worker process builds a fresh RechargeClient (as a restarted gunicorn or
+celery worker would) and reads the store and the plans of each product
+through a simulated transport with a fixed round-trip.
+Workers start one after another in waves, so later waves find what earlier
+ones fetched. Three setups are compared:
+
+    none     no cache
+    memory   one MemoryResponseCache per process (empty at every start)
+    sqlite   SQLiteResponseCache on one file, shared by every process
+
+Usage:
+    python benchmarks/disk_cache.py --processes 16 --waves 4 --products 50
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+
+from recharge.cache import MemoryResponseCache, SQLiteResponseCache
+from recharge.client import RechargeClient
+from recharge.retry import ExponentialBackoffRetry
+
+BASE = "https://api.rechargeapps.com"
+
+
+def _plans(product: int) -> dict:
+    return {
+        "plans": [
+            {
+                "id": product * 10 + i,
+                "title": f"Deliver every {i + 1} weeks",
+                "type": "subscription",
+                "external_product_id": {"ecommerce": str(7123456000 + product)},
+                "discount_amount": "10.00",
+                "discount_type": "percentage",
+                "subscription_preferences": {
+                    "interval_unit": "week",
+                    "order_interval_frequency": i + 1,
+                    "charge_interval_frequency": i + 1,
+                },
+            }
+            for i in range(4)
+        ],
+        "next_cursor": None,
+    }
+
+
+class _Response:
+    def __init__(self, url: str, data: dict) -> None:
+        self.status_code = 200
+        self.headers: dict = {}
+        self.text = json.dumps(data)
+        self.url = url
+        self.links: dict = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _SimulatedStore:
+    def __init__(self, calls, latency: float) -> None:
+        self._calls = calls
+        self._latency = latency
+
+    def send(self, method, url, headers, params, json):
+        with self._calls.get_lock():
+            self._calls.value += 1
+        time.sleep(self._latency)
+        if url.endswith("/store"):
+            return _Response(url, {"store": {"id": 1, "name": "Coffee Club"}})
+        product = int((params or {}).get("external_product_id", 0)) - 7123456000
+        return _Response(url, _plans(product))
+
+
+def _worker(mode, db_path, calls, args, results):
+    if mode == "memory":
+        cache = MemoryResponseCache()
+    elif mode == "sqlite":
+        cache = SQLiteResponseCache(db_path)
+    else:
+        cache = None
+    client = RechargeClient(
+        "benchmark",
+        transport=_SimulatedStore(calls, args.latency),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+        cache=cache,
+    )
+    start = time.perf_counter()
+    client.get(f"{BASE}/store", response_key="store")
+    for product in range(args.products):
+        query = {"external_product_id": str(7123456000 + product)}
+        client.get(f"{BASE}/plans", query, response_key="plans", expected=list)
+    results.put(time.perf_counter() - start)
+
+
+def run(mode: str, args: argparse.Namespace) -> tuple[int, float, int]:
+    calls = multiprocessing.Value("i", 0)
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    per_wave = max(1, args.processes // args.waves)
+    durations = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cache.sqlite3")
+        for _ in range(args.waves):
+            procs = [
+                multiprocessing.Process(target=_worker, args=(mode, db_path, calls, args, results))
+                for _ in range(per_wave)
+            ]
+            for proc in procs:
+                proc.start()
+            durations += [results.get() for _ in procs]
+            for proc in procs:
+                proc.join()
+        size = 0
+        if mode == "sqlite":
+            cache = SQLiteResponseCache(db_path)
+            size = cache.stats().size  # compressed bodies
+            cache.close()
+    return calls.value, sum(durations) / len(durations), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=16)
+    parser.add_argument("--waves", type=int, default=4, help="groups of workers started in turn")
+    parser.add_argument("--products", type=int, default=50, help="plan lookups per worker")
+    parser.add_argument("--latency", type=float, default=0.15, help="simulated round-trip, s")
+    parser.add_argument("--modes", default="none,memory,sqlite")
+    args = parser.parse_args()
+
+    lookups = args.processes // args.waves * args.waves * (args.products + 1)
+    print(
+        f"{args.processes} processes in {args.waves} waves, {args.products + 1} lookups each, "
+        f"{args.latency * 1000:g}ms round-trip\n"
+    )
+    print(f"{'mode':<8} {'lookups':>8} {'API calls':>10} {'warm-up/proc':>13} {'stored':>9}")
+    for mode in args.modes.split(","):
+        calls, warmup, size = run(mode, args)
+        stored = f"{size / 1024:.1f}KiB" if size else "-"
+        print(f"{mode:<8} {lookups:>8} {calls:>10} {warmup:>12.2f}s {stored:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Re-hydrating subscriptions by id: one ``get`` per id against ``get_many``.
+
+A simulated transport answers every request after ``--latency`` seconds,
+serving ``GET /subscriptions/<id>`` and ``GET /subscriptions?ids=...``.
+Per-id ``get`` is timed on ``--sample`` ids and extrapolated to
+``--records``; ``get_many`` fetches all of them.
+
+Usage:
+    python benchmarks/get_many.py --records 50000 --latency 0.15
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+from compact_records import subscription_record
+
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.client import RechargeClient
+from recharge.retry import ExponentialBackoffRetry
+
+
+class _Response:
+    def __init__(self, body: dict, url: str) -> None:
+        self.status_code = 200
+        self.headers: dict = {}
+        self.text = json.dumps(body)
+        self.url = url
+        self.links: dict = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _SlowStore:
+    """Transport with a fixed round-trip time that counts the requests it serves."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def send(self, method, url, headers, params, json_body):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+        rng = random.Random(0)
+        path = urlparse(url).path
+        if path.rstrip("/").endswith("subscriptions"):
+            ids = (params or parse_qs(urlparse(url).query))["ids"]
+            ids = ids if isinstance(ids, str) else ids[0]
+            body = {
+                "subscriptions": [subscription_record(int(i) - 400000, rng) for i in ids.split(",")]
+            }
+        else:
+            body = {"subscription": subscription_record(int(path.rsplit("/", 1)[1]) - 400000, rng)}
+        return _Response(body, url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--latency", type=float, default=0.15, help="seconds per request")
+    parser.add_argument("--sample", type=int, default=20, help="ids fetched with get")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    transport = _SlowStore(args.latency)
+    client = RechargeClient(
+        "benchmark",
+        transport=transport,
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+    )
+    resource = SubscriptionResource(client, scopes=["read_subscriptions"])
+    ids = [400000 + i for i in range(args.records)]
+
+    start = time.perf_counter()
+    for id in ids[: args.sample]:
+        resource.get(id)
+    per_get = (time.perf_counter() - start) / args.sample
+
+    transport.requests = 0
+    start = time.perf_counter()
+    result = resource.get_many(ids, concurrency=args.concurrency)
+    elapsed = time.perf_counter() - start
+    assert len(result) == args.records
+
+    print(f"{args.records:,} subscriptions, {args.latency * 1000:.0f}ms per request\n")
+    print(f"{'path':<22} {'requests':>9} {'elapsed':>10}")
+    print(f"{'get per id':<22} {args.records:>9,} {per_get * args.records:>9.0f}s (extrapolated)")
+    print(
+        f"{f'get_many (x{args.concurrency})':<22} {transport.requests:>9,} {elapsed:>9.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
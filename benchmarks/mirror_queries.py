@@ -0,0 +1,87 @@
+"""
+Lookup latency against a local mirror of a subscription listing.
+
+The simulated transport from ``compact_records.py`` serves cursor-paginated
+2021-11 subscription pages; the mirror syncs them into a temporary SQLite
+file, then each lookup below runs repeatedly against random customers and
+subscriptions. Timings include decoding the stored JSON and building the
+same models ``list_`` returns, at the given validation level.
+
+Usage:
+    python benchmarks/mirror_queries.py --records 100000
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+from compact_records import _SubscriptionStore
+
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.client import RechargeClient
+from recharge.mirror import TABLES, Mirror
+from recharge.retry import ExponentialBackoffRetry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=250)
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--validation", default="full")
+    args = parser.parse_args()
+
+    client = RechargeClient(
+        "benchmark",
+        transport=_SubscriptionStore(args.records, args.page_size),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+        validation=args.validation,
+    )
+    api = SimpleNamespace(Subscription=SubscriptionResource(client, scopes=["read_subscriptions"]))
+    tables = [table for table in TABLES if table.name == "subscriptions"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        mirror = Mirror(os.path.join(directory, "mirror.db"), api, tables)
+        start = time.perf_counter()
+        mirror.sync()
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(mirror.path) + os.path.getsize(f"{mirror.path}-wal")
+        print(
+            f"synced {args.records:,} subscriptions in {elapsed:.1f}s "
+            f"({args.records / elapsed:,.0f} records/s, {size / 2**20:.0f}MiB on disk)\n"
+        )
+
+        rng = random.Random(0)
+        subscriptions = mirror.subscriptions
+        customers = 300000 + args.records // 2
+        lookups: dict[str, Callable[[], object]] = {
+            "get(id)": lambda: subscriptions.get(400000 + rng.randrange(args.records)),
+            "list_ customer_id": lambda: subscriptions.list_(
+                {"customer_id": rng.randrange(300000, customers)}
+            ),
+            "list_ customer_id+status": lambda: subscriptions.list_(
+                {"customer_id": rng.randrange(300000, customers), "status": "active"}
+            ),
+            "list_ address_id": lambda: subscriptions.list_(
+                {"address_id": 200000 + rng.randrange(args.records)}
+            ),
+            "count status": lambda: subscriptions.count({"status": "cancelled"}),
+        }
+        print(f"{'lookup':<26} {'per call':>10} {'calls/s':>9}")
+        for name, lookup in lookups.items():
+            start = time.perf_counter()
+            for _ in range(args.lookups):
+                lookup()
+            per_call = (time.perf_counter() - start) / args.lookups
+            print(f"{name:<26} {per_call * 1e6:>8.0f}µs {1 / per_call:>9,.0f}")
+        mirror.close()
+
+
+if __name__ == "__main__":
+    main()
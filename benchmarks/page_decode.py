@@ -0,0 +1,120 @@
+"""
+CPU per page spent decoding a 2021-11 page and working out the next page URL.
+
+"before" is the previous pagination step: decode the body for the records,
+then let ``get_next_page_url`` decode it again for ``next_cursor`` and rebuild
+the query with ``parse_qs``/``urlencode``. "after" is what ``iter_pages`` does
+now: decode once and build the cursor URL from the already-decoded body.
+
+Usage:
+    python benchmarks/page_decode.py --records 250 --pages 400
+"""
+
+import argparse
+import json
+import time
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from recharge.pagination import next_page_url, page_base
+
+URL = "https://api.rechargeapps.com/charges?limit=250&cursor=eyJzdGFydGluZ19iZWZvcmVfaWQiOiAx"
+
+
+def _charge(i: int) -> dict:
+    line_item = {
+        "purchase_item_id": i,
+        "external_product_id": {"ecommerce": "7123456789"},
+        "external_variant_id": {"ecommerce": "41234567890"},
+        "title": "Coffee subscription",
+        "variant_title": "1 lb / Whole bean",
+        "quantity": 1,
+        "unit_price": "18.00",
+        "total_price": "18.00",
+        "sku": "COFFEE-1LB",
+        "properties": [{"name": "grind", "value": "whole"}],
+        "tax_lines": [{"price": "1.44", "rate": "0.08", "title": "State tax"}],
+    }
+    return {
+        "id": 100000 + i,
+        "address_id": 200000 + i,
+        "customer": {"id": 300000 + i, "email": f"customer{i}@example.com"},
+        "created_at": "2024-03-01T10:00:00+00:00",
+        "updated_at": "2024-03-02T10:00:00+00:00",
+        "scheduled_at": "2024-04-01",
+        "status": "queued",
+        "type": "recurring",
+        "currency": "USD",
+        "subtotal_price": "36.00",
+        "total_price": "40.32",
+        "total_tax": "2.88",
+        "total_discounts": "0.00",
+        "line_items": [line_item, {**line_item, "purchase_item_id": i + 1}],
+        "shipping_lines": [{"code": "Standard", "price": "1.44", "title": "Standard"}],
+        "billing_address": {"address1": "1 Main St", "city": "Springfield", "zip": "12345"},
+        "shipping_address": {"address1": "1 Main St", "city": "Springfield", "zip": "12345"},
+        "tags": "subscription",
+        "note": None,
+    }
+
+
+class _Response:
+    """Like a requests response: every ``json()`` call decodes ``text`` again."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.url = URL
+        self.links: dict = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def _before(response: _Response) -> tuple[list, str]:
+    records = response.json().get("charges", [])
+    data = response.json()
+    cursor = data.get("next_cursor")
+    parsed = urlparse(response.url)
+    params = parse_qs(parsed.query)
+    params = {k: v for k, v in params.items() if k in ("cursor", "limit")}
+    params["cursor"] = [cursor]
+    return records, urlunparse(parsed._replace(query=urlencode(params, doseq=True)))
+
+
+def _after(response: _Response, base_url: str, limit) -> tuple[list, str]:
+    body = response.json()
+    records = body.get("charges", [])
+    return records, next_page_url(response, body, "2021-11", base_url, limit)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=250, help="records per page")
+    parser.add_argument("--pages", type=int, default=400)
+    args = parser.parse_args()
+
+    body = {
+        "charges": [_charge(i) for i in range(args.records)],
+        "next_cursor": "eyJzdGFydGluZ19iZWZvcmVfaWQiOiAxMDAyNTB9",
+        "previous_cursor": None,
+    }
+    response = _Response(json.dumps(body))
+    base_url, limit = page_base(URL)
+    assert _before(response)[1] == _after(response, base_url, limit)[1]
+
+    print(f"{args.pages} pages x {args.records} charges ({len(response.text) / 1024:.0f} KiB)\n")
+    print(f"{'path':<7} {'CPU/page':>10} {'speedup':>8}")
+    baseline = None
+    for name, step in (
+        ("before", lambda: _before(response)),
+        ("after", lambda: _after(response, base_url, limit)),
+    ):
+        start = time.process_time()
+        for _ in range(args.pages):
+            step()
+        per_page = (time.process_time() - start) / args.pages
+        baseline = baseline or per_page
+        print(f"{name:<7} {per_page * 1000:>8.2f}ms {baseline / per_page:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
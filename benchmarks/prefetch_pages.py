@@ -0,0 +1,106 @@
+"""
+Throughput of paging through a listing with and without background prefetch.
+
+A simulated transport serves cursor-paginated v2 charge pages after a fixed
+latency, and the consumer burns a fixed amount of CPU per page. Serially the
+two costs add up; with ``prefetch_pages`` the next page downloads while the
+current one is being processed, so throughput approaches 2x when they match.
+
+Usage:
+    python benchmarks/prefetch_pages.py --pages 40 --latency 0.02 --work 0.02
+"""
+
+import argparse
+import logging
+import time
+
+from recharge.api.v2.charges import ChargeResource
+from recharge.client import RechargeClient
+from recharge.pagination import prefetch_pages
+from recharge.retry import ExponentialBackoffRetry
+
+URL = "https://api.rechargeapps.com/charges"
+
+
+class _Response:
+    def __init__(self, data: dict, url: str) -> None:
+        self.status_code = 200
+        self.headers: dict = {}
+        self.text = ""
+        self.url = url
+        self.links: dict = {}
+        self._data = data
+
+    def json(self) -> dict:
+        return self._data
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _PagedStore:
+    """Transport serving ``pages`` pages of ``page_size`` charges, ``latency`` seconds each."""
+
+    def __init__(self, pages: int, page_size: int, latency: float) -> None:
+        self._pages = pages
+        self._page_size = page_size
+        self._latency = latency
+
+    def send(self, method, url, headers, params, json):
+        time.sleep(self._latency)
+        page = int(url.rsplit("cursor=", 1)[1]) if "cursor=" in url else 0
+        first = page * self._page_size
+        charges = [
+            {"id": i, "status": "success", "type": "recurring"}
+            for i in range(first, first + self._page_size)
+        ]
+        cursor = str(page + 1) if page + 1 < self._pages else None
+        return _Response({"charges": charges, "next_cursor": cursor}, url)
+
+
+def _burn(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def run(depth: int, args: argparse.Namespace) -> tuple[int, float]:
+    client = RechargeClient(
+        "benchmark",
+        transport=_PagedStore(args.pages, args.page_size, args.latency),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+    )
+    resource = ChargeResource(client, scopes=["read_orders"])
+    records = 0
+    start = time.perf_counter()
+    for page in prefetch_pages(resource.iter_pages({"limit": str(args.page_size)}), depth):
+        _burn(args.work)
+        records += len(page)
+    return records, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="per-page round-trip, s")
+    parser.add_argument("--work", type=float, default=0.02, help="consumer CPU per page, s")
+    parser.add_argument("--depths", default="0,1,2,4", help="0 = no prefetch")
+    args = parser.parse_args()
+
+    print(
+        f"{args.pages} pages x {args.page_size} records, "
+        f"latency {args.latency * 1000:g}ms, work {args.work * 1000:g}ms/page\n"
+    )
+    print(f"{'depth':>5} {'records':>8} {'elapsed':>8} {'pages/s':>8} {'speedup':>8}")
+    baseline = None
+    for depth in (int(d) for d in args.depths.split(",")):
+        records, elapsed = run(depth, args)
+        rate = args.pages / elapsed
+        baseline = baseline or rate
+        print(f"{depth:>5} {records:>8} {elapsed:>7.2f}s {rate:>8.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
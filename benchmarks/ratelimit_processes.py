@@ -0,0 +1,142 @@
+"""
+Aggregate 429 rate when N worker processes hammer one simulated Recharge store.
+
+The simulated store enforces a leaky bucket (shared between processes through
+multiprocessing state) and answers 429 on overflow. Each worker process sends
+requests through its own RechargeClient with one of three limiter setups:
+
+    none    no client-side limiter
+    local   one LeakyBucketRateLimiter per process (cannot see the other workers)
+    shared  SQLiteRateLimiter on one file, shared by every process
+
+Usage:
+    python benchmarks/ratelimit_processes.py --processes 16 --requests 40
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+
+from recharge.client import RechargeClient
+from recharge.exceptions import RechargeHTTPError
+from recharge.ratelimit import LeakyBucketRateLimiter, SQLiteRateLimiter
+from recharge.retry import ExponentialBackoffRetry
+
+URL = "https://api.rechargeapps.com/charges"
+
+
+class _Response:
+    def __init__(self, status_code: int, used: int, size: int) -> None:
+        self.status_code = status_code
+        self.headers = {"X-Recharge-Limit": f"{used}/{size}"}
+        self.text = ""
+        self.url = URL
+        self.links: dict = {}
+
+    def json(self):
+        return {"charge": {"id": 1}}
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            from requests.exceptions import HTTPError
+
+            raise HTTPError(response=self)
+
+
+class _SimulatedStore:
+    """Transport that applies the store's leaky bucket to every request."""
+
+    def __init__(self, state, lock, bucket_size: int, leak_rate: float, latency: float):
+        self._state = state  # [level, updated_at]
+        self._lock = lock
+        self._bucket_size = bucket_size
+        self._leak_rate = leak_rate
+        self._latency = latency
+
+    def send(self, method, url, headers, params, json):
+        time.sleep(self._latency / 2)
+        with self._lock:
+            now = time.time()
+            level = max(0.0, self._state[0] - (now - self._state[1]) * self._leak_rate)
+            accepted = level + 1 <= self._bucket_size
+            if accepted:
+                level += 1
+            self._state[0], self._state[1] = level, now
+        time.sleep(self._latency / 2)
+        return _Response(200 if accepted else 429, int(level), self._bucket_size)
+
+
+def _worker(mode, db_path, state, lock, args, results):
+    if mode == "local":
+        limiter = LeakyBucketRateLimiter(bucket_size=args.bucket_size, leak_rate=args.leak_rate)
+    elif mode == "shared":
+        limiter = SQLiteRateLimiter(db_path, bucket_size=args.bucket_size, leak_rate=args.leak_rate)
+    else:
+        limiter = None
+    client = RechargeClient(
+        "benchmark",
+        transport=_SimulatedStore(state, lock, args.bucket_size, args.leak_rate, args.latency),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=logging.CRITICAL + 1,
+        rate_limiter=limiter,
+    )
+    throttled = 0
+    for _ in range(args.requests):
+        try:
+            client.get(URL, response_key="charge")
+        except RechargeHTTPError as exc:
+            if exc.status_code != 429:
+                raise
+            throttled += 1
+    results.put(throttled)
+
+
+def run(mode: str, args: argparse.Namespace) -> tuple[int, int, float]:
+    state = multiprocessing.Array("d", [0.0, time.time()])
+    lock = multiprocessing.Lock()
+    results: multiprocessing.Queue = multiprocessing.Queue()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "ratelimit.sqlite3")
+        start = time.perf_counter()
+        procs = [
+            multiprocessing.Process(target=_worker, args=(mode, db_path, state, lock, args, results))
+            for _ in range(args.processes)
+        ]
+        for proc in procs:
+            proc.start()
+        throttled = sum(results.get() for _ in procs)
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - start
+    return args.processes * args.requests, throttled, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=40, help="requests per process")
+    parser.add_argument("--bucket-size", type=int, default=40)
+    parser.add_argument("--leak-rate", type=float, default=100.0, help="calls/s (Recharge: 2)")
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated round-trip, s")
+    parser.add_argument("--modes", default="none,local,shared")
+    args = parser.parse_args()
+
+    print(
+        f"{args.processes} processes x {args.requests} requests, "
+        f"bucket {args.bucket_size} @ {args.leak_rate:g}/s\n"
+    )
+    print(f"{'mode':<8} {'requests':>9} {'429s':>6} {'429 rate':>9} {'elapsed':>8} {'req/s':>7}")
+    for mode in args.modes.split(","):
+        total, throttled, elapsed = run(mode, args)
+        ok = total - throttled
+        print(
+            f"{mode:<8} {total:>9} {throttled:>6} {throttled / total:>8.1%} "
+            f"{elapsed:>7.2f}s {ok / elapsed:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Time and memory to turn decoded list pages into models, per validation strategy.
+
+Records are realistic v2 charges and subscriptions (nested line items,
+addresses, tax lines). Each strategy validates the same fresh copy of the
+records, so in-place coercion by one run cannot speed up the next.
+
+    per-item   [Model.model_validate(item) for item in data]  (original behaviour)
+    adapter    validate_list(Model, data): one cached TypeAdapter(list[Model]) call
+    none       load_list(..., "none"): model_construct all the way down
+    lazy       load_list(..., "lazy"): proxies validating nested models on access
+
+With --read, each record's id, status and one nested model are read after
+the page is built, as a typical export job would.
+
+Memory is what the resulting models keep alive, measured with tracemalloc in a
+separate pass so it does not skew the timings.
+
+Usage:
+    python benchmarks/validation.py --records 10000 --repeat 5
+"""
+
+import argparse
+import copy
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+from recharge.model.base import load_list, validate_list
+from recharge.model.v2.charge import Charge
+from recharge.model.v2.subscription import Subscription
+
+
+def charge_record(i: int) -> dict:
+    line_item = {
+        "purchase_item_id": i,
+        "external_product_id": {"ecommerce": "7123456789"},
+        "external_variant_id": {"ecommerce": "41234567890"},
+        "images": None,
+        "properties": None,
+        "purchase_item_type": "subscription",
+        "quantity": 1,
+        "sku": "COFFEE-1LB",
+        "tax_lines": [{"price": "1.44", "rate": "0.08", "title": "State tax"}],
+        "taxable": True,
+        "title": "Coffee subscription",
+        "total_price": "18.00",
+        "unit_price": "18.00",
+        "variant_title": "1 lb / Whole bean",
+    }
+    address = {"address1": "1 Main St", "city": "Springfield", "country_code": "US"}
+    return {
+        "id": 100000 + i,
+        "address_id": 200000 + i,
+        "analytics_data": {"utm_params": None},
+        "billing_address": address,
+        "customer": {"id": 300000 + i, "email": f"customer{i}@example.com"},
+        "created_at": "2024-03-01T10:00:00+00:00",
+        "currency": "USD",
+        "discounts": None,
+        "line_items": [line_item, {**line_item, "purchase_item_id": i + 1}],
+        "order_attributes": None,
+        "scheduled_at": "2024-04-01",
+        "shipping_address": address,
+        "status": "queued",
+        "subtotal_price": "36.00",
+        "tags": "subscription",
+        "tax_lines": None,
+        "total_price": "40.32",
+        "type": "recurring",
+        "updated_at": "2024-03-02T10:00:00+00:00",
+    }
+
+
+def subscription_record(i: int) -> dict:
+    return {
+        "id": 400000 + i,
+        "address_id": 200000 + i,
+        "customer_id": 300000 + i,
+        "analytics_data": {"utm_params": None},
+        "charge_interval_frequency": 1,
+        "created_at": "2024-03-01T10:00:00+00:00",
+        "external_product_id": {"ecommerce": "7123456789"},
+        "external_variant_id": {"ecommerce": "41234567890"},
+        "has_queued_charges": True,
+        "is_prepaid": False,
+        "is_skippable": True,
+        "is_swappable": True,
+        "max_retries_reached": False,
+        "next_charge_scheduled_at": "2024-04-01",
+        "order_interval_frequency": 1,
+        "order_interval_unit": "month",
+        "price": "18.00",
+        "product_title": "Coffee subscription",
+        "properties": None,
+        "quantity": 1,
+        "sku": "COFFEE-1LB",
+        "sku_override": False,
+        "status": "active",
+        "updated_at": "2024-03-02T10:00:00+00:00",
+        "variant_title": "1 lb / Whole bean",
+    }
+
+
+STRATEGIES: dict[str, Callable[[type, list], list]] = {
+    "per-item": lambda model, data: [model.model_validate(item) for item in data],
+    "adapter": validate_list,
+    "none": lambda model, data: load_list(model, data, "none"),
+    "lazy": lambda model, data: load_list(model, data, "lazy"),
+}
+
+READ_FIELDS = {
+    "Charge": ("id", "status", "customer"),
+    "Subscription": ("id", "status", "external_product_id"),
+}
+
+
+def measure(
+    strategies: list[str], model: type, records: list, repeat: int, read: tuple[str, ...] = ()
+) -> dict[str, float]:
+    """Best time per strategy; strategies are interleaved so machine drift hits all alike."""
+    best = dict.fromkeys(strategies, float("inf"))
+    for _ in range(repeat):
+        for name in strategies:
+            data = copy.deepcopy(records)
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for item in STRATEGIES[name](model, data):
+                    for field in read:
+                        getattr(item, field)
+                best[name] = min(best[name], time.perf_counter() - start)
+            finally:
+                gc.enable()
+    return best
+
+
+def retained(strategy: str, model: type, records: list) -> int:
+    """Bytes still allocated by the models built from ``records``, raw data they keep included."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        data = copy.deepcopy(records)
+        models = STRATEGIES[strategy](model, data)
+        del data
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del models
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES))
+    parser.add_argument("--read", action="store_true", help="read a few fields per record")
+    args = parser.parse_args()
+
+    datasets = {
+        "Charge": (Charge, [charge_record(i) for i in range(args.records)]),
+        "Subscription": (Subscription, [subscription_record(i) for i in range(args.records)]),
+    }
+    reading = " reading id, status and one nested model" if args.read else ""
+    print(f"{args.records} records, best of {args.repeat}{reading}\n")
+    print(
+        f"{'model':<13} {'strategy':<10} {'total':>9} {'per record':>11} "
+        f"{'records/s':>10} {'speedup':>8} {'retained':>9}"
+    )
+    strategies = args.strategies.split(",")
+    for name, (model, records) in datasets.items():
+        read = READ_FIELDS[name] if args.read else ()
+        timings = measure(strategies, model, records, args.repeat, read)
+        baseline = timings[strategies[0]]
+        for strategy in strategies:
+            elapsed = timings[strategy]
+            size = retained(strategy, model, records)
+            print(
+                f"{name:<13} {strategy:<10} {elapsed * 1000:>7.1f}ms "
+                f"{elapsed / args.records * 1e6:>9.2f}us {args.records / elapsed:>10,.0f} "
+                f"{baseline / elapsed:>7.2f}x {size / 2**20:>7.1f}MiB"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 import logging
-from typing import Optional
+from typing import Any, Optional
 
+import recharge.api.aio.v1 as aio_v1
+import recharge.api.aio.v2 as aio_v2
 import recharge.api.v1 as v1
 import recharge.api.v2 as v2
-from recharge.client import RechargeClient
+from recharge.client import AsyncRechargeClient, RechargeClient
 from recharge.types import RechargeScope
 
 
@@ -72,4 +74,93 @@ class RechargeAPI:
         self.v2 = RechargeAPIv2(self.client, self.scopes)
 
 
-__all__ = ["RechargeAPI", "RechargeAPIv1", "RechargeAPIv2"]
+class AsyncRechargeAPIv1:
+    def __init__(self, client: AsyncRechargeClient, scopes: list[RechargeScope]) -> None:
+        kwargs = {"client": client, "scopes": scopes}
+        self.Address = aio_v1.AsyncAddressResource(**kwargs)
+        self.AsyncBatch = aio_v1.AsyncAsyncBatchResource(**kwargs)
+        self.Charge = aio_v1.AsyncChargeResource(**kwargs)
+        self.Checkout = aio_v1.AsyncCheckoutResource(**kwargs)
+        self.Customer = aio_v1.AsyncCustomerResource(**kwargs)
+        self.Discount = aio_v1.AsyncDiscountResource(**kwargs)
+        self.Metafield = aio_v1.AsyncMetafieldResource(**kwargs)
+        self.Notification = aio_v1.AsyncNotificationResource(**kwargs)
+        self.Onetime = aio_v1.AsyncOnetimeResource(**kwargs)
+        self.Order = aio_v1.AsyncOrderResource(**kwargs)
+        self.Product = aio_v1.AsyncProductResource(**kwargs)
+        self.Shop = aio_v1.AsyncShopResource(**kwargs)
+        self.Subscription = aio_v1.AsyncSubscriptionResource(**kwargs)
+        self.Token = aio_v1.AsyncTokenResource(**kwargs)
+        self.Webhook = aio_v1.AsyncWebhookResource(**kwargs)
+
+
+class AsyncRechargeAPIv2:
+    def __init__(self, client: AsyncRechargeClient, scopes: list[RechargeScope]) -> None:
+        kwargs = {"client": client, "scopes": scopes}
+        self.Account = aio_v2.AsyncAccountResource(**kwargs)
+        self.Address = aio_v2.AsyncAddressResource(**kwargs)
+        self.AsyncBatch = aio_v2.AsyncAsyncBatchResource(**kwargs)
+        self.BundleSelection = aio_v2.AsyncBundleSelectionResource(**kwargs)
+        self.Charge = aio_v2.AsyncChargeResource(**kwargs)
+        self.Checkout = aio_v2.AsyncCheckoutResource(**kwargs)
+        self.Collection = aio_v2.AsyncCollectionResource(**kwargs)
+        self.Customer = aio_v2.AsyncCustomerResource(**kwargs)
+        self.Discount = aio_v2.AsyncDiscountResource(**kwargs)
+        self.Event = aio_v2.AsyncEventResource(**kwargs)
+        self.Metafield = aio_v2.AsyncMetafieldResource(**kwargs)
+        self.Notification = aio_v2.AsyncNotificationResource(**kwargs)
+        self.Onetime = aio_v2.AsyncOnetimeResource(**kwargs)
+        self.Order = aio_v2.AsyncOrderResource(**kwargs)
+        self.PaymentMethod = aio_v2.AsyncPaymentMethodResource(**kwargs)
+        self.Plan = aio_v2.AsyncPlanResource(**kwargs)
+        self.Product = aio_v2.AsyncProductResource(**kwargs)
+        self.RetentionStrategy = aio_v2.AsyncRetentionStrategyResource(**kwargs)
+        self.Store = aio_v2.AsyncStoreResource(**kwargs)
+        self.Subscription = aio_v2.AsyncSubscriptionResource(**kwargs)
+        self.Token = aio_v2.AsyncTokenResource(**kwargs)
+        self.Webhook = aio_v2.AsyncWebhookResource(**kwargs)
+
+
+class AsyncRechargeAPI:
+    """asyncio counterpart of :class:`RechargeAPI`.
+
+    Token scopes have to be fetched over the network, so build instances with
+    ``api = await AsyncRechargeAPI.create(access_token)``.
+    """
+
+    def __init__(self, client: AsyncRechargeClient, scopes: list[RechargeScope]) -> None:
+        self.client = client
+        self.scopes = scopes
+        self.v1 = AsyncRechargeAPIv1(self.client, self.scopes)
+        self.v2 = AsyncRechargeAPIv2(self.client, self.scopes)
+
+    @classmethod
+    async def create(
+        cls,
+        access_token: str,
+        logger: Optional[logging.Logger] = None,
+        client: Optional[AsyncRechargeClient] = None,
+    ) -> "AsyncRechargeAPI":
+        client = client or AsyncRechargeClient(access_token, logger=logger)
+        token = aio_v1.AsyncTokenResource(client)
+        scopes: list[RechargeScope] = (await token.get()).scopes
+        return cls(client, scopes)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncRechargeAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+__all__ = [
+    "AsyncRechargeAPI",
+    "AsyncRechargeAPIv1",
+    "AsyncRechargeAPIv2",
+    "RechargeAPI",
+    "RechargeAPIv1",
+    "RechargeAPIv2",
+]
@@ -1,16 +1,37 @@
-from typing import Any, Mapping, Optional, Union
+import asyncio
+import copy
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 
-from recharge.client import RechargeClient
-from recharge.exceptions import RechargeAPIError
-from recharge.types import RechargeScope, RechargeVersion
+from recharge.checkpoint import CheckpointStore
+from recharge.client import AsyncRechargeClient, RechargeClient
+from recharge.exceptions import RechargeAPIError, RechargeHTTPError
+from recharge.loader import ids_query, index_by_id
+from recharge.model.base import M, load_list
+from recharge.pagination import MAX_PAGE_SIZE, Listing, Page, count_query
+from recharge.types import RechargeScope, RechargeVersion, ValidationMode
 
 # Re-exported so resource files can continue `from recharge.api import RechargeScope, RechargeVersion`
-__all__ = ["RechargeResource", "RechargeScope", "RechargeVersion"]
+__all__ = ["AsyncRechargeResource", "RechargeResource", "RechargeScope", "RechargeVersion"]
 
+R = TypeVar("R", bound="BaseRechargeResource")
 
-class RechargeResource:
+_VARIADIC = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
+class BaseRechargeResource:
     """
-    Base class for all Recharge API resources.
+    Base class for all Recharge API resources, sync and async.
 
     Subclasses must define:
       - object_list_key: str   (used in URLs and as list response key)
@@ -21,11 +42,17 @@ class RechargeResource:
     object_list_key: str
     object_dict_key: str
     recharge_version: RechargeVersion = "2021-11"
-    _abstract = False
+    validation: Optional[ValidationMode] = None
+    compact: Optional[bool] = None
+    checkpoint: Optional[CheckpointStore] = None
+    checkpoint_key: Optional[str] = None
+    # Whether the list query accepts ``ids``, so get_many can fetch a page of ids per request.
+    ids_filter = False
+    _abstract = True
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
-        if not getattr(cls, "_abstract", False):
+        if not cls.__dict__.get("_abstract", False):
             if not getattr(cls, "object_list_key", None):
                 raise TypeError(f"{cls.__name__} must define a non-empty object_list_key")
             if not getattr(cls, "object_dict_key", None):
@@ -33,7 +60,7 @@ class RechargeResource:
 
     def __init__(
         self,
-        client: RechargeClient,
+        client: Any,
         scopes: list[RechargeScope] = [],
     ) -> None:
         self._client = client
@@ -57,6 +84,71 @@ class RechargeResource:
             )
         self._allowed_endpoints.add(endpoint)
 
+    def with_validation(self: R, validation: ValidationMode) -> R:
+        """A copy of this resource that builds list results at another validation level.
+
+        ``"full"`` (the default) validates every record, ``"lazy"`` validates
+        nested objects on first access and ``"none"`` trusts the payload and
+        only constructs models. Overrides the client's ``validation`` setting.
+        """
+        resource = copy.copy(self)
+        resource.validation = validation
+        return resource
+
+    def with_compact(self: R, compact: bool = True) -> R:
+        """A copy of this resource that builds memory-compact list results.
+
+        Undeclared keys are dropped instead of kept as model extras, and
+        repeated strings (statuses, SKUs, currencies, ...) are shared between
+        records. Overrides the client's ``compact`` setting.
+        """
+        resource = copy.copy(self)
+        resource.compact = compact
+        return resource
+
+    def with_checkpoint(self: R, store: CheckpointStore, key: Optional[str] = None) -> R:
+        """A copy of this resource whose ``list_all`` saves its progress in ``store``.
+
+        Each page is saved under ``key`` (by default the listing's first-page
+        URL) as it arrives, so after a failure the same call on a resource
+        with the same store resumes after the last saved page.
+        """
+        resource = copy.copy(self)
+        resource.checkpoint = store
+        resource.checkpoint_key = key
+        return resource
+
+    def _validate_list(self, model: type[M], data: list) -> list[M]:
+        validation = self.validation or getattr(self._client, "validation", "full")
+        compact = self.compact
+        if compact is None:
+            compact = getattr(self._client, "compact", False)
+        return load_list(model, data, validation, compact)
+
+    def _check_get_many(self) -> None:
+        """Fail unless records can be fetched by id, via an ``ids`` list filter or ``get(id)``."""
+        if self.ids_filter:
+            return
+        get = getattr(self, "get", None)
+        parameters = inspect.signature(get).parameters.values() if get else ()
+        required = [p for p in parameters if p.default is p.empty and p.kind not in _VARIADIC]
+        if len(required) != 1:
+            raise RechargeAPIError(
+                f"{type(self).__name__} cannot fetch records by id: "
+                "its list query takes no ids and it has no get(id)"
+            )
+
+    @staticmethod
+    def _id_chunks(ids: list) -> list[list]:
+        return [ids[i : i + MAX_PAGE_SIZE] for i in range(0, len(ids), MAX_PAGE_SIZE)]
+
+    @staticmethod
+    def _in_order(ids: list, found: Mapping[str, Any]) -> dict:
+        return {id: found[str(id)] for id in ids if str(id) in found}
+
+    def _listing(self, url: str, query: Optional[Mapping[str, Any]] = None) -> Listing:
+        return Listing(url, query, self.object_list_key, self.recharge_version)
+
     def _get_response_key(self, expected: type[Union[dict, list]]) -> Optional[str]:
         if expected is dict:
             return self.object_dict_key
@@ -64,6 +156,20 @@ class RechargeResource:
             return self.object_list_key
         return None
 
+
+class RechargeResource(BaseRechargeResource):
+    """Base class for resources bound to a blocking :class:`RechargeClient`."""
+
+    _abstract = True
+    _client: RechargeClient
+
+    def __init__(
+        self,
+        client: RechargeClient,
+        scopes: list[RechargeScope] = [],
+    ) -> None:
+        super().__init__(client, scopes)
+
     def _http_get(
         self,
         url: str,
@@ -71,9 +177,10 @@ class RechargeResource:
         expected: type[Union[dict, list]] = dict,
         response_key: Optional[str] = None,
     ) -> Union[dict, list]:
-        self._client.set_version(self.recharge_version)
         key = response_key if response_key is not None else self._get_response_key(expected)
-        return self._client.get(url, query, key, expected)
+        return self._client.get(
+            url, query, key, expected, version=self.recharge_version
+        )
 
     def _paginate(
         self,
@@ -81,9 +188,93 @@ class RechargeResource:
         query: Optional[Mapping[str, Any]] = None,
         response_key: Optional[str] = None,
     ) -> list:
-        self._client.set_version(self.recharge_version)
         key = response_key if response_key is not None else self.object_list_key
-        return self._client.paginate(url, query, key)
+        return self._client.paginate(
+            url,
+            query,
+            key,
+            version=self.recharge_version,
+            checkpoint=self.checkpoint,
+            checkpoint_key=self.checkpoint_key,
+        )
+
+    def _paginate_counted(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        concurrency: int = 4,
+        response_key: Optional[str] = None,
+    ) -> list:
+        data = self._client.get(
+            f"{url}/count", count_query(query), version=self.recharge_version
+        )
+        total = data.get("count") if isinstance(data, dict) else None
+        if not isinstance(total, int):
+            raise RechargeAPIError(f"Expected 'count' key in response, got {data}")
+        key = response_key if response_key is not None else self.object_list_key
+        return self._client.paginate_counted(
+            url,
+            total,
+            query,
+            key,
+            version=self.recharge_version,
+            max_workers=concurrency,
+        )
+
+    def _iter_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+    ) -> Iterator[list]:
+        key = response_key if response_key is not None else self.object_list_key
+        return self._client.iter_pages(url, query, key, version=self.recharge_version)
+
+    def _walk_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+    ) -> Iterator[Page]:
+        key = response_key if response_key is not None else self.object_list_key
+        return self._client.walk_pages(url, query, key, version=self.recharge_version)
+
+    def _iter_listing(self, listing: Listing) -> Iterator[list]:
+        return self._client.iter_pages(
+            listing.url, listing.query, listing.response_key, version=listing.version
+        )
+
+    def get_many(self, ids: Iterable[Any], concurrency: int = 4) -> dict:
+        """Fetch many records by id, keyed by id in input order.
+
+        Resources whose list query takes ``ids`` fetch them ``MAX_PAGE_SIZE``
+        at a time with ``list_``; others call ``get`` per id. Up to
+        ``concurrency`` requests run at once. Ids that do not exist are left
+        out of the result. Resources with neither (events, the store, token
+        information, ...) raise ``RechargeAPIError``.
+        """
+        self._check_get_many()
+        ids = list(dict.fromkeys(ids))
+        found: dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            if self.ids_filter:
+                list_ = getattr(self, "list_")
+                chunks = self._id_chunks(ids)
+                for records in pool.map(lambda chunk: list_(ids_query(chunk)), chunks):
+                    found.update(index_by_id(records))
+            else:
+                for id, record in zip(ids, pool.map(self._get_or_none, ids)):
+                    if record is not None:
+                        found[str(id)] = record
+        return self._in_order(ids, found)
+
+    def _get_or_none(self, id: Any) -> Any:
+        try:
+            return getattr(self, "get")(id)
+        except RechargeHTTPError as exc:
+            if exc.status_code == 404:
+                return None
+            raise
 
     def _http_post(
         self,
@@ -93,9 +284,10 @@ class RechargeResource:
         expected: type[Union[dict, list]] = dict,
         response_key: Optional[str] = None,
     ) -> Union[dict, list]:
-        self._client.set_version(self.recharge_version)
         key = response_key if response_key is not None else self._get_response_key(expected)
-        return self._client.post(url, body, query, key, expected)
+        return self._client.post(
+            url, body, query, key, expected, version=self.recharge_version
+        )
 
     def _http_put(
         self,
@@ -105,9 +297,10 @@ class RechargeResource:
         expected: type[Union[dict, list]] = dict,
         response_key: Optional[str] = None,
     ) -> Union[dict, list]:
-        self._client.set_version(self.recharge_version)
         key = response_key if response_key is not None else self._get_response_key(expected)
-        return self._client.put(url, body, query, key, expected)
+        return self._client.put(
+            url, body, query, key, expected, version=self.recharge_version
+        )
 
     def _http_delete(
         self,
@@ -116,6 +309,158 @@ class RechargeResource:
         expected: type[Union[dict, list]] = dict,
         response_key: Optional[str] = None,
     ) -> Union[dict, list]:
-        self._client.set_version(self.recharge_version)
         key = response_key if response_key is not None else self._get_response_key(expected)
-        return self._client.delete(url, body, key, expected)
+        return self._client.delete(
+            url, body, key, expected, version=self.recharge_version
+        )
+
+
+class AsyncRechargeResource(BaseRechargeResource):
+    """Base class for resources bound to an :class:`AsyncRechargeClient`."""
+
+    _abstract = True
+    _client: AsyncRechargeClient
+
+    def __init__(
+        self,
+        client: AsyncRechargeClient,
+        scopes: list[RechargeScope] = [],
+    ) -> None:
+        super().__init__(client, scopes)
+
+    async def _http_get(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        expected: type[Union[dict, list]] = dict,
+        response_key: Optional[str] = None,
+    ) -> Union[dict, list]:
+        key = response_key if response_key is not None else self._get_response_key(expected)
+        return await self._client.get(
+            url, query, key, expected, version=self.recharge_version
+        )
+
+    async def _paginate(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+    ) -> list:
+        key = response_key if response_key is not None else self.object_list_key
+        return await self._client.paginate(
+            url,
+            query,
+            key,
+            version=self.recharge_version,
+            checkpoint=self.checkpoint,
+            checkpoint_key=self.checkpoint_key,
+        )
+
+    async def _paginate_counted(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        concurrency: int = 4,
+        response_key: Optional[str] = None,
+    ) -> list:
+        data = await self._client.get(
+            f"{url}/count", count_query(query), version=self.recharge_version
+        )
+        total = data.get("count") if isinstance(data, dict) else None
+        if not isinstance(total, int):
+            raise RechargeAPIError(f"Expected 'count' key in response, got {data}")
+        key = response_key if response_key is not None else self.object_list_key
+        return await self._client.paginate_counted(
+            url,
+            total,
+            query,
+            key,
+            version=self.recharge_version,
+            max_workers=concurrency,
+        )
+
+    def _iter_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+    ) -> AsyncIterator[list]:
+        key = response_key if response_key is not None else self.object_list_key
+        return self._client.iter_pages(url, query, key, version=self.recharge_version)
+
+    def _walk_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+    ) -> AsyncIterator[Page]:
+        key = response_key if response_key is not None else self.object_list_key
+        return self._client.walk_pages(url, query, key, version=self.recharge_version)
+
+    def _iter_listing(self, listing: Listing) -> AsyncIterator[list]:
+        return self._client.iter_pages(
+            listing.url, listing.query, listing.response_key, version=listing.version
+        )
+
+    async def get_many(self, ids: Iterable[Any], concurrency: int = 4) -> dict:
+        """Async counterpart of :meth:`RechargeResource.get_many`."""
+        self._check_get_many()
+        ids = list(dict.fromkeys(ids))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        found: dict[str, Any] = {}
+
+        async def fetch_chunk(chunk: list) -> None:
+            async with semaphore:
+                found.update(index_by_id(await getattr(self, "list_")(ids_query(chunk))))
+
+        async def fetch_one(id: Any) -> None:
+            async with semaphore:
+                try:
+                    found[str(id)] = await getattr(self, "get")(id)
+                except RechargeHTTPError as exc:
+                    if exc.status_code != 404:
+                        raise
+
+        if self.ids_filter:
+            await asyncio.gather(*(fetch_chunk(chunk) for chunk in self._id_chunks(ids)))
+        else:
+            await asyncio.gather(*(fetch_one(id) for id in ids))
+        return self._in_order(ids, found)
+
+    async def _http_post(
+        self,
+        url: str,
+        body: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        expected: type[Union[dict, list]] = dict,
+        response_key: Optional[str] = None,
+    ) -> Union[dict, list]:
+        key = response_key if response_key is not None else self._get_response_key(expected)
+        return await self._client.post(
+            url, body, query, key, expected, version=self.recharge_version
+        )
+
+    async def _http_put(
+        self,
+        url: str,
+        body: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        expected: type[Union[dict, list]] = dict,
+        response_key: Optional[str] = None,
+    ) -> Union[dict, list]:
+        key = response_key if response_key is not None else self._get_response_key(expected)
+        return await self._client.put(
+            url, body, query, key, expected, version=self.recharge_version
+        )
+
+    async def _http_delete(
+        self,
+        url: str,
+        body: Optional[Mapping[str, Any]] = None,
+        expected: type[Union[dict, list]] = dict,
+        response_key: Optional[str] = None,
+    ) -> Union[dict, list]:
+        key = response_key if response_key is not None else self._get_response_key(expected)
+        return await self._client.delete(
+            url, body, key, expected, version=self.recharge_version
+        )
@@ -0,0 +1,2 @@
+# Generated by scripts/generate_async.py from recharge/api.
+# Do not edit by hand: change the sync resource and re-run the script.
@@ -0,0 +1,36 @@
+# Generated by scripts/generate_async.py from recharge/api/v1.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from .addresses import AsyncAddressResource
+from .async_batches import AsyncAsyncBatchResource
+from .charges import AsyncChargeResource
+from .checkouts import AsyncCheckoutResource
+from .customers import AsyncCustomerResource
+from .discounts import AsyncDiscountResource
+from .metafields import AsyncMetafieldResource
+from .notifications import AsyncNotificationResource
+from .onetimes import AsyncOnetimeResource
+from .orders import AsyncOrderResource
+from .products import AsyncProductResource
+from .shop import AsyncShopResource
+from .subscriptions import AsyncSubscriptionResource
+from .tokens import AsyncTokenResource
+from .webhooks import AsyncWebhookResource
+
+__all__ = [
+    "AsyncAddressResource",
+    "AsyncAsyncBatchResource",
+    "AsyncChargeResource",
+    "AsyncCheckoutResource",
+    "AsyncCustomerResource",
+    "AsyncDiscountResource",
+    "AsyncMetafieldResource",
+    "AsyncNotificationResource",
+    "AsyncOnetimeResource",
+    "AsyncOrderResource",
+    "AsyncProductResource",
+    "AsyncShopResource",
+    "AsyncSubscriptionResource",
+    "AsyncTokenResource",
+    "AsyncWebhookResource",
+]
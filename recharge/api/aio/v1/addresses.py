@@ -0,0 +1,213 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/addresses.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.addresses import (
+    AddressApplyDiscountBody,
+    AddressCountQuery,
+    AddressCreateBody,
+    AddressListQuery,
+    AddressUpdateBody,
+    AddressValidateBody,
+    AddressValidateResponse,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.address import Address
+from recharge.pagination import Listing
+
+
+class AsyncAddressResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/addresses
+    """
+
+    object_list_key = "addresses"
+    object_dict_key = "address"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def create(self, customer_id: str, body: AddressCreateBody) -> Address:
+        """Create an address for the customer.
+        https://developer.rechargepayments.com/2021-01/addresses/create_address
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(
+            f"POST /customers/:customer_id/{self.object_list_key}", required_scopes
+        )
+
+        url = f"{self.base_url}/customers/{customer_id}/{self.object_list_key}"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def get(self, address_id: str) -> Address:
+        """Get an address by ID.
+        https://developer.rechargepayments.com/2021-01/addresses/retrieve_address
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}/:address_id", required_scopes)
+
+        url = f"{self._url}/{address_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def update(
+        self, address_id: str, body: Optional[AddressUpdateBody] = None
+    ) -> Address:
+        """Update an address by ID.
+        https://developer.rechargepayments.com/2021-01/addresses/update_address
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:id", required_scopes)
+
+        url = f"{self._url}/{address_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def delete(self, address_id: str) -> dict:
+        """Delete an address by ID.
+        https://developer.rechargepayments.com/2021-01/addresses/delete_address
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:address_id", required_scopes
+        )
+
+        url = f"{self._url}/{address_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> list[Address]:
+        """List addresses for a customer.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(
+            f"GET /customers/:customer_id/{self.object_list_key}", required_scopes
+        )
+
+        url = f"{self.base_url}/customers/{customer_id}/{self.object_list_key}"
+        data = await self._http_get(url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Address, data)
+
+    async def list_all(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> list[Address]:
+        """List all addresses for a customer.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(
+            f"GET /customers/:customer_id/{self.object_list_key}", required_scopes
+        )
+
+        url = f"{self.base_url}/customers/{customer_id}/{self.object_list_key}"
+        data = await self._paginate(url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Address, data)
+
+    def listing(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(
+            f"GET /customers/:customer_id/{self.object_list_key}", required_scopes
+        )
+
+        url = f"{self.base_url}/customers/{customer_id}/{self.object_list_key}"
+        return self._listing(url, query)
+
+    async def iter_pages(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> AsyncIterator[list[Address]]:
+        """Iterate over pages of addresses for a customer.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        async for page in self._iter_listing(self.listing(customer_id, query)):
+            yield self._validate_list(Address, page)
+
+    async def iter_all(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> AsyncIterator[Address]:
+        """Iterate over all addresses for a customer, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        async for page in self.iter_pages(customer_id, query):
+            for item in page:
+                yield item
+
+    async def count(self, query: Optional[AddressCountQuery] = None) -> int:
+        """Retrieve the count of addresses.
+        https://developer.rechargepayments.com/2021-01/addresses/count_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}/count", required_scopes)
+
+        url = f"{self._url}/count"
+        data = await self._http_get(url, query)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        if "count" not in data:
+            raise RechargeAPIError(f"Expected key 'count' in response, got {data}")
+        return data["count"]
+
+    async def validate(self, body: AddressValidateBody) -> AddressValidateResponse:
+        """Validate an address.
+        https://developer.rechargepayments.com/2021-01/addresses/validate_address
+        """
+
+        url = f"{self._url}/validate_address"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def apply_discount(
+        self,
+        address_id: str,
+        body: AddressApplyDiscountBody,
+    ) -> Address:
+        """Apply a discount code to an address.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_apply_address
+        """
+        required_scopes: list[RechargeScope] = ["write_discounts"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:address_id/apply_discount", required_scopes
+        )
+
+        url = f"{self._url}/{address_id}/apply_discount"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def remove_discount(self, address_id: str) -> Address:
+        """Remove a discount from an address.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_remove_from_address_or_charge
+        """
+        required_scopes: list[RechargeScope] = ["write_discounts"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:address_id/remove_discount", required_scopes
+        )
+
+        url = f"{self._url}/{address_id}/remove_discount"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
@@ -0,0 +1,145 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/async_batches.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.async_batches import AsyncBatchCreateBody, AsyncBatchCreateTaskBody
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.async_batch import AsyncBatch, AsyncBatchTask
+from recharge.pagination import Listing
+
+
+class AsyncAsyncBatchResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+    """
+
+    object_list_key = "async_batches"
+    object_dict_key = "async_batch"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def create(self, body: AsyncBatchCreateBody) -> AsyncBatch:
+        """Create an async batch.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["write_batches"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return AsyncBatch.model_validate(data)
+
+    async def create_task(self, batch_id: str, body: AsyncBatchCreateTaskBody) -> int:
+        """Create a task for an async batch.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["write_batches"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:batch_id/tasks", required_scopes
+        )
+
+        url = f"{self._url}/{batch_id}/tasks"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        if "count" not in data:
+            raise RechargeAPIError(f"Expected 'count' key in list, got {data}")
+        return data["count"]
+
+    async def get(self, batch_id: str) -> AsyncBatch:
+        """Get an async batch.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(f"GET /{self.object_list_key}/:batch_id", required_scopes)
+
+        url = f"{self._url}/{batch_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return AsyncBatch.model_validate(data)
+
+    async def list_(self) -> list[AsyncBatch]:
+        """List async batches.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(AsyncBatch, data)
+
+    async def list_all(self) -> list[AsyncBatch]:
+        """List all async batches.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        url = f"{self._url}/all"
+        data = await self._paginate(url)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(AsyncBatch, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        url = f"{self._url}/all"
+        return self._listing(url)
+
+    async def iter_pages(self) -> AsyncIterator[list[AsyncBatch]]:
+        """Iterate over pages of async batches.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        async for page in self._iter_listing(self.listing()):
+            yield self._validate_list(AsyncBatch, page)
+
+    async def iter_all(self) -> AsyncIterator[AsyncBatch]:
+        """Iterate over all async batches, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        async for page in self.iter_pages():
+            for item in page:
+                yield item
+
+    async def list_tasks(
+        self,
+        batch_id: str,
+    ) -> list[AsyncBatchTask]:
+        """List tasks for an async batch.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:batch_id/tasks", required_scopes
+        )
+
+        url = f"{self._url}/{batch_id}/tasks"
+        data = await self._http_get(url, expected=list, response_key="async_batch_tasks")
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(AsyncBatchTask, data)
+
+    async def process(self, batch_id: str) -> AsyncBatch:
+        """Process an async batch.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["write_batches"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:batch_id/process", required_scopes
+        )
+
+        url = f"{self._url}/{batch_id}/process"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return AsyncBatch.model_validate(data)
@@ -0,0 +1,90 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/checkouts.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.checkouts import (
+    CheckoutCreateBody,
+    CheckoutProcessBody,
+    CheckoutUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
+from recharge.model.v1.checkout import Checkout, CheckoutCharge, CheckoutShippingRate
+
+
+class AsyncCheckoutResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/checkouts
+    """
+
+    object_list_key = "checkouts"
+    object_dict_key = "checkout"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def create(self, body: CheckoutCreateBody) -> Checkout:
+        """Create a new checkout.
+        https://developer.rechargepayments.com/2021-01/checkouts/checkout_create
+        """
+        required_scopes: list[RechargeScope] = ["write_checkouts"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Checkout.model_validate(data)
+
+    async def get(self, checkout_id: str) -> Checkout:
+        """Get a checkout by ID.
+        https://developer.rechargepayments.com/2021-01/checkouts/checkout_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_checkouts"]
+        self._check_scopes(f"GET /{self.object_list_key}/:checkout_id", required_scopes)
+
+        url = f"{self._url}/{checkout_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Checkout.model_validate(data)
+
+    async def update(self, checkout_id: str, body: CheckoutUpdateBody) -> Checkout:
+        """Update a checkout.
+        https://developer.rechargepayments.com/2021-01/checkouts/checkout_update
+        """
+        required_scopes: list[RechargeScope] = ["write_checkouts"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:checkout_id", required_scopes)
+
+        url = f"{self._url}/{checkout_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Checkout.model_validate(data)
+
+    async def get_shipping(self, checkout_id: str) -> list[CheckoutShippingRate]:
+        """Retrieve shipping rates for a checkout
+        https://developer.rechargepayments.com/2021-01/checkouts/checkout_retrieve_shipping_address
+        """
+        required_scopes: list[RechargeScope] = ["read_checkouts"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:checkout_id/shipping_rates", required_scopes
+        )
+
+        url = f"{self._url}/{checkout_id}/shipping_rates"
+        data = await self._http_get(url, expected=list, response_key="shipping_rates")
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(CheckoutShippingRate, data)
+
+    async def process(self, checkout_id: str, body: CheckoutProcessBody) -> CheckoutCharge:
+        """Process (charge) a checkout.
+        https://developer.rechargepayments.com/2021-01/checkout/checkout_process
+        """
+        required_scopes: list[RechargeScope] = ["write_checkouts"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:checkout_id/charge", required_scopes
+        )
+
+        url = f"{self._url}/{checkout_id}/charge"
+        data = await self._http_post(url, body, response_key="checkout_charge")
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return CheckoutCharge.model_validate(data)
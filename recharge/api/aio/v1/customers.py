@@ -0,0 +1,152 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/customers.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.customers import (
+    CustomerCountQuery,
+    CustomerCreateBody,
+    CustomerListQuery,
+    CustomerUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.customer import Customer
+from recharge.pagination import Listing
+
+
+class AsyncCustomerResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/customers
+    """
+
+    object_list_key = "customers"
+    object_dict_key = "customer"
+    recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
+
+    async def create(self, body: CustomerCreateBody) -> Customer:
+        """Create a customer.
+        https://developer.rechargepayments.com/2021-01/customers/customers_create
+        """
+        required_scopes: list[RechargeScope] = ["write_customers", "write_payments"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Customer.model_validate(data)
+
+    async def get(self, customer_id: str) -> Customer:
+        """Get a customer by ID.
+        https://developer.rechargepayments.com/2021-01/customers/customers_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}/:customer_id", required_scopes)
+
+        url = f"{self._url}/{customer_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Customer.model_validate(data)
+
+    async def update(self, customer_id: str, body: CustomerUpdateBody) -> Customer:
+        """Update a customer.
+        https://developer.rechargepayments.com/2021-01/customers/customers_update
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:customer_id", required_scopes)
+
+        url = f"{self._url}/{customer_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Customer.model_validate(data)
+
+    async def delete(self, customer_id: str) -> dict:
+        """Delete a customer.
+        https://developer.rechargepayments.com/2021-01/customers/customers_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:customer_id", required_scopes
+        )
+
+        url = f"{self._url}/{customer_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[CustomerListQuery] = None) -> list[Customer]:
+        """List customers.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Customer, data)
+
+    async def list_all(
+        self,
+        query: Optional[CustomerListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Customer]:
+        """List all customers.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        if concurrency:
+            data = await self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Customer, data)
+
+    def listing(self, query: Optional[CustomerListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[CustomerListQuery] = None
+    ) -> AsyncIterator[list[Customer]]:
+        """Iterate over pages of customers.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Customer, page)
+
+    async def iter_all(self, query: Optional[CustomerListQuery] = None) -> AsyncIterator[Customer]:
+        """Iterate over all customers, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def count(self, query: Optional[CustomerCountQuery] = None) -> int:
+        """Retrieve a count of customers.
+        https://developer.rechargepayments.com/2021-01/customers/customers_count
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}/count", required_scopes)
+
+        url = f"{self._url}/count"
+        data = await self._http_get(url, query)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        if "count" not in data:
+            raise RechargeAPIError(f"Expected key 'count' in response, got {data}")
+        return data["count"]
@@ -0,0 +1,152 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/discounts.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.discounts import (
+    DiscountCountQuery,
+    DiscountCreateBody,
+    DiscountListQuery,
+    DiscountUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.discount import Discount
+from recharge.pagination import Listing
+
+
+class AsyncDiscountResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/discounts
+    """
+
+    object_list_key = "discounts"
+    object_dict_key = "discount"
+    recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
+
+    async def create(self, body: DiscountCreateBody) -> Discount:
+        """Create a discount.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_create
+        """
+        required_scopes: list[RechargeScope] = ["write_discounts"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Discount.model_validate(data)
+
+    async def get(self, discount_id: str) -> Discount:
+        """Get a discount by ID.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}/:discount_id", required_scopes)
+
+        url = f"{self._url}/{discount_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Discount.model_validate(data)
+
+    async def update(self, discount_id: str, body: DiscountUpdateBody) -> Discount:
+        """Update a discount.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_update
+        """
+        required_scopes: list[RechargeScope] = ["write_discounts"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:discount_id", required_scopes)
+
+        url = f"{self._url}/{discount_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Discount.model_validate(data)
+
+    async def delete(self, discount_id: str) -> dict:
+        """Delete a discount.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_discounts"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:discount_id", required_scopes
+        )
+
+        url = f"{self._url}/{discount_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[DiscountListQuery] = None) -> list[Discount]:
+        """List discounts.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Discount, data)
+
+    async def list_all(
+        self,
+        query: Optional[DiscountListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Discount]:
+        """List all discounts.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        if concurrency:
+            data = await self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Discount, data)
+
+    def listing(self, query: Optional[DiscountListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[DiscountListQuery] = None
+    ) -> AsyncIterator[list[Discount]]:
+        """Iterate over pages of discounts.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Discount, page)
+
+    async def iter_all(self, query: Optional[DiscountListQuery] = None) -> AsyncIterator[Discount]:
+        """Iterate over all discounts, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def count(self, query: Optional[DiscountCountQuery] = None) -> int:
+        """Receive a count of all discounts.
+        https://developer.rechargepayments.com/v1#count-discounts
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}/count", required_scopes)
+
+        url = f"{self._url}/count"
+        data = await self._http_get(url, query)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        if "count" not in data:
+            raise RechargeAPIError(f"Expected 'count' in response, got {data}")
+        return data["count"]
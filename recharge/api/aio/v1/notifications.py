@@ -0,0 +1,32 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/notifications.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.notifications import NotificationSendEmailBody
+from recharge.exceptions import RechargeAPIError
+
+
+class AsyncNotificationResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/notifications
+    """
+
+    object_list_key = "notifications"
+    object_dict_key = "notification"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def send_email(self, customer_id, body: NotificationSendEmailBody):
+        """
+        Send an email notification to a customer.
+        https://developer.rechargepayments.com/2021-01/notifications/notifications_get_account_access
+        """
+        required_scopes: list[RechargeScope] = ["write_notifications"]
+        self._check_scopes(
+            f"POST /customers/:customer_id/{self.object_list_key}", required_scopes
+        )
+
+        url = f"{self.base_url}/customers/{customer_id}/{self.object_list_key}"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
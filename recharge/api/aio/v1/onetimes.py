@@ -0,0 +1,127 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/onetimes.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.onetimes import (
+    OnetimeCreateBody,
+    OnetimeListQuery,
+    OnetimeUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.onetime import Onetime
+from recharge.pagination import Listing
+
+
+class AsyncOnetimeResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/onetimes
+    """
+
+    object_list_key = "onetimes"
+    object_dict_key = "onetime"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def create(self, body: OnetimeCreateBody) -> Onetime:
+        """Create a Onetime
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_create
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Onetime.model_validate(data)
+
+    async def get(self, onetime_id: str) -> Onetime:
+        """Get a Onetime
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}/:onetime_id", required_scopes)
+
+        url = f"{self._url}/{onetime_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Onetime.model_validate(data)
+
+    async def update(self, onetime_id: str, body: OnetimeUpdateBody) -> Onetime:
+        """Update a Onetime
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_update
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:onetime_id", required_scopes)
+
+        url = f"{self._url}/{onetime_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Onetime.model_validate(data)
+
+    async def delete(self, onetime_id: str) -> dict:
+        """Delete a Onetime.
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:onetime_id", required_scopes
+        )
+
+        url = f"{self._url}/{onetime_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[OnetimeListQuery] = None) -> list[Onetime]:
+        """List Onetimes.
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Onetime, data)
+
+    async def list_all(self, query: Optional[OnetimeListQuery] = None) -> list[Onetime]:
+        """List all Onetimes.
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Onetime, data)
+
+    def listing(self, query: Optional[OnetimeListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[OnetimeListQuery] = None
+    ) -> AsyncIterator[list[Onetime]]:
+        """Iterate over pages of Onetimes.
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Onetime, page)
+
+    async def iter_all(self, query: Optional[OnetimeListQuery] = None) -> AsyncIterator[Onetime]:
+        """Iterate over all Onetimes, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/onetimes/onetimes_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
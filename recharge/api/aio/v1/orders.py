@@ -0,0 +1,204 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/orders.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.orders import (
+    OrderChangeDateBody,
+    OrderChangeVariantBody,
+    OrderCloneBody,
+    OrderCountQuery,
+    OrderListQuery,
+    OrderUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.order import Order
+from recharge.pagination import Listing
+
+
+class AsyncOrderResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/orders
+    """
+
+    object_list_key = "orders"
+    object_dict_key = "order"
+    recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
+
+    async def get(self, order_id: str) -> Order:
+        """Get an order.
+        https://developer.rechargepayments.com/2021-01/orders/orders_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}/:order_id", required_scopes)
+
+        url = f"{self._url}/{order_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Order.model_validate(data)
+
+    async def update(self, order_id: str, body: OrderUpdateBody) -> Order:
+        """Update an order.
+        https://developer.rechargepayments.com/2021-01/orders/orders_update
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:order_id", required_scopes)
+
+        url = f"{self._url}/{order_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Order.model_validate(data)
+
+    async def delete(self, order_id: str) -> dict:
+        """Delete an order.
+        https://developer.rechargepayments.com/2021-01/orders/orders_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(f"DELETE /{self.object_list_key}/:order_id", required_scopes)
+
+        url = f"{self._url}/{order_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[OrderListQuery] = None) -> list[Order]:
+        """List orders.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Order, data)
+
+    async def list_all(
+        self,
+        query: Optional[OrderListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Order]:
+        """List all orders.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        if concurrency:
+            data = await self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Order, data)
+
+    def listing(self, query: Optional[OrderListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[OrderListQuery] = None
+    ) -> AsyncIterator[list[Order]]:
+        """Iterate over pages of orders.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Order, page)
+
+    async def iter_all(self, query: Optional[OrderListQuery] = None) -> AsyncIterator[Order]:
+        """Iterate over all orders, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def count(self, query: Optional[OrderCountQuery] = None) -> int:
+        """Count orders.
+        https://developer.rechargepayments.com/2021-01/orders/orders_count
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}/count", required_scopes)
+
+        url = f"{self._url}/count"
+        data = await self._http_get(url, query)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        if "count" not in data:
+            raise RechargeAPIError(f"Expected 'count' in response, got {data}")
+        return data["count"]
+
+    async def change_date(self, order_id: str, body: OrderChangeDateBody) -> Order:
+        """Change the date of a queued order.
+        https://developer.rechargepayments.com/2021-01/orders/orders_change_date
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:order_id/change_date", required_scopes
+        )
+
+        url = f"{self._url}/{order_id}/change_date"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Order.model_validate(data)
+
+    async def change_variant(
+        self, order_id: str, old_variant_id: str, body: OrderChangeVariantBody
+    ) -> Order:
+        """Change an order variant.
+        https://developer.rechargepayments.com/v1#change-an-order-variant
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:order_id/update_shopify_variant/:old_variant_id",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{order_id}/update_shopify_variant/{old_variant_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Order.model_validate(data)
+
+    async def clone(self, order_id: str, charge_id: str, body: OrderCloneBody) -> Order:
+        """Clone an order.
+        https://developer.rechargepayments.com/2021-01/orders/orders_clone
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/clone_order_on_success_charge/:order_id/charge/:charge_id",
+            required_scopes,
+        )
+
+        url = f"{self._url}/clone_order_on_success_charge/{order_id}/charge/{charge_id}"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Order.model_validate(data)
+
+    async def delay(self, order_id: str) -> Order:
+        """Delay an order.
+        https://developer.rechargepayments.com/2021-01/orders/orders_delay
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:order_id/delay", required_scopes
+        )
+
+        url = f"{self._url}/{order_id}/delay"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Order.model_validate(data)
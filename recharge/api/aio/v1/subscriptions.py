@@ -0,0 +1,277 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/subscriptions.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.subscriptions import (
+    SubscriptionBulkCreateBody,
+    SubscriptionBulkDeleteBody,
+    SubscriptionBulkUpdateBody,
+    SubscriptionCancelBody,
+    SubscriptionChangeAddressBody,
+    SubscriptionChangeDateBody,
+    SubscriptionCountQuery,
+    SubscriptionCreateBody,
+    SubscriptionDeleteBody,
+    SubscriptionListQuery,
+    SubscriptionUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
+from recharge.model.v1.subscription import Subscription
+from recharge.pagination import Listing
+
+
+class AsyncSubscriptionResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/subscriptions
+    """
+
+    object_list_key = "subscriptions"
+    object_dict_key = "subscription"
+    recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
+
+    async def create(self, body: SubscriptionCreateBody) -> Subscription:
+        """Create a subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_create
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def get(self, subscription_id: str) -> Subscription:
+        """Get a subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:subscription_id", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def update(
+        self, subscription_id: str, body: SubscriptionUpdateBody
+    ) -> Subscription:
+        """Update a subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_update
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:subscription_id", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def delete(self, subscription_id: str, body: SubscriptionDeleteBody) -> dict:
+        """Delete a subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:subscription_id", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}"
+        data = await self._http_delete(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> list[Subscription]:
+        """List subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Subscription, data)
+
+    async def list_all(
+        self,
+        query: Optional[SubscriptionListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Subscription]:
+        """List all subscriptions.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        if concurrency:
+            data = await self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Subscription, data)
+
+    def listing(self, query: Optional[SubscriptionListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> AsyncIterator[list[Subscription]]:
+        """Iterate over pages of subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Subscription, page)
+
+    async def iter_all(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> AsyncIterator[Subscription]:
+        """Iterate over all subscriptions, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def count(self, query: Optional[SubscriptionCountQuery] = None) -> int:
+        """Count subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_count
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}/count", required_scopes)
+
+        url = f"{self._url}/count"
+        data = await self._http_get(url, query)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        if "count" not in data:
+            raise RechargeAPIError(f"Expected 'count' in dict, got {data}")
+        return data["count"]
+
+    async def change_date(
+        self, subscription_id: str, body: SubscriptionChangeDateBody
+    ) -> Subscription:
+        """Change the date of a queued subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_change_date
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/set_next_charge_date",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{subscription_id}/change_date"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def change_address(
+        self, subscription_id: str, body: SubscriptionChangeAddressBody
+    ) -> Subscription:
+        """Change the address of a subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_change_address
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/change_address",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{subscription_id}/change_address"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def cancel(
+        self, subscription_id: str, body: SubscriptionCancelBody
+    ) -> Subscription:
+        """Cancel a subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_cancel
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/cancel", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}/cancel"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def activate(self, subscription_id: str):
+        """Activate a cancelled subscription.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_activate
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/activate", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}/activate"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def bulk_create(self, body: SubscriptionBulkCreateBody) -> list[Subscription]:
+        """Bulk create subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_bulk_create
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}/bulk_create", required_scopes)
+
+        url = f"{self._url}/bulk_create"
+        data = await self._http_post(url, body, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(Subscription, data)
+
+    async def bulk_update(self, body: SubscriptionBulkUpdateBody) -> list[Subscription]:
+        """Bulk update subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_bulk_update
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}/bulk_update", required_scopes)
+
+        url = f"{self._url}/bulk_update"
+        data = await self._http_post(url, body, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(Subscription, data)
+
+    async def bulk_delete(self, body: SubscriptionBulkDeleteBody) -> list[Subscription]:
+        """Bulk delete subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_bulk_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}/bulk_delete", required_scopes)
+
+        url = f"{self._url}/bulk_delete"
+        data = await self._http_post(url, body, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(Subscription, data)
@@ -0,0 +1,25 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/tokens.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from recharge.api import AsyncRechargeResource, RechargeVersion
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.token import TokenInformation
+
+
+class AsyncTokenResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/token_information/token_information_object
+    """
+
+    object_list_key = "token_information"
+    object_dict_key = "token_information"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def get(self) -> TokenInformation:
+        """Get token information.
+        https://developer.rechargepayments.com/2021-01/token_information/token_information_retrieve
+        """
+        data = await self._http_get(self._url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return TokenInformation.model_validate(data)
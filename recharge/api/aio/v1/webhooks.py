@@ -0,0 +1,112 @@
+# Generated by scripts/generate_async.py from recharge/api/v1/webhooks.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v1.webhooks import WebhookCreateBody, WebhookUpdateBody
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v1.webhook import Webhook, WebhookTopicMap
+from recharge.pagination import Listing
+
+
+class AsyncWebhookResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_object
+    """
+
+    object_list_key = "webhooks"
+    object_dict_key = "webhook"
+    recharge_version: RechargeVersion = "2021-01"
+
+    async def create(self, body: WebhookCreateBody) -> Webhook:
+        """Create a webhook.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_create
+        """
+        resource = body["topic"].split("/")[0]
+        required_scopes: list[RechargeScope] = [WebhookTopicMap[resource]]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Webhook.model_validate(data)
+
+    async def get(self, webhook_id: str) -> Webhook:
+        """Get a webhook.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_retrieve
+        """
+        url = f"{self._url}/{webhook_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Webhook.model_validate(data)
+
+    async def update(self, webhook_id: str, body: WebhookUpdateBody) -> Webhook:
+        """Update a webhook.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_update
+        """
+        url = f"{self._url}/{webhook_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Webhook.model_validate(data)
+
+    async def delete(self, webhook_id: str) -> dict:
+        """Delete a webhook.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_delete
+        """
+        url = f"{self._url}/{webhook_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self) -> list[Webhook]:
+        """List webhooks.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        data = await self._http_get(self._url, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Webhook, data)
+
+    async def list_all(self) -> list[Webhook]:
+        """List all webhooks.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        data = await self._paginate(self._url)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Webhook, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        return self._listing(self._url)
+
+    async def iter_pages(self) -> AsyncIterator[list[Webhook]]:
+        """Iterate over pages of webhooks.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        async for page in self._iter_listing(self.listing()):
+            yield self._validate_list(Webhook, page)
+
+    async def iter_all(self) -> AsyncIterator[Webhook]:
+        """Iterate over all webhooks, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        async for page in self.iter_pages():
+            for item in page:
+                yield item
+
+    async def test(self, webhook_id: str) -> dict:
+        """Test a webhook.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_test
+        """
+        url = f"{self._url}/{webhook_id}/test"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
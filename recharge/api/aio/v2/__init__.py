@@ -0,0 +1,50 @@
+# Generated by scripts/generate_async.py from recharge/api/v2.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from .accounts import AsyncAccountResource
+from .addresses import AsyncAddressResource
+from .async_batches import AsyncAsyncBatchResource
+from .bundle_selections import AsyncBundleSelectionResource
+from .charges import AsyncChargeResource
+from .checkouts import AsyncCheckoutResource
+from .collections import AsyncCollectionResource
+from .customers import AsyncCustomerResource
+from .discounts import AsyncDiscountResource
+from .events import AsyncEventResource
+from .metafields import AsyncMetafieldResource
+from .notifications import AsyncNotificationResource
+from .onetimes import AsyncOnetimeResource
+from .orders import AsyncOrderResource
+from .payment_methods import AsyncPaymentMethodResource
+from .plans import AsyncPlanResource
+from .products import AsyncProductResource
+from .retention_strategies import AsyncRetentionStrategyResource
+from .store import AsyncStoreResource
+from .subscriptions import AsyncSubscriptionResource
+from .tokens import AsyncTokenResource
+from .webhooks import AsyncWebhookResource
+
+__all__ = [
+    "AsyncAccountResource",
+    "AsyncAddressResource",
+    "AsyncAsyncBatchResource",
+    "AsyncBundleSelectionResource",
+    "AsyncChargeResource",
+    "AsyncCheckoutResource",
+    "AsyncCollectionResource",
+    "AsyncCustomerResource",
+    "AsyncDiscountResource",
+    "AsyncEventResource",
+    "AsyncMetafieldResource",
+    "AsyncNotificationResource",
+    "AsyncOnetimeResource",
+    "AsyncOrderResource",
+    "AsyncPaymentMethodResource",
+    "AsyncPlanResource",
+    "AsyncProductResource",
+    "AsyncRetentionStrategyResource",
+    "AsyncStoreResource",
+    "AsyncSubscriptionResource",
+    "AsyncTokenResource",
+    "AsyncWebhookResource",
+]
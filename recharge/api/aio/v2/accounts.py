@@ -0,0 +1,80 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/accounts.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.account import Account
+from recharge.pagination import Listing
+
+
+class AsyncAccountResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/accounts
+    """
+
+    object_list_key = "accounts"
+    object_dict_key = "account"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def get(self, account_id: str) -> Account:
+        """Get an account.
+        https://developer.rechargepayments.com/2021-11/accounts/account_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_accounts"]
+        self._check_scopes(f"GET /{self.object_list_key}/:account_id", required_scopes)
+
+        url = f"{self._url}/{account_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Account.model_validate(data)
+
+    async def list_(self) -> list[Account]:
+        """List accounts.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_accounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Account, data)
+
+    async def list_all(self) -> list[Account]:
+        """List all accounts.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_accounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Account, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_accounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    async def iter_pages(self) -> AsyncIterator[list[Account]]:
+        """Iterate over pages of accounts.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        async for page in self._iter_listing(self.listing()):
+            yield self._validate_list(Account, page)
+
+    async def iter_all(self) -> AsyncIterator[Account]:
+        """Iterate over all accounts, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        async for page in self.iter_pages():
+            for item in page:
+                yield item
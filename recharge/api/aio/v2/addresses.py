@@ -0,0 +1,156 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/addresses.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.addresses import (
+    AddressCreateBody,
+    AddressListQuery,
+    AddressMergeBody,
+    AddressSkipBody,
+    AddressUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.address import Address
+from recharge.pagination import Listing
+
+
+class AsyncAddressResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/addresses
+    """
+
+    object_list_key = "addresses"
+    object_dict_key = "address"
+    recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
+
+    async def create(self, body: AddressCreateBody) -> Address:
+        """Create an address for the customer.
+        https://developer.rechargepayments.com/2021-11/addresses/create_address
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def get(self, address_id: str) -> Address:
+        """Get an address by ID.
+        https://developer.rechargepayments.com/2021-11/addresses/retrieve_address
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}/:address_id", required_scopes)
+
+        url = f"{self._url}/{address_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def update(self, address_id: str, body: AddressUpdateBody) -> Address:
+        """Update an address by ID.
+        https://developer.rechargepayments.com/2021-11/addresses/update_address
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:address_id", required_scopes)
+
+        url = f"{self._url}/{address_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def delete(self, address_id: str) -> dict:
+        """Delete an address by ID.
+        https://developer.rechargepayments.com/2021-11/addresses/delete_address
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:address_id", required_scopes
+        )
+
+        url = f"{self._url}/{address_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[AddressListQuery] = None) -> list[Address]:
+        """List addresses for a customer.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Address, data)
+
+    async def list_all(self, query: Optional[AddressListQuery] = None) -> list[Address]:
+        """List all addresses for a customer.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Address, data)
+
+    def listing(self, query: Optional[AddressListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[AddressListQuery] = None
+    ) -> AsyncIterator[list[Address]]:
+        """Iterate over pages of addresses for a customer.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Address, page)
+
+    async def iter_all(self, query: Optional[AddressListQuery] = None) -> AsyncIterator[Address]:
+        """Iterate over all addresses for a customer, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def merge(self, body: AddressMergeBody) -> Address:
+        """Merge two addresses.
+        https://developer.rechargepayments.com/2021-11/addresses/merge
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"POST /{self.object_list_key}/merge", required_scopes)
+
+        url = f"{self._url}/merge"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
+
+    async def skip(self, address_id: str, body: AddressSkipBody) -> Address:
+        """Skip an address.
+        https://developer.rechargepayments.com/2021-11/addresses/skip_future_charge
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"POST /{self.object_list_key}/:address_id/charges/skip", required_scopes)
+
+        url = f"{self._url}/{address_id}/charges/skip"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Address.model_validate(data)
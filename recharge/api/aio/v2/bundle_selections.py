@@ -0,0 +1,133 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/bundle_selections.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.bundle_selections import (
+    BundleSelectionCreateBody,
+    BundleSelectionListQuery,
+    BundleSelectionUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.bundle_selection import BundleSelection
+from recharge.pagination import Listing
+
+
+class AsyncBundleSelectionResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/bundle_selections
+    """
+
+    object_list_key = "bundle_selections"
+    object_dict_key = "bundle_selection"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def list_(
+        self, query: Optional[BundleSelectionListQuery] = None
+    ) -> list[BundleSelection]:
+        """List bundle selections.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(BundleSelection, data)
+
+    async def list_all(self) -> list[BundleSelection]:
+        """List all bundle selections.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(BundleSelection, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    async def iter_pages(self) -> AsyncIterator[list[BundleSelection]]:
+        """Iterate over pages of bundle selections.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        async for page in self._iter_listing(self.listing()):
+            yield self._validate_list(BundleSelection, page)
+
+    async def iter_all(self) -> AsyncIterator[BundleSelection]:
+        """Iterate over all bundle selections, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        async for page in self.iter_pages():
+            for item in page:
+                yield item
+
+    async def get(self, bundle_selection_id: str) -> BundleSelection:
+        """Get a bundle selection.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:bundle_selection_id", required_scopes
+        )
+
+        url = f"{self._url}/{bundle_selection_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return BundleSelection.model_validate(data)
+
+    async def create(self, body: BundleSelectionCreateBody) -> BundleSelection:
+        """Create a bundle selection.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_create
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return BundleSelection.model_validate(data)
+
+    async def update(
+        self, bundle_selection_id: str, body: BundleSelectionUpdateBody
+    ) -> BundleSelection:
+        """Update a bundle selection.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_update
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:bundle_selection_id", required_scopes
+        )
+
+        url = f"{self._url}/{bundle_selection_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return BundleSelection.model_validate(data)
+
+    async def delete(self, bundle_selection_id: str) -> dict:
+        """Delete a bundle selection.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:bundle_selection_id", required_scopes
+        )
+
+        url = f"{self._url}/{bundle_selection_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
@@ -0,0 +1,225 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/charges.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.charges import (
+    ChargeAddFreegiftBody,
+    ChargeDiscountApplyBody,
+    ChargeListQuery,
+    ChargeRefundBody,
+    ChargeRemoveFreegiftBody,
+    ChargeSkipBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.charge import Charge
+from recharge.pagination import Listing
+
+
+class AsyncChargeResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/charges
+    """
+
+    object_list_key = "charges"
+    object_dict_key = "charge"
+    recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
+
+    async def get(self, charge_id: str) -> Charge:
+        """Get a charge by id.
+        https://developer.rechargepayments.com/2021-11/charges/charge_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}/:charge_id", required_scopes)
+
+        url = f"{self._url}/{charge_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def list_(self, query: Optional[ChargeListQuery] = None) -> list[Charge]:
+        """List charges.
+        https://developer.rechargepayments.com/2021-11/charges/charge_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Charge, data)
+
+    async def list_all(self, query: Optional[ChargeListQuery] = None) -> list[Charge]:
+        """List all charges.
+        https://developer.rechargepayments.com/2021-11/charges/charge_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Charge, data)
+
+    def listing(self, query: Optional[ChargeListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/charges/charge_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[ChargeListQuery] = None
+    ) -> AsyncIterator[list[Charge]]:
+        """Iterate over pages of charges.
+        https://developer.rechargepayments.com/2021-11/charges/charge_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Charge, page)
+
+    async def iter_all(self, query: Optional[ChargeListQuery] = None) -> AsyncIterator[Charge]:
+        """Iterate over all charges, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/charges/charge_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def apply_discount(self, charge_id: str, body: ChargeDiscountApplyBody) -> Charge:
+        """Apply a discount to a charge.
+        https://developer.rechargepayments.com/2021-11/charges/apply_discount
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/apply_discount", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/apply_discount"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def remove_discount(self, charge_id: str) -> Charge:
+        """Remove a discount from a charge.
+        https://developer.rechargepayments.com/2021-11/charges/remove_discount
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/remove_discount", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/remove_discount"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def skip(self, charge_id: str, body: ChargeSkipBody) -> Charge:
+        """Skip a charge.
+        https://developer.rechargepayments.com/2021-11/charges/charge_skip
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/skip", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/skip"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def unskip(self, charge_id: str, body: ChargeSkipBody) -> Charge:
+        """Unskip a charge.
+        https://developer.rechargepayments.com/2021-11/charges/charge_unskip
+        """
+        required_scopes: list[RechargeScope] = ["write_orders"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/unskip", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/unskip"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def refund(self, charge_id: str, body: ChargeRefundBody) -> Charge:
+        """Refund a charge.
+        https://developer.rechargepayments.com/2021-11/charges/charge_refund
+        """
+        required_scopes: list[RechargeScope] = ["write_orders", "write_payment_methods"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/refund", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/refund"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def process(self, charge_id: str) -> Charge:
+        """Process a charge.
+        https://developer.rechargepayments.com/2021-11/charges/charge_process
+        """
+        required_scopes: list[RechargeScope] = ["write_payments"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/process", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/process"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def capture(self, charge_id: str) -> Charge:
+        """Capture a charge.
+        https://developer.rechargepayments.com/2021-11/charges/charge_capture
+        """
+        required_scopes: list[RechargeScope] = [
+            "write_orders",
+            "write_payment_methods",
+            "write_subscriptions",
+            "write_customers",
+        ]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/capture_payment", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/capture_payment"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def add_freegift(self, charge_id: str, body: ChargeAddFreegiftBody) -> Charge:
+        required_scopes: list[RechargeScope] = ["write_free_gifts"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/add_free_gift", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/add_free_gift"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
+
+    async def remove_freegift(self, charge_id: str, body: ChargeRemoveFreegiftBody) -> Charge:
+        required_scopes: list[RechargeScope] = ["write_free_gifts"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:charge_id/remove_free_gift", required_scopes
+        )
+
+        url = f"{self._url}/{charge_id}/remove_free_gift"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Charge.model_validate(data)
@@ -0,0 +1,190 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/collections.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.collections import (
+    CollectionAddProductsBody,
+    CollectionCreateBody,
+    CollectionDeleteProductsBody,
+    CollectionListProductsQuery,
+    CollectionListQuery,
+    CollectionUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
+from recharge.model.v2.collection import Collection, CollectionProduct
+from recharge.pagination import Listing
+
+
+class AsyncCollectionResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/collections
+    """
+
+    object_list_key = "collections"
+    object_dict_key = "collection"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def create(self, body: CollectionCreateBody) -> Collection:
+        """Create a collection.
+        https://developer.rechargepayments.com/2021-11/collections/collections_create
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Collection.model_validate(data)
+
+    async def get(self, collection_id: str) -> Collection:
+        """Get a collection by ID.
+        https://developer.rechargepayments.com/2021-11/collections/collections_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:collection_id", required_scopes
+        )
+
+        url = f"{self._url}/{collection_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Collection.model_validate(data)
+
+    async def update(self, collection_id: str, body: CollectionUpdateBody) -> Collection:
+        """Update a collection.
+        https://developer.rechargepayments.com/2021-11/collections/collections_update
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:collection_id", required_scopes
+        )
+
+        url = f"{self._url}/{collection_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Collection.model_validate(data)
+
+    async def delete(self, collection_id: str) -> dict:
+        """Delete a collection.
+        https://developer.rechargepayments.com/2021-11/collections/collections_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:collection_id", required_scopes
+        )
+
+        url = f"{self._url}/{collection_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[CollectionListQuery] = None) -> list[Collection]:
+        """List collections.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Collection, data)
+
+    async def list_all(self, query: Optional[CollectionListQuery] = None) -> list[Collection]:
+        """List all collections.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Collection, data)
+
+    def listing(self, query: Optional[CollectionListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[CollectionListQuery] = None
+    ) -> AsyncIterator[list[Collection]]:
+        """Iterate over pages of collections.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Collection, page)
+
+    async def iter_all(
+        self, query: Optional[CollectionListQuery] = None
+    ) -> AsyncIterator[Collection]:
+        """Iterate over all collections, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def list_products(
+        self, query: Optional[CollectionListProductsQuery] = None
+    ) -> list[CollectionProduct]:
+        """List products in a collection.
+        https://developer.rechargepayments.com/2021-11/collections/collection_products
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes("GET /collection_products", required_scopes)
+
+        url = f"{self.base_url}/collection_products"
+        data = await self._http_get(url, query, list, response_key="collection_products")
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(CollectionProduct, data)
+
+    async def add_products(
+        self, collection_id: str, body: CollectionAddProductsBody
+    ) -> list[CollectionProduct]:
+        """Add products to a collection.
+        https://developer.rechargepayments.com/2021-11/collections/collections_products_add
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:collection_id/collection_products-bulk",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{collection_id}/products"
+        data = await self._http_post(
+            url, body, expected=list, response_key="collection_products"
+        )
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(CollectionProduct, data)
+
+    async def delete_products(
+        self, collection_id: str, body: CollectionDeleteProductsBody
+    ) -> dict:
+        """Delete products from a collection.
+        https://developer.rechargepayments.com/2021-11/collections/collections_products_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:collection_id/collection_products-bulk",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{collection_id}/products"
+        data = await self._http_delete(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
@@ -0,0 +1,180 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/customers.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.customers import (
+    CustomerCreateBody,
+    CustomerGetDeliveryScheduleQuery,
+    CustomerIncludes,
+    CustomerListQuery,
+    CustomerUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.customer import (
+    Customer,
+    CustomerCreditSummary,
+    CustomerDeliverySchedule,
+)
+from recharge.pagination import Listing
+
+
+class AsyncCustomerResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/customers
+    """
+
+    object_list_key = "customers"
+    object_dict_key = "customer"
+    recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
+
+    async def create(self, body: CustomerCreateBody) -> Customer:
+        """Create a customer.
+        https://developer.rechargepayments.com/2021-11/customers/customers_create
+        """
+        required_scopes: list[RechargeScope] = [
+            "write_customers",
+            "write_payment_methods",
+        ]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Customer.model_validate(data)
+
+    async def get(self, customer_id: str, includes: Optional[list[CustomerIncludes]] = None) -> Customer:
+        """Get a customer by ID.
+        https://developer.rechargepayments.com/2021-11/customers/customers_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}/:customer_id", required_scopes)
+
+        url = f"{self._url}/{customer_id}"
+        # Recharge expects a single comma-separated `include` query parameter.
+        # Sending `includes` (plural) or repeated `include` params is silently
+        # ignored by the API, so the extra objects never come back.
+        query = {"include": ",".join(includes)} if includes else None
+        data = await self._http_get(url, query)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        # Included objects are returned nested under an `include` envelope; lift
+        # them onto the customer so they're accessible as attributes (e.g.
+        # referral_info, punch_card_progress).
+        included = data.pop("include", None)
+        if isinstance(included, dict):
+            data.update(included)
+        return Customer.model_validate(data)
+
+    async def update(self, customer_id: str, body: CustomerUpdateBody) -> Customer:
+        """Update a customer.
+        https://developer.rechargepayments.com/2021-11/customers/customers_update
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:customer_id", required_scopes)
+
+        url = f"{self._url}/{customer_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Customer.model_validate(data)
+
+    async def delete(self, customer_id: str) -> dict:
+        """Delete a customer.
+        https://developer.rechargepayments.com/2021-11/customers/customers_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_customers"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:customer_id", required_scopes
+        )
+
+        url = f"{self._url}/{customer_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[CustomerListQuery] = None) -> list[Customer]:
+        """List customers.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Customer, data)
+
+    async def list_all(self, query: Optional[CustomerListQuery] = None) -> list[Customer]:
+        """List all customers.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Customer, data)
+
+    def listing(self, query: Optional[CustomerListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[CustomerListQuery] = None
+    ) -> AsyncIterator[list[Customer]]:
+        """Iterate over pages of customers.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Customer, page)
+
+    async def iter_all(self, query: Optional[CustomerListQuery] = None) -> AsyncIterator[Customer]:
+        """Iterate over all customers, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def get_delivery_schedule(
+        self, customer_id: str, query: Optional[CustomerGetDeliveryScheduleQuery] = None
+    ) -> CustomerDeliverySchedule:
+        """Get a customer's delivery schedule.
+        https://developer.rechargepayments.com/2021-11/customers/customer_delivery_schedule
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:customer_id/delivery_schedule",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{customer_id}/delivery_schedule"
+        data = await self._http_get(url, query, response_key="deliverySchedule")
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return CustomerDeliverySchedule.model_validate(data)
+
+    async def get_credit_summary(self, customer_id: str) -> CustomerCreditSummary:
+        """Get a customer's credit summary.
+        https://developer.rechargepayments.com/2021-11/customers/customer_credit_summary
+        """
+        required_scopes: list[RechargeScope] = ["read_credit_summary"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:customer_id/credit_summary", required_scopes
+        )
+
+        url = f"{self._url}/{customer_id}/credit_summary"
+        data = await self._http_get(url, response_key="credit_summary")
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return CustomerCreditSummary.model_validate(data)
@@ -0,0 +1,70 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/events.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.events import EventListQuery
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.event import Event
+from recharge.pagination import Listing
+
+
+class AsyncEventResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/events
+    """
+
+    object_list_key = "events"
+    object_dict_key = "event"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def list_(self, query: Optional[EventListQuery] = None) -> list[Event]:
+        """List events.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        required_scopes: list[RechargeScope] = ["read_events"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Event, data)
+
+    async def list_all(self, query: Optional[EventListQuery] = None) -> list[Event]:
+        """List all events.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        required_scopes: list[RechargeScope] = ["read_events"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Event, data)
+
+    def listing(self, query: Optional[EventListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        required_scopes: list[RechargeScope] = ["read_events"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[EventListQuery] = None
+    ) -> AsyncIterator[list[Event]]:
+        """Iterate over pages of events.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Event, page)
+
+    async def iter_all(self, query: Optional[EventListQuery] = None) -> AsyncIterator[Event]:
+        """Iterate over all events, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
@@ -0,0 +1,136 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/metafields.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.metafields import (
+    MetafieldCreateBody,
+    MetafieldListQuery,
+    MetafieldUpdateBody,
+    resource_scope,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.metafield import Metafield, MetafieldOwnerResource
+from recharge.pagination import Listing
+
+
+class AsyncMetafieldResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/metafields
+    """
+
+    object_list_key = "metafields"
+    object_dict_key = "metafield"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def create(self, body: MetafieldCreateBody) -> Metafield:
+        """Create a metafield.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_create
+        """
+        resource = body["owner_resource"]
+
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "write")]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Metafield.model_validate(data)
+
+    async def get(self, metafield_id: str, resource: MetafieldOwnerResource) -> Metafield:
+        """Get a metafield by ID.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_retrieve
+        """
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:metafield_id", required_scopes
+        )
+
+        url = f"{self._url}/{metafield_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Metafield.model_validate(data)
+
+    async def update(self, metafield_id: str, body: MetafieldUpdateBody) -> Metafield:
+        """Update a metafield.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_update
+        """
+        resource = body["owner_resource"]
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "write")]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:metafield_id", required_scopes
+        )
+
+        url = f"{self._url}/{metafield_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Metafield.model_validate(data)
+
+    async def delete(self, metafield_id: str, resource: MetafieldOwnerResource) -> dict:
+        """Delete a metafield.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_delete
+        """
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "write")]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:metafield_id", required_scopes
+        )
+
+        url = f"{self._url}/{metafield_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: MetafieldListQuery) -> list[Metafield]:
+        """List metafields.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        resource = query["owner_resource"]
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Metafield, data)
+
+    async def list_all(self, query: MetafieldListQuery) -> list[Metafield]:
+        """List all metafields.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        resource = query["owner_resource"]
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Metafield, data)
+
+    def listing(self, query: MetafieldListQuery) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        resource = query["owner_resource"]
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(self, query: MetafieldListQuery) -> AsyncIterator[list[Metafield]]:
+        """Iterate over pages of metafields.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Metafield, page)
+
+    async def iter_all(self, query: MetafieldListQuery) -> AsyncIterator[Metafield]:
+        """Iterate over all metafields, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
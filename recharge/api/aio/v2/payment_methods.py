@@ -0,0 +1,139 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/payment_methods.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.payment_methods import (
+    PaymentMethodCreateBody,
+    PaymentMethodListQuery,
+    PaymentMethodUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.payment_method import PaymentMethod
+from recharge.pagination import Listing
+
+
+class AsyncPaymentMethodResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/payment_methods
+    """
+
+    object_list_key = "payment_methods"
+    object_dict_key = "payment_method"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def create(self, body: PaymentMethodCreateBody) -> PaymentMethod:
+        """Create a payment method.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_create
+        """
+        required_scopes: list[RechargeScope] = ["write_payment_methods"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return PaymentMethod.model_validate(data)
+
+    async def get(self, payment_method_id: int) -> PaymentMethod:
+        """Get a payment method.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_get
+        """
+        required_scopes: list[RechargeScope] = ["read_payment_methods"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:payment_method_id", required_scopes
+        )
+
+        url = f"{self._url}/{payment_method_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return PaymentMethod.model_validate(data)
+
+    async def update(
+        self, payment_method_id: int, body: PaymentMethodUpdateBody
+    ) -> PaymentMethod:
+        """Update a payment method.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_update
+        """
+        required_scopes: list[RechargeScope] = ["write_payment_methods"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:payment_method_id", required_scopes
+        )
+
+        url = f"{self._url}/{payment_method_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return PaymentMethod.model_validate(data)
+
+    async def delete(self, payment_method_id: int) -> dict:
+        """Delete a payment method.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_payment_methods"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:payment_method_id", required_scopes
+        )
+
+        url = f"{self._url}/{payment_method_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(
+        self, query: Optional[PaymentMethodListQuery] = None
+    ) -> list[PaymentMethod]:
+        """List payment methods.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        required_scopes: list[RechargeScope] = ["read_payment_methods"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(PaymentMethod, data)
+
+    async def list_all(
+        self, query: Optional[PaymentMethodListQuery] = None
+    ) -> list[PaymentMethod]:
+        """List all payment methods.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        required_scopes: list[RechargeScope] = ["read_payment_methods"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(PaymentMethod, data)
+
+    def listing(self, query: Optional[PaymentMethodListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        required_scopes: list[RechargeScope] = ["read_payment_methods"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[PaymentMethodListQuery] = None
+    ) -> AsyncIterator[list[PaymentMethod]]:
+        """Iterate over pages of payment methods.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(PaymentMethod, page)
+
+    async def iter_all(
+        self, query: Optional[PaymentMethodListQuery] = None
+    ) -> AsyncIterator[PaymentMethod]:
+        """Iterate over all payment methods, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
@@ -0,0 +1,164 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/plans.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.plans import (
+    PlanBulkCreateBody,
+    PlanBulkDeleteBody,
+    PlanBulkUpdateBody,
+    PlanCreateBody,
+    PlanListQuery,
+    PlanUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
+from recharge.model.v2.plan import Plan
+from recharge.pagination import Listing
+
+
+class AsyncPlanResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/plans
+    """
+
+    object_list_key = "plans"
+    object_dict_key = "plan"
+    recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
+
+    async def create(self, body: PlanCreateBody) -> Plan:
+        """Create a plan.
+        https://developer.rechargepayments.com/2021-11/plans/plans_create
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Plan.model_validate(data)
+
+    async def update(self, plan_id: int, body: PlanUpdateBody) -> Plan:
+        """Update a plan.
+        https://developer.rechargepayments.com/2021-11/plans/plans_update
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:plan_id", required_scopes)
+
+        url = f"{self._url}/{plan_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Plan.model_validate(data)
+
+    async def delete(self, plan_id: int) -> dict:
+        """Delete a plan.
+        https://developer.rechargepayments.com/2021-11/plans/plans_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(f"DELETE /{self.object_list_key}/:plan_id", required_scopes)
+
+        url = f"{self._url}/{plan_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[PlanListQuery] = None) -> list[Plan]:
+        """List plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Plan, data)
+
+    async def list_all(self, query: Optional[PlanListQuery] = None) -> list[Plan]:
+        """List all plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Plan, data)
+
+    def listing(self, query: Optional[PlanListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(self, query: Optional[PlanListQuery] = None) -> AsyncIterator[list[Plan]]:
+        """Iterate over pages of plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Plan, page)
+
+    async def iter_all(self, query: Optional[PlanListQuery] = None) -> AsyncIterator[Plan]:
+        """Iterate over all plans, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def bulk_create(
+        self, external_product_id: str, body: PlanBulkCreateBody
+    ) -> list[Plan]:
+        """Bulk create plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_bulk_create
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            "POST /products/:external_product_id/plans-bulk", required_scopes
+        )
+
+        url = f"{self.base_url}/products/{external_product_id}/plans-bulk"
+        data = await self._http_post(url, body, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(Plan, data)
+
+    async def bulk_update(
+        self, external_product_id: str, body: PlanBulkUpdateBody
+    ) -> list[Plan]:
+        """Bulk update plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_bulk_update
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            "PUT /products/:external_product_id/plans-bulk", required_scopes
+        )
+
+        url = f"{self.base_url}/products/{external_product_id}/plans-bulk"
+        data = await self._http_put(url, body, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(Plan, data)
+
+    async def bulk_delete(self, external_product_id: str, body: PlanBulkDeleteBody) -> dict:
+        """Bulk delete plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_bulk_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            "DELETE /products/:external_product_id/plans-bulk", required_scopes
+        )
+
+        url = f"{self.base_url}/products/{external_product_id}/plans-bulk"
+        data = await self._http_delete(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
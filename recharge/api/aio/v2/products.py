@@ -0,0 +1,127 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/products.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.products import (
+    ProductCreateBody,
+    ProductListQuery,
+    ProductUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.product import Product
+from recharge.pagination import Listing
+
+
+class AsyncProductResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/products
+    """
+
+    object_list_key = "products"
+    object_dict_key = "product"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def create(self, body: ProductCreateBody) -> Product:
+        """Create a product.
+        https://developer.rechargepayments.com/2021-11/products/products_create
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Product.model_validate(data)
+
+    async def get(self, product_id: str) -> Product:
+        """Get a product.
+        https://developer.rechargepayments.com/2021-11/products/products_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}/:product_id", required_scopes)
+
+        url = f"{self._url}/{product_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Product.model_validate(data)
+
+    async def update(self, product_id: str, body: ProductUpdateBody) -> Product:
+        """Update a product.
+        https://developer.rechargepayments.com/2021-11/products/products_update
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(f"PUT /{self.object_list_key}/:product_id", required_scopes)
+
+        url = f"{self._url}/{product_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Product.model_validate(data)
+
+    async def delete(self, product_id: str) -> dict:
+        """Delete a product.
+        https://developer.rechargepayments.com/2021-11/products/products_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_products"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:product_id", required_scopes
+        )
+
+        url = f"{self._url}/{product_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self, query: Optional[ProductListQuery] = None) -> list[Product]:
+        """List products.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Product, data)
+
+    async def list_all(self, query: Optional[ProductListQuery] = None) -> list[Product]:
+        """List all products.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Product, data)
+
+    def listing(self, query: Optional[ProductListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[ProductListQuery] = None
+    ) -> AsyncIterator[list[Product]]:
+        """Iterate over pages of products.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Product, page)
+
+    async def iter_all(self, query: Optional[ProductListQuery] = None) -> AsyncIterator[Product]:
+        """Iterate over all products, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
@@ -0,0 +1,130 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/retention_strategies.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.retention_strategies import (
+    RetentionStrategyCreateBody,
+    RetentionStrategyUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.v2.retention_strategy import RetentionStrategy
+from recharge.pagination import Listing
+
+
+class AsyncRetentionStrategyResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/retention_strategies
+    """
+
+    object_list_key = "retention_strategies"
+    object_dict_key = "retention_strategy"
+    recharge_version: RechargeVersion = "2021-11"
+
+    async def create(self, body: RetentionStrategyCreateBody) -> RetentionStrategy:
+        """Create a retention strategy.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_create
+        """
+        required_scopes: list[RechargeScope] = ["write_retention_strategies"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return RetentionStrategy.model_validate(data)
+
+    async def get(self, retention_strategy_id: int) -> RetentionStrategy:
+        """Get a retention strategy.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:retention_strategy_id", required_scopes
+        )
+
+        url = f"{self._url}/{retention_strategy_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return RetentionStrategy.model_validate(data)
+
+    async def update(
+        self, retention_strategy_id: int, body: RetentionStrategyUpdateBody
+    ) -> RetentionStrategy:
+        """Update a retention strategy.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_update
+        """
+        required_scopes: list[RechargeScope] = ["write_retention_strategies"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:retention_strategy_id", required_scopes
+        )
+
+        url = f"{self._url}/{retention_strategy_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return RetentionStrategy.model_validate(data)
+
+    async def delete(self, retention_strategy_id: int) -> dict:
+        """Delete a retention strategy.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_retention_strategies"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:retention_strategy_id", required_scopes
+        )
+
+        url = f"{self._url}/{retention_strategy_id}"
+        data = await self._http_delete(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(self) -> list[RetentionStrategy]:
+        """List retention strategies.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(RetentionStrategy, data)
+
+    async def list_all(self) -> list[RetentionStrategy]:
+        """List all retention strategies.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(RetentionStrategy, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    async def iter_pages(self) -> AsyncIterator[list[RetentionStrategy]]:
+        """Iterate over pages of retention strategies.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        async for page in self._iter_listing(self.listing()):
+            yield self._validate_list(RetentionStrategy, page)
+
+    async def iter_all(self) -> AsyncIterator[RetentionStrategy]:
+        """Iterate over all retention strategies, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        async for page in self.iter_pages():
+            for item in page:
+                yield item
@@ -0,0 +1,228 @@
+# Generated by scripts/generate_async.py from recharge/api/v2/subscriptions.py.
+# Do not edit by hand: change the sync resource and re-run the script.
+
+from typing import AsyncIterator, Optional
+
+from recharge.api import AsyncRechargeResource, RechargeScope, RechargeVersion
+from recharge.api.v2.subscriptions import (
+    SubscriptionCancelBody,
+    SubscriptionChangeAddressBody,
+    SubscriptionChangeDateBody,
+    SubscriptionCreateBody,
+    SubscriptionDeleteBody,
+    SubscriptionListQuery,
+    SubscriptionSkipGiftBody,
+    SubscriptionUpdateBody,
+)
+from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
+from recharge.model.v2.onetime import Onetime
+from recharge.model.v2.subscription import Subscription
+from recharge.pagination import Listing
+
+
+class AsyncSubscriptionResource(AsyncRechargeResource):
+    """
+    https://developer.rechargepayments.com/2021-11/subscriptions
+    """
+
+    object_list_key = "subscriptions"
+    object_dict_key = "subscription"
+    recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
+
+    async def create(self, body: SubscriptionCreateBody) -> Subscription:
+        """Create a subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_create
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}", required_scopes)
+
+        data = await self._http_post(self._url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def get(self, subscription_id: str) -> Subscription:
+        """Get a subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_retrieve
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(
+            f"GET /{self.object_list_key}/:subscription_id", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}"
+        data = await self._http_get(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def update(
+        self, subscription_id: str, body: SubscriptionUpdateBody
+    ) -> Subscription:
+        """Update a subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_update
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"PUT /{self.object_list_key}/:subscription_id", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}"
+        data = await self._http_put(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def delete(self, subscription_id: str, body: SubscriptionDeleteBody) -> dict:
+        """Delete a subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_delete
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"DELETE /{self.object_list_key}/:subscription_id", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}"
+        data = await self._http_delete(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return data
+
+    async def list_(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> list[Subscription]:
+        """List subscriptions.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._http_get(self._url, query, expected=list)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Subscription, data)
+
+    async def list_all(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> list[Subscription]:
+        """List all subscriptions.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        data = await self._paginate(self._url, query)
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return self._validate_list(Subscription, data)
+
+    def listing(self, query: Optional[SubscriptionListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    async def iter_pages(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> AsyncIterator[list[Subscription]]:
+        """Iterate over pages of subscriptions.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        async for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Subscription, page)
+
+    async def iter_all(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> AsyncIterator[Subscription]:
+        """Iterate over all subscriptions, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        async for page in self.iter_pages(query):
+            for item in page:
+                yield item
+
+    async def change_date(
+        self, subscription_id: str, body: SubscriptionChangeDateBody
+    ) -> Subscription:
+        """Change the date of a queued subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_change_next_charge
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/set_next_charge_date",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{subscription_id}/set_next_charge_date"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def change_address(
+        self, subscription_id: str, body: SubscriptionChangeAddressBody
+    ) -> Subscription:
+        """Change the address of a subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_change_address
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/change_address",
+            required_scopes,
+        )
+
+        url = f"{self._url}/{subscription_id}/change_address"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def cancel(
+        self, subscription_id: str, body: SubscriptionCancelBody
+    ) -> Subscription:
+        """Cancel a subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_cancel
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/cancel", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}/cancel"
+        data = await self._http_post(url, body)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def activate(self, subscription_id: str) -> Subscription:
+        """Activate a cancelled subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_activate
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(
+            f"POST /{self.object_list_key}/:subscription_id/activate", required_scopes
+        )
+
+        url = f"{self._url}/{subscription_id}/activate"
+        data = await self._http_post(url)
+        if not isinstance(data, dict):
+            raise RechargeAPIError(f"Expected dict, got {type(data).__name__}")
+        return Subscription.model_validate(data)
+
+    async def skip_gift(self, body: SubscriptionSkipGiftBody) -> list[Onetime]:
+        """Skip a gift subscription.
+        https://developer.rechargepayments.com/2021-11/subscriptions/skip_gift
+        """
+        required_scopes: list[RechargeScope] = ["write_subscriptions"]
+        self._check_scopes(f"POST /{self.object_list_key}/skip_gift", required_scopes)
+
+        url = f"{self._url}/skip_gift"
+        data = await self._http_post(url, body, expected=list, response_key="onetimes")
+        if not isinstance(data, list):
+            raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
+        return validate_list(Onetime, data)
@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict, Union
+from typing import Iterator, Optional, TypedDict, Union
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -7,6 +7,7 @@ from recharge.model.v1.address import (
     AddressNoteAttribute,
     AddressShippingLinesOverride,
 )
+from recharge.pagination import Listing
 
 
 class AddressCreateBodyOptional(TypedDict, total=False):
@@ -179,7 +180,7 @@ class AddressResource(RechargeResource):
         data = self._http_get(url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Address.model_validate(item) for item in data]
+        return self._validate_list(Address, data)
 
     def list_all(
         self, customer_id: str, query: Optional[AddressListQuery] = None
@@ -196,7 +197,39 @@ class AddressResource(RechargeResource):
         data = self._paginate(url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Address.model_validate(item) for item in data]
+        return self._validate_list(Address, data)
+
+    def listing(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(
+            f"GET /customers/:customer_id/{self.object_list_key}", required_scopes
+        )
+
+        url = f"{self.base_url}/customers/{customer_id}/{self.object_list_key}"
+        return self._listing(url, query)
+
+    def iter_pages(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> Iterator[list[Address]]:
+        """Iterate over pages of addresses for a customer.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        for page in self._iter_listing(self.listing(customer_id, query)):
+            yield self._validate_list(Address, page)
+
+    def iter_all(
+        self, customer_id: str, query: Optional[AddressListQuery] = None
+    ) -> Iterator[Address]:
+        """Iterate over all addresses for a customer, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/addresses/list_addresses
+        """
+        for page in self.iter_pages(customer_id, query):
+            yield from page
 
     def count(self, query: Optional[AddressCountQuery] = None) -> int:
         """Retrieve the count of addresses.
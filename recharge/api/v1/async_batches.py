@@ -1,8 +1,9 @@
-from typing import TypedDict, Union
+from typing import Iterator, TypedDict, Union
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v1.async_batch import AsyncBatch, AsyncBatchTask, AsyncBatchType
+from recharge.pagination import Listing
 
 from .addresses import AddressApplyDiscountBody, AddressRemoveDiscountBody
 from .discounts import DiscountCreateBody, DiscountDeleteBody, DiscountUpdateBody
@@ -103,7 +104,7 @@ class AsyncBatchResource(RechargeResource):
         data = self._http_get(self._url, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [AsyncBatch.model_validate(batch) for batch in data]
+        return self._validate_list(AsyncBatch, data)
 
     def list_all(self) -> list[AsyncBatch]:
         """List all async batches.
@@ -116,7 +117,31 @@ class AsyncBatchResource(RechargeResource):
         data = self._paginate(url)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [AsyncBatch.model_validate(batch) for batch in data]
+        return self._validate_list(AsyncBatch, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        url = f"{self._url}/all"
+        return self._listing(url)
+
+    def iter_pages(self) -> Iterator[list[AsyncBatch]]:
+        """Iterate over pages of async batches.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        for page in self._iter_listing(self.listing()):
+            yield self._validate_list(AsyncBatch, page)
+
+    def iter_all(self) -> Iterator[AsyncBatch]:
+        """Iterate over all async batches, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/async_batch_endpoints
+        """
+        for page in self.iter_pages():
+            yield from page
 
     def list_tasks(
         self,
@@ -134,7 +159,7 @@ class AsyncBatchResource(RechargeResource):
         data = self._http_get(url, expected=list, response_key="async_batch_tasks")
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [AsyncBatchTask.model_validate(task) for task in data]
+        return self._validate_list(AsyncBatchTask, data)
 
     def process(self, batch_id: str) -> AsyncBatch:
         """Process an async batch.
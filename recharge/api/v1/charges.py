@@ -1,8 +1,9 @@
-from typing import Optional, TypedDict, Union
+from typing import Iterator, Optional, TypedDict, Union
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v1.charge import Charge, ChargeStatus
+from recharge.pagination import Listing
 
 
 class ChargeListQuery(TypedDict, total=False):
@@ -79,6 +80,7 @@ class ChargeResource(RechargeResource):
     object_list_key = "charges"
     object_dict_key = "charge"
     recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
 
     def get(self, charge_id: str) -> Charge:
         """Get a charge by id.
@@ -103,19 +105,52 @@ class ChargeResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Charge.model_validate(item) for item in data]
+        return self._validate_list(Charge, data)
 
-    def list_all(self, query: Optional[ChargeListQuery] = None) -> list[Charge]:
+    def list_all(
+        self,
+        query: Optional[ChargeListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Charge]:
         """List all charges.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
         https://developer.rechargepayments.com/2021-01/charges/charge_list
         """
         required_scopes: list[RechargeScope] = ["read_orders"]
         self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
 
-        data = self._paginate(self._url, query)
+        if concurrency:
+            data = self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Charge.model_validate(item) for item in data]
+        return self._validate_list(Charge, data)
+
+    def listing(self, query: Optional[ChargeListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/charges/charge_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[ChargeListQuery] = None
+    ) -> Iterator[list[Charge]]:
+        """Iterate over pages of charges.
+        https://developer.rechargepayments.com/2021-01/charges/charge_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Charge, page)
+
+    def iter_all(self, query: Optional[ChargeListQuery] = None) -> Iterator[Charge]:
+        """Iterate over all charges, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/charges/charge_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def count(self, query: Optional[ChargeCountQuery] = None) -> int:
         """Count charges.
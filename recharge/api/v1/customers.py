@@ -1,8 +1,9 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v1.customer import Customer, CustomerStatus
+from recharge.pagination import Listing
 
 
 class CustomerCreateBodyOptional(TypedDict, total=False):
@@ -77,6 +78,7 @@ class CustomerResource(RechargeResource):
     object_list_key = "customers"
     object_dict_key = "customer"
     recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
 
     def create(self, body: CustomerCreateBody) -> Customer:
         """Create a customer.
@@ -141,19 +143,52 @@ class CustomerResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Customer.model_validate(item) for item in data]
+        return self._validate_list(Customer, data)
 
-    def list_all(self, query: Optional[CustomerListQuery] = None) -> list[Customer]:
+    def list_all(
+        self,
+        query: Optional[CustomerListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Customer]:
         """List all customers.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
         https://developer.rechargepayments.com/2021-01/customers/customers_list
         """
         required_scopes: list[RechargeScope] = ["read_customers"]
         self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
 
-        data = self._paginate(self._url, query)
+        if concurrency:
+            data = self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Customer.model_validate(item) for item in data]
+        return self._validate_list(Customer, data)
+
+    def listing(self, query: Optional[CustomerListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[CustomerListQuery] = None
+    ) -> Iterator[list[Customer]]:
+        """Iterate over pages of customers.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Customer, page)
+
+    def iter_all(self, query: Optional[CustomerListQuery] = None) -> Iterator[Customer]:
+        """Iterate over all customers, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/customers/customers_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def count(self, query: Optional[CustomerCountQuery] = None) -> int:
         """Retrieve a count of customers.
@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -11,6 +11,7 @@ from recharge.model.v1.discount import (
     DiscountStatus,
     DiscountType,
 )
+from recharge.pagination import Listing
 
 
 class DiscountCreateBodyOptional(TypedDict, total=False):
@@ -77,6 +78,7 @@ class DiscountResource(RechargeResource):
     object_list_key = "discounts"
     object_dict_key = "discount"
     recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
 
     def create(self, body: DiscountCreateBody) -> Discount:
         """Create a discount.
@@ -141,19 +143,52 @@ class DiscountResource(RechargeResource):
         data = self._http_get(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Discount.model_validate(item) for item in data]
+        return self._validate_list(Discount, data)
 
-    def list_all(self, query: Optional[DiscountListQuery] = None) -> list[Discount]:
+    def list_all(
+        self,
+        query: Optional[DiscountListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Discount]:
         """List all discounts.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
         https://developer.rechargepayments.com/2021-01/discounts/discounts_list
         """
         required_scopes: list[RechargeScope] = ["read_discounts"]
         self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
 
-        data = self._paginate(self._url, query)
+        if concurrency:
+            data = self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Discount.model_validate(item) for item in data]
+        return self._validate_list(Discount, data)
+
+    def listing(self, query: Optional[DiscountListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[DiscountListQuery] = None
+    ) -> Iterator[list[Discount]]:
+        """Iterate over pages of discounts.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Discount, page)
+
+    def iter_all(self, query: Optional[DiscountListQuery] = None) -> Iterator[Discount]:
+        """Iterate over all discounts, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/discounts/discounts_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def count(self, query: Optional[DiscountCountQuery] = None) -> int:
         """Receive a count of all discounts.
@@ -1,4 +1,4 @@
-from typing import Literal, TypedDict
+from typing import Iterator, Literal, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -7,6 +7,7 @@ from recharge.model.v1.metafield import (
     MetafieldOwnerResource,
     MetafieldValueType,
 )
+from recharge.pagination import Listing
 
 
 class MetafieldCreateBodyOptional(TypedDict, total=False):
@@ -168,20 +169,52 @@ class MetafieldResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Metafield.model_validate(item) for item in data]
+        return self._validate_list(Metafield, data)
 
-    def list_all(self, query: MetafieldListQuery) -> list[Metafield]:
+    def list_all(
+        self,
+        query: MetafieldListQuery,
+        concurrency: Optional[int] = None,
+    ) -> list[Metafield]:
         """List all metafields.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
         https://developer.rechargepayments.com/2021-01/metafields/metafields_list
         """
         resource = query["owner_resource"]
         required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
         self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
 
-        data = self._paginate(self._url, query)
+        if concurrency:
+            data = self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Metafield.model_validate(item) for item in data]
+        return self._validate_list(Metafield, data)
+
+    def listing(self, query: MetafieldListQuery) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/metafields/metafields_list
+        """
+        resource = query["owner_resource"]
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(self, query: MetafieldListQuery) -> Iterator[list[Metafield]]:
+        """Iterate over pages of metafields.
+        https://developer.rechargepayments.com/2021-01/metafields/metafields_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Metafield, page)
+
+    def iter_all(self, query: MetafieldListQuery) -> Iterator[Metafield]:
+        """Iterate over all metafields, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/metafields/metafields_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def count(self, query: MetafieldCountQuery) -> int:
         """Retrieve a count of metafields.
@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -9,6 +9,7 @@ from recharge.model.v1.order import (
     OrderShippingAddress,
     OrderStatus,
 )
+from recharge.pagination import Listing
 
 
 class OrderUpdateBody(TypedDict, total=False):
@@ -72,6 +73,7 @@ class OrderResource(RechargeResource):
     object_list_key = "orders"
     object_dict_key = "order"
     recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
 
     def get(self, order_id: str) -> Order:
         """Get an order.
@@ -122,19 +124,52 @@ class OrderResource(RechargeResource):
         data = self._http_get(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Order.model_validate(item) for item in data]
+        return self._validate_list(Order, data)
 
-    def list_all(self, query: Optional[OrderListQuery] = None) -> list[Order]:
+    def list_all(
+        self,
+        query: Optional[OrderListQuery] = None,
+        concurrency: Optional[int] = None,
+    ) -> list[Order]:
         """List all orders.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
         https://developer.rechargepayments.com/2021-01/orders/orders_list
         """
         required_scopes: list[RechargeScope] = ["read_orders"]
         self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
 
-        data = self._paginate(self._url, query)
+        if concurrency:
+            data = self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Order.model_validate(item) for item in data]
+        return self._validate_list(Order, data)
+
+    def listing(self, query: Optional[OrderListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[OrderListQuery] = None
+    ) -> Iterator[list[Order]]:
+        """Iterate over pages of orders.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Order, page)
+
+    def iter_all(self, query: Optional[OrderListQuery] = None) -> Iterator[Order]:
+        """Iterate over all orders, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/orders/orders_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def count(self, query: Optional[OrderCountQuery] = None) -> int:
         """Count orders.
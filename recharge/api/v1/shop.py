@@ -1,5 +1,6 @@
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
 from recharge.model.v1.shop import ShippingCountry, Store
 
 
@@ -35,4 +36,4 @@ class ShopResource(RechargeResource):
         data = self._http_get(url, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [ShippingCountry.model_validate(item) for item in data]
+        return validate_list(ShippingCountry, data)
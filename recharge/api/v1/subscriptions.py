@@ -1,13 +1,15 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
 from recharge.model.v1.subscription import (
     Subscription,
     SubscriptionOrderIntervalUnit,
     SubscriptionProperty,
     SubscriptionStatus,
 )
+from recharge.pagination import Listing
 
 
 class SubscriptionCreateBodyOptional(TypedDict, total=False):
@@ -133,6 +135,7 @@ class SubscriptionResource(RechargeResource):
     object_list_key = "subscriptions"
     object_dict_key = "subscription"
     recharge_version: RechargeVersion = "2021-01"
+    ids_filter = True
 
     def create(self, body: SubscriptionCreateBody) -> Subscription:
         """Create a subscription.
@@ -205,21 +208,54 @@ class SubscriptionResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return self._validate_list(Subscription, data)
 
     def list_all(
-        self, query: Optional[SubscriptionListQuery] = None
+        self,
+        query: Optional[SubscriptionListQuery] = None,
+        concurrency: Optional[int] = None,
     ) -> list[Subscription]:
         """List all subscriptions.
+        With ``concurrency``, pages are counted up front and fetched in parallel.
         https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
         """
         required_scopes: list[RechargeScope] = ["read_subscriptions"]
         self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
 
-        data = self._paginate(self._url, query)
+        if concurrency:
+            data = self._paginate_counted(self._url, query, concurrency)
+        else:
+            data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return self._validate_list(Subscription, data)
+
+    def listing(self, query: Optional[SubscriptionListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> Iterator[list[Subscription]]:
+        """Iterate over pages of subscriptions.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Subscription, page)
+
+    def iter_all(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> Iterator[Subscription]:
+        """Iterate over all subscriptions, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/subscriptions/subscriptions_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def count(self, query: Optional[SubscriptionCountQuery] = None) -> int:
         """Count subscriptions.
@@ -315,7 +351,7 @@ class SubscriptionResource(RechargeResource):
         data = self._http_post(url, body, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return validate_list(Subscription, data)
 
     def bulk_update(self, body: SubscriptionBulkUpdateBody) -> list[Subscription]:
         """Bulk update subscriptions.
@@ -328,7 +364,7 @@ class SubscriptionResource(RechargeResource):
         data = self._http_post(url, body, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return validate_list(Subscription, data)
 
     def bulk_delete(self, body: SubscriptionBulkDeleteBody) -> list[Subscription]:
         """Bulk delete subscriptions.
@@ -341,4 +377,4 @@ class SubscriptionResource(RechargeResource):
         data = self._http_post(url, body, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return validate_list(Subscription, data)
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Iterator, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -8,6 +8,7 @@ from recharge.model.v1.webhook import (
     WebhookTopic,
     WebhookTopicMap,
 )
+from recharge.pagination import Listing
 
 
 class WebhookCreateBodyOptional(TypedDict, total=False):
@@ -84,7 +85,7 @@ class WebhookResource(RechargeResource):
         data = self._http_get(self._url, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Webhook.model_validate(item) for item in data]
+        return self._validate_list(Webhook, data)
 
     def list_all(self) -> list[Webhook]:
         """List all webhooks.
@@ -93,7 +94,27 @@ class WebhookResource(RechargeResource):
         data = self._paginate(self._url)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Webhook.model_validate(item) for item in data]
+        return self._validate_list(Webhook, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        return self._listing(self._url)
+
+    def iter_pages(self) -> Iterator[list[Webhook]]:
+        """Iterate over pages of webhooks.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        for page in self._iter_listing(self.listing()):
+            yield self._validate_list(Webhook, page)
+
+    def iter_all(self) -> Iterator[Webhook]:
+        """Iterate over all webhooks, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-01/webhooks_endpoints/webhooks_list
+        """
+        for page in self.iter_pages():
+            yield from page
 
     def test(self, webhook_id: str) -> dict:
         """Test a webhook.
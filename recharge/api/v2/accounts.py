@@ -1,6 +1,9 @@
+from typing import Iterator
+
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v2.account import Account
+from recharge.pagination import Listing
 
 
 class AccountResource(RechargeResource):
@@ -35,7 +38,7 @@ class AccountResource(RechargeResource):
         data = self._http_get(self._url, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Account.model_validate(item) for item in data]
+        return self._validate_list(Account, data)
 
     def list_all(self) -> list[Account]:
         """List all accounts.
@@ -47,4 +50,27 @@ class AccountResource(RechargeResource):
         data = self._paginate(self._url)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Account.model_validate(item) for item in data]
+        return self._validate_list(Account, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_accounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    def iter_pages(self) -> Iterator[list[Account]]:
+        """Iterate over pages of accounts.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        for page in self._iter_listing(self.listing()):
+            yield self._validate_list(Account, page)
+
+    def iter_all(self) -> Iterator[Account]:
+        """Iterate over all accounts, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/accounts/accounts_list
+        """
+        for page in self.iter_pages():
+            yield from page
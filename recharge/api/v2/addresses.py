@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -8,6 +8,7 @@ from recharge.model.v2.address import (
     AddressOrderAttribute,
     AddressShippingLinesOverride,
 )
+from recharge.pagination import Listing
 
 
 class AddressCreateBodyOptional(TypedDict, total=False):
@@ -92,6 +93,7 @@ class AddressResource(RechargeResource):
     object_list_key = "addresses"
     object_dict_key = "address"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def create(self, body: AddressCreateBody) -> Address:
         """Create an address for the customer.
@@ -156,7 +158,7 @@ class AddressResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Address.model_validate(address) for address in data]
+        return self._validate_list(Address, data)
 
     def list_all(self, query: Optional[AddressListQuery] = None) -> list[Address]:
         """List all addresses for a customer.
@@ -168,7 +170,32 @@ class AddressResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Address.model_validate(address) for address in data]
+        return self._validate_list(Address, data)
+
+    def listing(self, query: Optional[AddressListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[AddressListQuery] = None
+    ) -> Iterator[list[Address]]:
+        """Iterate over pages of addresses for a customer.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Address, page)
+
+    def iter_all(self, query: Optional[AddressListQuery] = None) -> Iterator[Address]:
+        """Iterate over all addresses for a customer, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/addresses/list_addresses
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def merge(self, body: AddressMergeBody) -> Address:
         """Merge two addresses.
@@ -1,8 +1,9 @@
-from typing import Optional, TypedDict, Union
+from typing import Iterator, Optional, TypedDict, Union
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v2.async_batch import AsyncBatch, AsyncBatchTask, AsyncBatchType
+from recharge.pagination import Listing
 
 from .discounts import DiscountCreateBody, DiscountDeleteBody, DiscountUpdateBody
 from .onetimes import OnetimeCreateBody, OnetimeDeleteBody
@@ -98,7 +99,7 @@ class AsyncBatchResource(RechargeResource):
         data = self._http_get(self._url, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [AsyncBatch.model_validate(item) for item in data]
+        return self._validate_list(AsyncBatch, data)
 
     def list_all(self) -> list[AsyncBatch]:
         """List all async batches.
@@ -110,7 +111,30 @@ class AsyncBatchResource(RechargeResource):
         data = self._paginate(self._url)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [AsyncBatch.model_validate(item) for item in data]
+        return self._validate_list(AsyncBatch, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/async_batch_endpoints/async_batch_endpoints_list
+        """
+        required_scopes: list[RechargeScope] = ["read_batches"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    def iter_pages(self) -> Iterator[list[AsyncBatch]]:
+        """Iterate over pages of async batches.
+        https://developer.rechargepayments.com/2021-11/async_batch_endpoints/async_batch_endpoints_list
+        """
+        for page in self._iter_listing(self.listing()):
+            yield self._validate_list(AsyncBatch, page)
+
+    def iter_all(self) -> Iterator[AsyncBatch]:
+        """Iterate over all async batches, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/async_batch_endpoints/async_batch_endpoints_list
+        """
+        for page in self.iter_pages():
+            yield from page
 
     def list_tasks(
         self,
@@ -131,7 +155,7 @@ class AsyncBatchResource(RechargeResource):
         )
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [AsyncBatchTask.model_validate(item) for item in data]
+        return self._validate_list(AsyncBatchTask, data)
 
     def process(self, batch_id: str) -> AsyncBatch:
         """Process an async batch.
@@ -1,8 +1,9 @@
-from typing import Literal, Optional, TypedDict
+from typing import Iterator, Literal, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v2.bundle_selection import BundleSelection
+from recharge.pagination import Listing
 
 BundleSelectionListSortBy = Literal[
     "id-asc", "id-desc", "updated_at-asc", "updated_at-desc"
@@ -59,7 +60,7 @@ class BundleSelectionResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [BundleSelection.model_validate(item) for item in data]
+        return self._validate_list(BundleSelection, data)
 
     def list_all(self) -> list[BundleSelection]:
         """List all bundle selections.
@@ -71,7 +72,30 @@ class BundleSelectionResource(RechargeResource):
         data = self._paginate(self._url)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [BundleSelection.model_validate(item) for item in data]
+        return self._validate_list(BundleSelection, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    def iter_pages(self) -> Iterator[list[BundleSelection]]:
+        """Iterate over pages of bundle selections.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        for page in self._iter_listing(self.listing()):
+            yield self._validate_list(BundleSelection, page)
+
+    def iter_all(self) -> Iterator[BundleSelection]:
+        """Iterate over all bundle selections, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/bundle_selections/bundle_selections_list
+        """
+        for page in self.iter_pages():
+            yield from page
 
     def get(self, bundle_selection_id: str) -> BundleSelection:
         """Get a bundle selection.
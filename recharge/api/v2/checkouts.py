@@ -2,6 +2,7 @@ from typing import Literal, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
 from recharge.model.v2.checkout import (
     Checkout,
     CheckoutShippingRate,
@@ -255,7 +256,7 @@ class CheckoutResource(RechargeResource):
         data = self._http_get(url, expected=list, response_key="shipping_rates")
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [CheckoutShippingRate.model_validate(item) for item in data]
+        return validate_list(CheckoutShippingRate, data)
 
     def process(self, checkout_id: str, body: CheckoutProcessBody) -> Checkout:
         """Process (charge) a checkout.
@@ -1,12 +1,14 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
 from recharge.model.v2.collection import (
     Collection,
     CollectionProduct,
     CollectionSortOrder,
 )
+from recharge.pagination import Listing
 
 
 class CollectionCreateBodyOptional(TypedDict, total=False):
@@ -120,7 +122,7 @@ class CollectionResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Collection.model_validate(item) for item in data]
+        return self._validate_list(Collection, data)
 
     def list_all(self, query: Optional[CollectionListQuery] = None) -> list[Collection]:
         """List all collections.
@@ -132,7 +134,34 @@ class CollectionResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Collection.model_validate(item) for item in data]
+        return self._validate_list(Collection, data)
+
+    def listing(self, query: Optional[CollectionListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[CollectionListQuery] = None
+    ) -> Iterator[list[Collection]]:
+        """Iterate over pages of collections.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Collection, page)
+
+    def iter_all(
+        self, query: Optional[CollectionListQuery] = None
+    ) -> Iterator[Collection]:
+        """Iterate over all collections, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/collections/collections_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def list_products(
         self, query: Optional[CollectionListProductsQuery] = None
@@ -147,7 +176,7 @@ class CollectionResource(RechargeResource):
         data = self._http_get(url, query, list, response_key="collection_products")
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [CollectionProduct.model_validate(item) for item in data]
+        return self._validate_list(CollectionProduct, data)
 
     def add_products(
         self, collection_id: str, body: CollectionAddProductsBody
@@ -167,7 +196,7 @@ class CollectionResource(RechargeResource):
         )
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [CollectionProduct.model_validate(item) for item in data]
+        return validate_list(CollectionProduct, data)
 
     def delete_products(
         self, collection_id: str, body: CollectionDeleteProductsBody
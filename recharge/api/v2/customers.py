@@ -1,4 +1,4 @@
-from typing import Literal, Optional, TypedDict
+from typing import Iterator, Literal, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -7,6 +7,7 @@ from recharge.model.v2.customer import (
     CustomerCreditSummary,
     CustomerDeliverySchedule,
 )
+from recharge.pagination import Listing
 
 CustomerIncludes = Literal["addresses", "announcements", "gift_purchases", "metafields", "payment_methods", "punch_card_progress", "referral_info", "subscriptions"]
 
@@ -66,6 +67,7 @@ class CustomerResource(RechargeResource):
     object_list_key = "customers"
     object_dict_key = "customer"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def create(self, body: CustomerCreateBody) -> Customer:
         """Create a customer.
@@ -143,7 +145,7 @@ class CustomerResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Customer.model_validate(item) for item in data]
+        return self._validate_list(Customer, data)
 
     def list_all(self, query: Optional[CustomerListQuery] = None) -> list[Customer]:
         """List all customers.
@@ -155,7 +157,32 @@ class CustomerResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Customer.model_validate(item) for item in data]
+        return self._validate_list(Customer, data)
+
+    def listing(self, query: Optional[CustomerListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        required_scopes: list[RechargeScope] = ["read_customers"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[CustomerListQuery] = None
+    ) -> Iterator[list[Customer]]:
+        """Iterate over pages of customers.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Customer, page)
+
+    def iter_all(self, query: Optional[CustomerListQuery] = None) -> Iterator[Customer]:
+        """Iterate over all customers, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/customers/customers_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def get_delivery_schedule(
         self, customer_id: str, query: Optional[CustomerGetDeliveryScheduleQuery] = None
@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -10,6 +10,7 @@ from recharge.model.v2.discount import (
     DiscountUsageLimits,
     DiscountValueType,
 )
+from recharge.pagination import Listing
 
 
 class DiscountCreateBodyOptional(TypedDict, total=False):
@@ -66,6 +67,7 @@ class DiscountResource(RechargeResource):
     object_list_key = "discounts"
     object_dict_key = "discount"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def create(self, body: DiscountCreateBody) -> Discount:
         """Create a discount.
@@ -130,7 +132,7 @@ class DiscountResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Discount.model_validate(item) for item in data]
+        return self._validate_list(Discount, data)
 
     def list_all(self, query: Optional[DiscountListQuery] = None) -> list[Discount]:
         """List all discounts.
@@ -142,4 +144,29 @@ class DiscountResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Discount.model_validate(item) for item in data]
+        return self._validate_list(Discount, data)
+
+    def listing(self, query: Optional[DiscountListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/discounts/discounts_list
+        """
+        required_scopes: list[RechargeScope] = ["read_discounts"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[DiscountListQuery] = None
+    ) -> Iterator[list[Discount]]:
+        """Iterate over pages of discounts.
+        https://developer.rechargepayments.com/2021-11/discounts/discounts_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Discount, page)
+
+    def iter_all(self, query: Optional[DiscountListQuery] = None) -> Iterator[Discount]:
+        """Iterate over all discounts, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/discounts/discounts_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
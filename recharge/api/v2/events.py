@@ -1,8 +1,9 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
 from recharge.model.v2.event import Event
+from recharge.pagination import Listing
 
 
 class EventListQuery(TypedDict, total=False):
@@ -34,7 +35,7 @@ class EventResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Event.model_validate(event) for event in data]
+        return self._validate_list(Event, data)
 
     def list_all(self, query: Optional[EventListQuery] = None) -> list[Event]:
         """List all events.
@@ -46,4 +47,29 @@ class EventResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Event.model_validate(event) for event in data]
+        return self._validate_list(Event, data)
+
+    def listing(self, query: Optional[EventListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        required_scopes: list[RechargeScope] = ["read_events"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[EventListQuery] = None
+    ) -> Iterator[list[Event]]:
+        """Iterate over pages of events.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Event, page)
+
+    def iter_all(self, query: Optional[EventListQuery] = None) -> Iterator[Event]:
+        """Iterate over all events, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/events/events_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
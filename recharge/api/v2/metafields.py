@@ -1,4 +1,4 @@
-from typing import Literal, TypedDict
+from typing import Iterator, Literal, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -7,6 +7,7 @@ from recharge.model.v2.metafield import (
     MetafieldOwnerResource,
     MetafieldValueType,
 )
+from recharge.pagination import Listing
 
 
 class MetafieldCreateBodyOptional(TypedDict, total=False):
@@ -159,7 +160,7 @@ class MetafieldResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Metafield.model_validate(metafield) for metafield in data]
+        return self._validate_list(Metafield, data)
 
     def list_all(self, query: MetafieldListQuery) -> list[Metafield]:
         """List all metafields.
@@ -172,4 +173,28 @@ class MetafieldResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Metafield.model_validate(metafield) for metafield in data]
+        return self._validate_list(Metafield, data)
+
+    def listing(self, query: MetafieldListQuery) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        resource = query["owner_resource"]
+        required_scopes: list[RechargeScope] = [resource_scope(resource, "read")]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(self, query: MetafieldListQuery) -> Iterator[list[Metafield]]:
+        """Iterate over pages of metafields.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Metafield, page)
+
+    def iter_all(self, query: MetafieldListQuery) -> Iterator[Metafield]:
+        """Iterate over all metafields, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/metafields/metafields_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -8,6 +8,7 @@ from recharge.model.v2.onetime import (
     OnetimeExternalVariantId,
     OnetimeProperty,
 )
+from recharge.pagination import Listing
 
 
 class OnetimeCreateBodyOptional(TypedDict, total=False):
@@ -65,6 +66,7 @@ class OnetimeResource(RechargeResource):
     object_list_key = "onetimes"
     object_dict_key = "onetime"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def create(self, body: OnetimeCreateBody) -> Onetime:
         """Create a Onetime
@@ -129,7 +131,7 @@ class OnetimeResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Onetime.model_validate(item) for item in data]
+        return self._validate_list(Onetime, data)
 
     def list_all(self, query: Optional[OnetimeListQuery] = None) -> list[Onetime]:
         """List all onetimes.
@@ -141,4 +143,29 @@ class OnetimeResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Onetime.model_validate(item) for item in data]
+        return self._validate_list(Onetime, data)
+
+    def listing(self, query: Optional[OnetimeListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/onetimes/onetimes_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[OnetimeListQuery] = None
+    ) -> Iterator[list[Onetime]]:
+        """Iterate over pages of onetimes.
+        https://developer.rechargepayments.com/2021-11/onetimes/onetimes_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Onetime, page)
+
+    def iter_all(self, query: Optional[OnetimeListQuery] = None) -> Iterator[Onetime]:
+        """Iterate over all onetimes, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/onetimes/onetimes_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
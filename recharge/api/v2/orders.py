@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -12,6 +12,7 @@ from recharge.model.v2.order import (
     OrderStatus,
     OrderType,
 )
+from recharge.pagination import Listing
 
 
 class OrderCloneBody(TypedDict, total=False):
@@ -57,6 +58,7 @@ class OrderResource(RechargeResource):
     object_list_key = "orders"
     object_dict_key = "order"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def get(self, order_id: str) -> Order:
         """Get an order.
@@ -137,7 +139,7 @@ class OrderResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Order.model_validate(order) for order in data]
+        return self._validate_list(Order, data)
 
     def list_all(self, query: Optional[OrderListQuery] = None) -> list[Order]:
         """List all orders.
@@ -149,4 +151,29 @@ class OrderResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Order.model_validate(order) for order in data]
+        return self._validate_list(Order, data)
+
+    def listing(self, query: Optional[OrderListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/orders/orders_list
+        """
+        required_scopes: list[RechargeScope] = ["read_orders"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[OrderListQuery] = None
+    ) -> Iterator[list[Order]]:
+        """Iterate over pages of orders.
+        https://developer.rechargepayments.com/2021-11/orders/orders_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Order, page)
+
+    def iter_all(self, query: Optional[OrderListQuery] = None) -> Iterator[Order]:
+        """Iterate over all orders, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/orders/orders_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
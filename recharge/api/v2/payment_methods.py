@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -8,6 +8,7 @@ from recharge.model.v2.payment_method import (
     PaymentMethodProcessorName,
     PaymentMethodType,
 )
+from recharge.pagination import Listing
 
 
 class PaymentMethodCreateBodyOptional(TypedDict, total=False):
@@ -114,7 +115,7 @@ class PaymentMethodResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [PaymentMethod.model_validate(item) for item in data]
+        return self._validate_list(PaymentMethod, data)
 
     def list_all(
         self, query: Optional[PaymentMethodListQuery] = None
@@ -128,4 +129,31 @@ class PaymentMethodResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [PaymentMethod.model_validate(item) for item in data]
+        return self._validate_list(PaymentMethod, data)
+
+    def listing(self, query: Optional[PaymentMethodListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        required_scopes: list[RechargeScope] = ["read_payment_methods"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[PaymentMethodListQuery] = None
+    ) -> Iterator[list[PaymentMethod]]:
+        """Iterate over pages of payment methods.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(PaymentMethod, page)
+
+    def iter_all(
+        self, query: Optional[PaymentMethodListQuery] = None
+    ) -> Iterator[PaymentMethod]:
+        """Iterate over all payment methods, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/payment_methods/payment_methods_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
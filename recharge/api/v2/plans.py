@@ -1,7 +1,8 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
 from recharge.model.v2.plan import (
     Plan,
     PlanChannelSettings,
@@ -10,6 +11,7 @@ from recharge.model.v2.plan import (
     PlanSubscriptionPreferences,
     PlanType,
 )
+from recharge.pagination import Listing
 
 
 class PlanCreateBodyOptional(TypedDict, total=False):
@@ -70,6 +72,7 @@ class PlanResource(RechargeResource):
     object_list_key = "plans"
     object_dict_key = "plan"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def create(self, body: PlanCreateBody) -> Plan:
         """Create a plan.
@@ -119,7 +122,7 @@ class PlanResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Plan.model_validate(item) for item in data]
+        return self._validate_list(Plan, data)
 
     def list_all(self, query: Optional[PlanListQuery] = None) -> list[Plan]:
         """List all plans.
@@ -131,7 +134,30 @@ class PlanResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Plan.model_validate(item) for item in data]
+        return self._validate_list(Plan, data)
+
+    def listing(self, query: Optional[PlanListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(self, query: Optional[PlanListQuery] = None) -> Iterator[list[Plan]]:
+        """Iterate over pages of plans.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Plan, page)
+
+    def iter_all(self, query: Optional[PlanListQuery] = None) -> Iterator[Plan]:
+        """Iterate over all plans, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/plans/plans_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def bulk_create(
         self, external_product_id: str, body: PlanBulkCreateBody
@@ -148,7 +174,7 @@ class PlanResource(RechargeResource):
         data = self._http_post(url, body, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Plan.model_validate(item) for item in data]
+        return validate_list(Plan, data)
 
     def bulk_update(
         self, external_product_id: str, body: PlanBulkUpdateBody
@@ -165,7 +191,7 @@ class PlanResource(RechargeResource):
         data = self._http_put(url, body, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Plan.model_validate(item) for item in data]
+        return validate_list(Plan, data)
 
     def bulk_delete(self, external_product_id: str, body: PlanBulkDeleteBody) -> dict:
         """Bulk delete plans.
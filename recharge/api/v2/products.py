@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -9,6 +9,7 @@ from recharge.model.v2.product import (
     ProductOption,
     ProductVariant,
 )
+from recharge.pagination import Listing
 
 
 class ProductCreateBodyOptional(TypedDict, total=False):
@@ -118,7 +119,7 @@ class ProductResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Product.model_validate(item) for item in data]
+        return self._validate_list(Product, data)
 
     def list_all(self, query: Optional[ProductListQuery] = None) -> list[Product]:
         """List all products.
@@ -130,4 +131,29 @@ class ProductResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Product.model_validate(item) for item in data]
+        return self._validate_list(Product, data)
+
+    def listing(self, query: Optional[ProductListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        required_scopes: list[RechargeScope] = ["read_products"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[ProductListQuery] = None
+    ) -> Iterator[list[Product]]:
+        """Iterate over pages of products.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Product, page)
+
+    def iter_all(self, query: Optional[ProductListQuery] = None) -> Iterator[Product]:
+        """Iterate over all products, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/products/products_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Iterator, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
@@ -7,6 +7,7 @@ from recharge.model.v2.retention_strategy import (
     RetentionStrategyCancellationFlowType,
     RetentionStrategyIncentiveType,
 )
+from recharge.pagination import Listing
 
 
 class RetentionStrategyCreateBodyOptional(TypedDict, total=False):
@@ -106,7 +107,7 @@ class RetentionStrategyResource(RechargeResource):
         data = self._http_get(self._url, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [RetentionStrategy.model_validate(item) for item in data]
+        return self._validate_list(RetentionStrategy, data)
 
     def list_all(self) -> list[RetentionStrategy]:
         """List all retention strategies.
@@ -118,4 +119,27 @@ class RetentionStrategyResource(RechargeResource):
         data = self._paginate(self._url)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [RetentionStrategy.model_validate(item) for item in data]
+        return self._validate_list(RetentionStrategy, data)
+
+    def listing(self) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url)
+
+    def iter_pages(self) -> Iterator[list[RetentionStrategy]]:
+        """Iterate over pages of retention strategies.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        for page in self._iter_listing(self.listing()):
+            yield self._validate_list(RetentionStrategy, page)
+
+    def iter_all(self) -> Iterator[RetentionStrategy]:
+        """Iterate over all retention strategies, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/retention_strategies/retention_strategies_list
+        """
+        for page in self.iter_pages():
+            yield from page
@@ -1,7 +1,8 @@
-from typing import Optional, TypedDict
+from typing import Iterator, Optional, TypedDict
 
 from recharge.api import RechargeResource, RechargeScope, RechargeVersion
 from recharge.exceptions import RechargeAPIError
+from recharge.model.base import validate_list
 from recharge.model.v2.onetime import Onetime
 from recharge.model.v2.subscription import (
     Subscription,
@@ -11,6 +12,7 @@ from recharge.model.v2.subscription import (
     SubscriptionProperty,
     SubscriptionStatus,
 )
+from recharge.pagination import Listing
 
 
 class SubscriptionCreateBodyOptional(TypedDict, total=False):
@@ -125,6 +127,7 @@ class SubscriptionResource(RechargeResource):
     object_list_key = "subscriptions"
     object_dict_key = "subscription"
     recharge_version: RechargeVersion = "2021-11"
+    ids_filter = True
 
     def create(self, body: SubscriptionCreateBody) -> Subscription:
         """Create a subscription.
@@ -197,7 +200,7 @@ class SubscriptionResource(RechargeResource):
         data = self._http_get(self._url, query, expected=list)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return self._validate_list(Subscription, data)
 
     def list_all(
         self, query: Optional[SubscriptionListQuery] = None
@@ -211,7 +214,34 @@ class SubscriptionResource(RechargeResource):
         data = self._paginate(self._url, query)
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Subscription.model_validate(item) for item in data]
+        return self._validate_list(Subscription, data)
+
+    def listing(self, query: Optional[SubscriptionListQuery] = None) -> Listing:
+        """The listing :meth:`iter_pages` pages through, after checking the scopes.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        required_scopes: list[RechargeScope] = ["read_subscriptions"]
+        self._check_scopes(f"GET /{self.object_list_key}", required_scopes)
+
+        return self._listing(self._url, query)
+
+    def iter_pages(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> Iterator[list[Subscription]]:
+        """Iterate over pages of subscriptions.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        for page in self._iter_listing(self.listing(query)):
+            yield self._validate_list(Subscription, page)
+
+    def iter_all(
+        self, query: Optional[SubscriptionListQuery] = None
+    ) -> Iterator[Subscription]:
+        """Iterate over all subscriptions, fetching one page at a time.
+        https://developer.rechargepayments.com/2021-11/subscriptions/subscriptions_list
+        """
+        for page in self.iter_pages(query):
+            yield from page
 
     def change_date(
         self, subscription_id: str, body: SubscriptionChangeDateBody
@@ -292,4 +322,4 @@ class SubscriptionResource(RechargeResource):
         data = self._http_post(url, body, expected=list, response_key="onetimes")
         if not isinstance(data, list):
             raise RechargeAPIError(f"Expected list, got {type(data).__name__}")
-        return [Onetime.model_validate(item) for item in data]
+        return validate_list(Onetime, data)
@@ -0,0 +1,306 @@
+"""
+Columnar export of list results to Arrow record batches and Parquet.
+
+Pages are taken from the listing a resource's ``iter_pages`` pages through
+(see its ``listing`` method) as decoded dicts, without building models, and
+converted straight into ``pyarrow.RecordBatch`` objects whose schema is
+derived from the resource's model. Requires pyarrow
+(``pip install recharge-api[arrow]``).
+"""
+
+import json
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import BaseModel
+
+from recharge.model.base import _UNION_TYPES
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# String fields holding amounts of money; exported as decimals instead of text.
+MONEY_FIELDS = frozenset(
+    {
+        "amount",
+        "compare_at_price",
+        "discount_amount",
+        "order_subtotal",
+        "original_price",
+        "price",
+        "subtotal_price",
+        "tax_due",
+        "taxable_amount",
+        "total_available_balance",
+        "total_discounts",
+        "total_duties",
+        "total_line_items_price",
+        "total_price",
+        "total_refunds",
+        "total_tax",
+        "unit_price",
+    }
+)
+
+# Four decimal places hold the minor unit of every ISO 4217 currency.
+MONEY_PRECISION = 19
+MONEY_SCALE = 4
+
+# How a field's decoded value is converted before it is handed to pyarrow.
+_Conversion = Literal["money", "json", "text_list", "model", "model_list"]
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "recharge.arrow requires pyarrow: pip install recharge-api[arrow]"
+        ) from exc
+    return pyarrow
+
+
+def _strip_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in _UNION_TYPES:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _is_text(annotation: Any) -> bool:
+    return annotation is str or (
+        get_origin(annotation) is Literal
+        and all(isinstance(arg, str) for arg in get_args(annotation))
+    )
+
+
+def _arrow_type(name: Optional[str], annotation: Any) -> "pa.DataType":
+    pa = _pyarrow()
+    annotation = _strip_optional(annotation)
+    if _is_model(annotation):
+        return pa.struct(list(arrow_schema(annotation)))
+    if get_origin(annotation) is list:
+        (item,) = get_args(annotation) or (Any,)
+        return pa.list_(_arrow_type(None, item))
+    if annotation is str and name in MONEY_FIELDS:
+        return pa.decimal128(MONEY_PRECISION, MONEY_SCALE)
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    # Text, plus anything without a fixed shape (Any, dict, mixed unions) as JSON.
+    return pa.string()
+
+
+@lru_cache(maxsize=None)
+def arrow_schema(model: type[BaseModel]) -> "pa.Schema":
+    """The Arrow schema for ``model``: one nullable column per declared field.
+
+    Nested models become structs, lists become list columns, money fields
+    (:data:`MONEY_FIELDS`) become ``decimal128`` and fields without a fixed
+    shape (``Any``, ``dict``, mixed unions) hold JSON text.
+    """
+    pa = _pyarrow()
+    return pa.schema(
+        [
+            pa.field(name, _arrow_type(name, info.annotation))
+            for name, info in model.model_fields.items()
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def _conversions(model: type[BaseModel]) -> tuple[tuple[str, _Conversion, Any], ...]:
+    """Fields whose decoded values pyarrow cannot take as they are."""
+    conversions: list[tuple[str, _Conversion, Any]] = []
+    for name, info in model.model_fields.items():
+        annotation = _strip_optional(info.annotation)
+        item = (get_args(annotation) or (Any,))[0] if get_origin(annotation) is list else None
+        if _is_model(annotation):
+            if _conversions(annotation):
+                conversions.append((name, "model", annotation))
+        elif item is not None and _is_model(item):
+            if _conversions(item):
+                conversions.append((name, "model_list", item))
+        elif item is not None:
+            if not _is_text(item):
+                conversions.append((name, "text_list", None))
+        elif annotation is str and name in MONEY_FIELDS:
+            conversions.append((name, "money", None))
+        elif not (_is_text(annotation) or annotation in (bool, int, float)):
+            conversions.append((name, "json", None))
+    return tuple(conversions)
+
+
+def _as_text(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _money(model: type[BaseModel], name: str, value: Any) -> Optional[Decimal]:
+    if value == "":
+        return None
+    try:
+        return Decimal(value)
+    except (InvalidOperation, TypeError, ValueError) as exc:
+        raise ValueError(
+            f"Cannot convert {model.__name__}.{name} {value!r} to a decimal amount"
+        ) from exc
+
+
+def _convert(model: type[BaseModel], record: dict) -> dict:
+    for name, conversion, nested in _conversions(model):
+        value = record.get(name)
+        if value is None:
+            continue
+        if conversion == "money":
+            record[name] = _money(model, name, value)
+        elif conversion == "json":
+            record[name] = _as_text(value)
+        elif conversion == "text_list":
+            record[name] = [_as_text(item) for item in value]
+        elif conversion == "model":
+            _convert(nested, value)
+        else:
+            for item in value:
+                if isinstance(item, dict):
+                    _convert(nested, item)
+    return record
+
+
+def record_batch(model: type[BaseModel], records: list[dict]) -> "pa.RecordBatch":
+    """Convert one page of decoded records into a record batch with ``arrow_schema(model)``.
+
+    Values are taken as decoded, the same trust level as ``validation="none"``:
+    undeclared keys are ignored, money strings are parsed as ``Decimal``
+    (``""`` becomes null) and the records are modified in place. A value that
+    does not fit its column raises ``ValueError`` naming the field and record.
+    """
+    pa = _pyarrow()
+    schema = arrow_schema(model)
+    rows = [_convert(model, record) for record in records]
+    try:
+        return pa.RecordBatch.from_pylist(rows, schema=schema)
+    except pa.ArrowException as exc:
+        raise ValueError(_conversion_error(model, schema, rows, exc)) from exc
+
+
+def _conversion_error(
+    model: type[BaseModel], schema: "pa.Schema", rows: list[dict], exc: Exception
+) -> str:
+    """Find the field and record pyarrow could not convert; only runs once a page has failed."""
+    pa = _pyarrow()
+    for field in schema:
+        for row in rows:
+            value = row.get(field.name)
+            try:
+                pa.array([value], type=field.type)
+            except pa.ArrowException as error:
+                return (
+                    f"Cannot convert {model.__name__}.{field.name} of record "
+                    f"{row.get('id')!r} to {field.type}: {error}"
+                )
+    return f"Cannot convert {model.__name__} records to Arrow: {exc}"
+
+
+def record_batches(
+    model: type[BaseModel], pages: Iterable[list[dict]]
+) -> Iterator["pa.RecordBatch"]:
+    """Convert decoded pages into record batches one page at a time."""
+    for page in pages:
+        yield record_batch(model, page)
+
+
+def resource_model(resource: Any) -> type[BaseModel]:
+    """The model a resource lists, read from its ``iter_pages`` return annotation."""
+    hints = get_type_hints(type(resource).iter_pages)
+    (page,) = get_args(hints["return"])
+    (model,) = get_args(page)
+    return model
+
+
+def _raw_pages(resource: Any, query: Optional[Mapping[str, Any]], args: Sequence[Any]) -> Any:
+    listing = resource.listing(*args) if query is None else resource.listing(*args, query)
+    return resource._client.iter_pages(
+        listing.url, listing.query, listing.response_key, listing.version
+    )
+
+
+def iter_record_batches(
+    resource: Any, query: Optional[Mapping[str, Any]] = None, args: Sequence[Any] = ()
+) -> Iterator["pa.RecordBatch"]:
+    """Stream a resource's listing as one record batch per page, without building models.
+
+    Works with any resource that has ``iter_pages``; ``args`` carries what
+    comes before the query, such as the customer id of v1 addresses. Only
+    one page is held in memory at a time.
+    """
+    model = resource_model(resource)
+    for page in _raw_pages(resource, query, args):
+        yield record_batch(model, page)
+
+
+async def aiter_record_batches(
+    resource: Any, query: Optional[Mapping[str, Any]] = None, args: Sequence[Any] = ()
+) -> AsyncIterator["pa.RecordBatch"]:
+    """Async counterpart of :func:`iter_record_batches` for async resources."""
+    model = resource_model(resource)
+    async for page in _raw_pages(resource, query, args):
+        yield record_batch(model, page)
+
+
+def to_table(
+    resource: Any, query: Optional[Mapping[str, Any]] = None, args: Sequence[Any] = ()
+) -> "pa.Table":
+    """Fetch a resource's whole listing into a ``pyarrow.Table``."""
+    pa = _pyarrow()
+    return pa.Table.from_batches(
+        iter_record_batches(resource, query, args),
+        schema=arrow_schema(resource_model(resource)),
+    )
+
+
+def write_parquet(
+    resource: Any,
+    where: Any,
+    query: Optional[Mapping[str, Any]] = None,
+    args: Sequence[Any] = (),
+    **options: Any,
+) -> int:
+    """Stream a resource's listing into a Parquet file, one row group per page.
+
+    ``where`` is a path or writable file object and ``options`` are passed to
+    ``pyarrow.parquet.ParquetWriter`` (e.g. ``compression="zstd"``). Returns
+    the number of rows written.
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    rows = 0
+    with pq.ParquetWriter(where, arrow_schema(resource_model(resource)), **options) as writer:
+        for batch in iter_record_batches(resource, query, args):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
@@ -0,0 +1,399 @@
+"""
+Response caching for read-mostly endpoints.
+
+A cache sits between the resources and the client's ``_send``. GET requests
+to a path whose first segment has a TTL (``/store``, ``/plans``, ...) are
+answered from the cache while the entry is fresh; anything else goes to the
+API as usual. Entries keep the response body as the bytes it arrived as,
+not the decoded JSON, so they are small and every hit decodes a private copy
+callers are free to mutate. Entries are kept apart per access token, so
+clients of different stores can share one cache. A successful POST, PUT or
+DELETE drops the cached entries of its path segment, so a client sees its
+own writes.
+"""
+
+import abc
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Optional, Protocol, runtime_checkable
+from urllib.parse import urlencode, urlparse
+
+from recharge.transport import HttpResponse
+
+# Seconds a response stays fresh, by first path segment (the resource's object_list_key).
+DEFAULT_TTLS: Mapping[str, float] = {
+    "store": 3600,
+    "shop": 3600,
+    "accounts": 600,
+    "retention_strategies": 600,
+    "plans": 300,
+    "products": 300,
+    "webhooks": 300,
+}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored 2xx response; satisfies :class:`~recharge.transport.HttpResponse`."""
+
+    status_code: int
+    body: bytes
+    url: str
+    links: dict = field(default_factory=dict)
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_response(cls, response: HttpResponse) -> "CachedResponse":
+        return cls(
+            response.status_code,
+            response.text.encode("utf-8"),
+            str(response.url),
+            dict(getattr(response, "links", None) or {}),
+        )
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    entries: int
+    size: int  # bytes of cached bodies
+
+
+@runtime_checkable
+class ResponseCache(Protocol):
+    """A response cache; ``namespace`` keeps different access tokens' entries apart."""
+
+    def lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[str],
+        namespace: str = "",
+    ) -> Optional[HttpResponse]: ...
+    def store(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[str],
+        response: HttpResponse,
+        namespace: str = "",
+    ) -> None: ...
+    def invalidate(self, url: str) -> None: ...
+
+
+def token_namespace(access_token: str) -> str:
+    """The cache namespace of an access token: a hash of it, so the token itself is never stored."""
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()[:32]
+
+
+def _segment(url: str) -> str:
+    return urlparse(url).path.strip("/").split("/", 1)[0]
+
+
+class BaseResponseCache(abc.ABC):
+    """Keys, TTLs and hit/miss counters shared by the cache backends.
+
+    ``ttls`` maps a path segment to the seconds its responses stay fresh;
+    segments without an entry are not cached. Backends implement
+    ``_get``, ``_set`` and ``_drop``.
+    """
+
+    def __init__(self, ttls: Mapping[str, float] = DEFAULT_TTLS) -> None:
+        self.ttls = dict(ttls)
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[str],
+        namespace: str = "",
+    ) -> str:
+        # The segment leads the key so invalidate() can drop a segment, for
+        # every namespace, by prefix.
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return f"{_segment(url)} {namespace} {method} {version or ''} {url}?{query}"
+
+    def lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[str],
+        namespace: str = "",
+    ) -> Optional[CachedResponse]:
+        if self.ttls.get(_segment(url)) is None:
+            return None
+        entry = self._get(self.key(method, url, params, version, namespace))
+        with self._counter_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def store(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[str],
+        response: HttpResponse,
+        namespace: str = "",
+    ) -> None:
+        ttl = self.ttls.get(_segment(url))
+        if ttl is not None and ttl > 0 and 200 <= response.status_code < 300:
+            entry = CachedResponse.from_response(response)
+            self._set(self.key(method, url, params, version, namespace), entry, ttl)
+
+    def invalidate(self, url: str) -> None:
+        segment = _segment(url)
+        if segment in self.ttls:
+            self._drop(f"{segment} ")
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        """The fresh entry stored under ``key``, or None."""
+
+    @abc.abstractmethod
+    def _set(self, key: str, entry: CachedResponse, ttl: float) -> None:
+        """Store ``entry`` under ``key`` for ``ttl`` seconds."""
+
+    @abc.abstractmethod
+    def _drop(self, prefix: str) -> None:
+        """Remove every entry whose key starts with ``prefix`` (all of them for ``""``)."""
+
+    def clear(self) -> None:
+        self._drop("")
+
+
+class MemoryResponseCache(BaseResponseCache):
+    """In-process LRU cache holding at most ``max_size`` bytes of response bodies.
+
+    Safe to share between threads and between sync and async clients.
+    """
+
+    def __init__(
+        self, ttls: Mapping[str, float] = DEFAULT_TTLS, max_size: int = 32 * 2**20
+    ) -> None:
+        super().__init__(ttls)
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple[CachedResponse, float]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            entry, expires = item
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: CachedResponse, ttl: float) -> None:
+        if len(entry.body) > self.max_size:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (entry, time.monotonic() + ttl)
+            self._size += len(entry.body)
+            while self._size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        # Called with the lock held.
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._size -= len(item[0].body)
+
+    def _drop(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._remove(key)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, len(self._entries), self._size)
+
+
+class SQLiteResponseCache(BaseResponseCache):
+    """Cache in a SQLite file shared by every process on a host, surviving restarts.
+
+    Bodies are stored zlib-compressed. Expiry uses wall-clock time, because
+    entries outlive the process that wrote them. Once the compressed bodies
+    exceed ``max_size`` bytes, expired entries are purged and then the least
+    recently read ones are evicted. Every write is a short
+    ``BEGIN IMMEDIATE`` transaction, as in ``SQLiteRateLimiter``. Hit and
+    miss counters are per instance; ``stats()`` reads the entry count and
+    size from the file.
+    """
+
+    # Seconds between recording reads of one entry; a hit is then usually
+    # a plain read, which does not queue behind other processes' writes.
+    touch_interval = 60.0
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        max_size: int = 256 * 2**20,
+        compress_level: int = 6,
+        clock: Callable[[], float] = time.time,
+        timeout: float = 30.0,
+    ) -> None:
+        super().__init__(ttls)
+        self.path = path
+        self.max_size = max_size
+        self.compress_level = compress_level
+        self.clock = clock
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread and per process, as in SQLiteRateLimiter.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS recharge_response_cache ("
+            "key TEXT PRIMARY KEY, status INTEGER NOT NULL, url TEXT NOT NULL, "
+            "links TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS recharge_response_cache_accessed "
+            "ON recharge_response_cache (accessed)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _transaction(self, apply: Callable[[sqlite3.Connection], None]) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            apply(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _get(self, key: str) -> Optional[CachedResponse]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT status, url, links, body, expires, accessed "
+            "FROM recharge_response_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        now = self.clock()
+        if row[4] <= now:
+            conn.execute(
+                "DELETE FROM recharge_response_cache WHERE key = ? AND expires <= ?", (key, now)
+            )
+            return None
+        if row[5] <= now - self.touch_interval:
+            conn.execute(
+                "UPDATE recharge_response_cache SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return CachedResponse(row[0], zlib.decompress(row[3]), row[1], json.loads(row[2]))
+
+    def _set(self, key: str, entry: CachedResponse, ttl: float) -> None:
+        body = zlib.compress(entry.body, self.compress_level)
+        if len(body) > self.max_size:
+            return
+
+        def apply(conn: sqlite3.Connection) -> None:
+            now = self.clock()
+            conn.execute(
+                "INSERT OR REPLACE INTO recharge_response_cache "
+                "(key, status, url, links, body, size, expires, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    entry.url,
+                    json.dumps(entry.links),
+                    body,
+                    len(body),
+                    now + ttl,
+                    now,
+                ),
+            )
+            self._evict(conn, now)
+
+        self._transaction(apply)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        total_size = "SELECT COALESCE(SUM(size), 0) FROM recharge_response_cache"
+        total = conn.execute(total_size).fetchone()[0]
+        if total <= self.max_size:
+            return
+        conn.execute("DELETE FROM recharge_response_cache WHERE expires <= ?", (now,))
+        total = conn.execute(total_size).fetchone()[0]
+        evicted = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM recharge_response_cache ORDER BY accessed"
+        ):
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM recharge_response_cache WHERE key = ?", evicted)
+
+    def _drop(self, prefix: str) -> None:
+        def apply(conn: sqlite3.Connection) -> None:
+            if not prefix:
+                conn.execute("DELETE FROM recharge_response_cache")
+                return
+            # Keys starting with ``prefix`` sort between it and its successor.
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            conn.execute(
+                "DELETE FROM recharge_response_cache WHERE key >= ? AND key < ?", (prefix, upper)
+            )
+
+        self._transaction(apply)
+
+    def stats(self) -> CacheStats:
+        entries, size = (
+            self._connection()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM recharge_response_cache")
+            .fetchone()
+        )
+        return CacheStats(self.hits, self.misses, entries, size)
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
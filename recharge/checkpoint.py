@@ -0,0 +1,196 @@
+"""
+Checkpoint stores that let an interrupted ``paginate``/``list_all`` pick up where it stopped.
+
+After every page the client saves the page's records and the URL of the next
+page under a key (by default the listing's first-page URL). A later call
+with the same store and key loads what was saved, fetches only the
+remaining pages and clears the key once the listing is complete.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Protocol, runtime_checkable
+
+from recharge.pagination import Page
+
+
+@dataclass
+class PaginationState:
+    """Records of the pages fetched so far and the URL of the next page (``None`` when done)."""
+
+    next_url: Optional[str]
+    records: list = field(default_factory=list)
+
+
+@runtime_checkable
+class CheckpointStore(Protocol):
+    def load(self, key: str) -> Optional[PaginationState]: ...
+    def save(self, key: str, page: Page) -> None: ...
+    def clear(self, key: str) -> None: ...
+
+
+class MemoryCheckpointStore:
+    """Keeps checkpoints in the process: survives failed calls, not restarts."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, PaginationState] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[PaginationState]:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return None
+            return PaginationState(state.next_url, list(state.records))
+
+    def save(self, key: str, page: Page) -> None:
+        with self._lock:
+            state = self._states.setdefault(key, PaginationState(None))
+            state.records.extend(page.records)
+            state.next_url = page.next_url
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileCheckpointStore:
+    """One append-only JSON-lines file per key in ``directory``, one line per page.
+
+    Files are named after the SHA-256 of the key, since keys are listing URLs
+    that can exceed the file name limit; each line carries the key itself.
+    Each line is flushed and fsynced before ``save`` returns. A line cut short
+    by a crash is dropped on load, so the page it belonged to is fetched again.
+    """
+
+    def __init__(self, directory: str, fsync: bool = True) -> None:
+        self.directory = directory
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.jsonl")
+
+    def load(self, key: str) -> Optional[PaginationState]:
+        try:
+            with open(self._path(key), "rb+") as file:
+                data = file.read()
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    file.truncate(complete)  # drop a line cut short by a crash
+        except FileNotFoundError:
+            return None
+        state = None
+        for line in data[:complete].splitlines():
+            entry = json.loads(line)
+            if entry.get("key") != key:
+                continue
+            state = state or PaginationState(None)
+            state.records.extend(entry["records"])
+            state.next_url = entry["next_url"]
+        return state
+
+    def save(self, key: str, page: Page) -> None:
+        line = json.dumps({"key": key, "next_url": page.next_url, "records": page.records})
+        with open(self._path(key), "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+
+    def clear(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteCheckpointStore:
+    """Checkpoints in a SQLite file, one row per page; safe to share between processes.
+
+    Each page is written in its own transaction together with the next URL,
+    so a crash never leaves the records and the position out of step.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread and per process, as in SQLiteRateLimiter.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS recharge_pagination ("
+            "key TEXT PRIMARY KEY, next_url TEXT, pages INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS recharge_pagination_pages ("
+            "key TEXT NOT NULL, page INTEGER NOT NULL, records TEXT NOT NULL, "
+            "PRIMARY KEY (key, page))"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def load(self, key: str) -> Optional[PaginationState]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT next_url FROM recharge_pagination WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        state = PaginationState(row[0])
+        for (records,) in conn.execute(
+            "SELECT records FROM recharge_pagination_pages WHERE key = ? ORDER BY page", (key,)
+        ):
+            state.records.extend(json.loads(records))
+        return state
+
+    def save(self, key: str, page: Page) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT pages FROM recharge_pagination WHERE key = ?", (key,)
+            ).fetchone()
+            number = row[0] if row else 0
+            conn.execute(
+                "INSERT INTO recharge_pagination_pages (key, page, records) VALUES (?, ?, ?)",
+                (key, number, json.dumps(page.records)),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO recharge_pagination (key, next_url, pages) "
+                "VALUES (?, ?, ?)",
+                (key, page.next_url, number + 1),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self, key: str) -> None:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM recharge_pagination_pages WHERE key = ?", (key,))
+            conn.execute("DELETE FROM recharge_pagination WHERE key = ?", (key,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
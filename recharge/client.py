@@ -1,15 +1,26 @@
+import asyncio
 import json
 import logging
 import time
-from typing import Any, Mapping, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, Mapping, Optional, Union
 
 from requests.exceptions import HTTPError, JSONDecodeError, RequestException
 
+from recharge.cache import ResponseCache, token_namespace
+from recharge.checkpoint import CheckpointStore
 from recharge.exceptions import RechargeAPIError, RechargeHTTPError, RechargeRequestException
-from recharge.pagination import get_next_page_url
-from recharge.retry import ExponentialBackoffRetry, RetryStrategy
-from recharge.transport import HttpResponse, HttpTransport, RequestsTransport
-from recharge.types import RechargeScope, RechargeVersion
+from recharge.pagination import Page, listing_url, next_page_url, page_base, page_queries
+from recharge.ratelimit import RateLimiter
+from recharge.retry import ExponentialBackoffRetry, RetryStrategy, takes_response
+from recharge.transport import (
+    AsyncHttpTransport,
+    HttpResponse,
+    HttpTransport,
+    HttpxTransport,
+    RequestsTransport,
+)
+from recharge.types import RechargeScope, RechargeVersion, ValidationMode
 
 REDACTED_HEADERS = {"X-Recharge-Access-Token", "Cookie"}
 
@@ -40,63 +51,210 @@ def _create_default_logger(level: int) -> logging.Logger:
     return logger
 
 
-class RechargeClient:
+class BaseRechargeClient:
+    """Shared header, logging and response-decoding logic for the sync and async clients."""
+
     base_url = "https://api.rechargeapps.com"
 
     def __init__(
         self,
         access_token: str,
-        transport: Optional[HttpTransport] = None,
         retry_strategy: Optional[RetryStrategy] = None,
         logger: Optional[logging.Logger] = None,
         logging_level: int = logging.DEBUG,
+        rate_limiter: Optional[RateLimiter] = None,
+        validation: ValidationMode = "full",
+        compact: bool = False,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         self._base_headers: dict[str, str] = {
             "Accept": "application/json",
             "Content-Type": "application/json",
             "X-Recharge-Access-Token": access_token,
         }
-        self._transport = transport or RequestsTransport()
         self._retry_strategy = retry_strategy or ExponentialBackoffRetry()
+        self._delay_takes_response = takes_response(self._retry_strategy)
         self._logger = logger or _create_default_logger(logging_level)
+        self._rate_limiter = rate_limiter
         self._version: Optional[RechargeVersion] = None
+        self.validation: ValidationMode = validation
+        self.compact = compact
+        self._cache = cache
+        self._cache_namespace = token_namespace(access_token)
+
+    def _retry_delay(
+        self, attempt: int, response: Optional[HttpResponse] = None, elapsed: float = 0.0
+    ) -> float:
+        if self._delay_takes_response:
+            return self._retry_strategy.delay_for(attempt, response=response, elapsed=elapsed)
+        return self._retry_strategy.delay_for(attempt)
+
+    @property
+    def _page_retries(self) -> int:
+        # Transport errors are retried only for page requests, which are safe
+        # to repeat, and as often as the retry strategy retries status codes.
+        return getattr(self._retry_strategy, "max_retries", 0)
 
-    def set_version(self, version: RechargeVersion) -> "RechargeClient":
+    def set_version(self, version: RechargeVersion) -> "BaseRechargeClient":
+        """Set the default API version for requests that do not pass one explicitly.
+
+        Resources always pass their own version per request, so a client can be shared
+        between v1 and v2 resources across threads without calling this.
+        """
         self._version = version
         return self
 
-    def _build_headers(self) -> dict[str, str]:
+    def _build_headers(self, version: Optional[RechargeVersion] = None) -> dict[str, str]:
         headers = dict(self._base_headers)
-        if self._version:
-            headers["X-Recharge-Version"] = self._version
+        version = version or self._version
+        if version:
+            headers["X-Recharge-Version"] = version
         return headers
 
     def _redact(self, headers: dict[str, str]) -> dict[str, str]:
         return {k: ("REDACTED" if k in REDACTED_HEADERS else v) for k, v in headers.items()}
 
+    def _throttle_delay(self) -> float:
+        if self._rate_limiter is None:
+            return 0.0
+        delay = self._rate_limiter.reserve()
+        if delay > 0:
+            self._logger.debug("Throttling request", extra={"delay": delay})
+        return delay
+
+    def _observe(self, response: HttpResponse) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(response)
+
+    def _cached(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[RechargeVersion],
+    ) -> Optional[HttpResponse]:
+        if self._cache is None or method != "GET":
+            return None
+        response = self._cache.lookup(
+            method, url, params, version or self._version, self._cache_namespace
+        )
+        if response is not None:
+            self._logger.debug("Cache hit", extra={"method": method, "url": url})
+        return response
+
+    def _remember(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[RechargeVersion],
+        response: HttpResponse,
+    ) -> None:
+        if self._cache is None:
+            return
+        if method == "GET":
+            self._cache.store(
+                method, url, params, version or self._version, response, self._cache_namespace
+            )
+        else:
+            self._cache.invalidate(url)
+
+    def _extract_body(self, response: HttpResponse) -> Any:
+        try:
+            return response.json()
+        except Exception:
+            return response.text
+
+    def _extract_data(
+        self,
+        response: HttpResponse,
+        key: Optional[str],
+        expected: type[Union[dict, list]],
+    ) -> Union[dict, list]:
+        body = self._extract_body(response)
+        if not isinstance(body, dict):
+            self._logger.error("Non-dict response body", extra={"body": body})
+            return expected()
+        data = body if key is None else body.get(key, body)
+        if not isinstance(data, expected):
+            self._logger.error(
+                "Unexpected data type",
+                extra={"expected": expected.__name__, "got": type(data).__name__},
+            )
+            raise RechargeAPIError(f"Expected {expected.__name__}, got {type(data).__name__}")
+        return data
+
+    def _raise_for_status(self, response: HttpResponse) -> None:
+        try:
+            response.raise_for_status()
+        except HTTPError as exc:
+            body = self._extract_body(response)
+            self._logger.critical(
+                "HTTP error",
+                extra={"status_code": response.status_code, "body": body},
+            )
+            raise RechargeHTTPError(
+                f"HTTP {response.status_code}", status_code=response.status_code, body=body
+            ) from exc
+
+
+class RechargeClient(BaseRechargeClient):
+    def __init__(
+        self,
+        access_token: str,
+        transport: Optional[HttpTransport] = None,
+        retry_strategy: Optional[RetryStrategy] = None,
+        logger: Optional[logging.Logger] = None,
+        logging_level: int = logging.DEBUG,
+        rate_limiter: Optional[RateLimiter] = None,
+        validation: ValidationMode = "full",
+        compact: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        super().__init__(
+            access_token,
+            retry_strategy,
+            logger,
+            logging_level,
+            rate_limiter,
+            validation,
+            compact,
+            cache,
+        )
+        self._transport = transport or RequestsTransport()
+
     def _send(
         self,
         method: str,
         url: str,
         params: Optional[Mapping[str, Any]],
         json_body: Optional[Mapping[str, Any]],
+        version: Optional[RechargeVersion] = None,
     ) -> HttpResponse:
-        headers = self._build_headers()
+        cached = self._cached(method, url, params, version)
+        if cached is not None:
+            return cached
+        headers = self._build_headers(version)
         attempt = 0
+        started = time.monotonic()
 
         while True:
             self._logger.debug(
                 "Sending request",
                 extra={"method": method, "url": url, "headers": self._redact(headers)},
             )
+            delay = self._throttle_delay()
+            if delay > 0:
+                time.sleep(delay)
             try:
                 response = self._transport.send(method, url, headers, params, json_body)
             except RequestException as exc:
                 self._logger.critical("Transport error", extra={"error": str(exc)})
                 raise RechargeRequestException("Request failed", cause=exc) from exc
+            self._observe(response)
 
             if self._retry_strategy.should_retry(attempt, response.status_code):
-                delay = self._retry_strategy.delay_for(attempt)
+                delay = self._retry_delay(attempt, response, time.monotonic() - started)
                 self._logger.warning(
                     "Retrying request",
                     extra={"attempt": attempt, "status_code": response.status_code, "delay": delay},
@@ -105,46 +263,12 @@ class RechargeClient:
                 attempt += 1
                 continue
 
-            try:
-                response.raise_for_status()
-            except HTTPError as exc:
-                body = self._extract_body(response)
-                self._logger.critical(
-                    "HTTP error",
-                    extra={"status_code": response.status_code, "body": body},
-                )
-                raise RechargeHTTPError(
-                    f"HTTP {response.status_code}", status_code=response.status_code, body=body
-                ) from exc
+            self._raise_for_status(response)
 
             self._logger.debug("Request successful", extra={"status_code": response.status_code})
+            self._remember(method, url, params, version, response)
             return response
 
-    def _extract_body(self, response: HttpResponse) -> Any:
-        try:
-            return response.json()
-        except Exception:
-            return response.text
-
-    def _extract_data(
-        self,
-        response: HttpResponse,
-        key: Optional[str],
-        expected: type[Union[dict, list]],
-    ) -> Union[dict, list]:
-        body = self._extract_body(response)
-        if not isinstance(body, dict):
-            self._logger.error("Non-dict response body", extra={"body": body})
-            return expected()
-        data = body if key is None else body.get(key, body)
-        if not isinstance(data, expected):
-            self._logger.error(
-                "Unexpected data type",
-                extra={"expected": expected.__name__, "got": type(data).__name__},
-            )
-            raise RechargeAPIError(f"Expected {expected.__name__}, got {type(data).__name__}")
-        return data
-
     # ── Public HTTP methods ────────────────────────────────────────────────
 
     def get(
@@ -153,8 +277,9 @@ class RechargeClient:
         query: Optional[Mapping[str, Any]] = None,
         response_key: Optional[str] = None,
         expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
     ) -> Union[dict, list]:
-        response = self._send("GET", url, params=query, json_body=None)
+        response = self._send("GET", url, params=query, json_body=None, version=version)
         return self._extract_data(response, response_key, expected)
 
     def post(
@@ -164,8 +289,9 @@ class RechargeClient:
         query: Optional[Mapping[str, Any]] = None,
         response_key: Optional[str] = None,
         expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
     ) -> Union[dict, list]:
-        response = self._send("POST", url, params=query, json_body=body)
+        response = self._send("POST", url, params=query, json_body=body, version=version)
         return self._extract_data(response, response_key, expected)
 
     def put(
@@ -175,8 +301,9 @@ class RechargeClient:
         query: Optional[Mapping[str, Any]] = None,
         response_key: Optional[str] = None,
         expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
     ) -> Union[dict, list]:
-        response = self._send("PUT", url, params=query, json_body=body)
+        response = self._send("PUT", url, params=query, json_body=body, version=version)
         return self._extract_data(response, response_key, expected)
 
     def delete(
@@ -185,33 +312,455 @@ class RechargeClient:
         body: Optional[Mapping[str, Any]] = None,
         response_key: Optional[str] = None,
         expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
     ) -> Union[dict, list]:
-        response = self._send("DELETE", url, params=None, json_body=body)
+        response = self._send("DELETE", url, params=None, json_body=body, version=version)
         return self._extract_data(response, response_key, expected)
 
+    def _fetch_page(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]],
+        version: RechargeVersion,
+    ) -> HttpResponse:
+        """GET one page of a listing, retrying transport errors before giving up."""
+        attempt = 0
+        while True:
+            try:
+                return self._send("GET", url, params=query, json_body=None, version=version)
+            except RechargeRequestException as exc:
+                if attempt >= self._page_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                self._logger.warning(
+                    "Retrying page after transport error",
+                    extra={
+                        "attempt": attempt,
+                        "url": url,
+                        "error": str(exc.cause),
+                        "delay": delay,
+                    },
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def walk_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+    ) -> Iterator[Page]:
+        """Yield each page of a listing together with the URL of the page after it.
+
+        Calling again with a yielded ``next_url`` as ``url`` (and no ``query``)
+        continues the listing from that page.
+        """
+        version = version or self._version or "2021-11"
+        base_url, limit = page_base(url, query)
+        page = 0
+        records = 0
+        current_url: Optional[str] = url
+        current_query = query
+
+        while current_url:
+            page += 1
+            self._logger.debug("Fetching page", extra={"page": page, "url": current_url})
+            response = self._fetch_page(current_url, current_query, version)
+            try:
+                body = response.json()
+                data = body.get(response_key, []) if response_key else []
+            except Exception:
+                self._logger.error("Failed to decode page response")
+                break
+            current_url = next_page_url(response, body, version, base_url, limit) or None
+            current_query = None
+            records += len(data)
+            yield Page(data, current_url)
+
+        self._logger.debug("Pagination complete", extra={"pages": page, "records": records})
+
+    def iter_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+    ) -> Iterator[list]:
+        """Yield the records of each page in turn, holding only one page in memory."""
+        for page in self.walk_pages(url, query, response_key, version):
+            yield page.records
+
     def paginate(
         self,
         url: str,
         query: Optional[Mapping[str, Any]] = None,
         response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
     ) -> list:
+        """Fetch every page of a listing into one list.
+
+        With a ``checkpoint`` store, each page is saved as it arrives under
+        ``checkpoint_key`` (by default the first-page URL). If the call fails,
+        a later call with the same store and key returns the saved records
+        and fetches only the pages after them. The key is cleared once the
+        listing is complete.
+        """
+        if checkpoint is None:
+            data: list = []
+            for page in self.iter_pages(url, query, response_key, version):
+                data.extend(page)
+            return data
+
+        key = checkpoint_key or listing_url(url, query)
+        state = checkpoint.load(key)
+        if state is None:
+            data, next_url, next_query = [], url, query
+        else:
+            self._logger.debug(
+                "Resuming pagination", extra={"key": key, "records": len(state.records)}
+            )
+            data, next_url, next_query = state.records, state.next_url, None
+        if next_url:
+            for page in self.walk_pages(next_url, next_query, response_key, version):
+                checkpoint.save(key, page)
+                data.extend(page.records)
+        checkpoint.clear(key)
+        return data
+
+    def paginate_counted(
+        self,
+        url: str,
+        total: int,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+        max_workers: int = 4,
+    ) -> list:
+        """Fetch a v1 listing of ``total`` records, requesting its pages concurrently.
+
+        Page numbers are computed up front, so up to ``max_workers`` pages are
+        in flight at once. Records come back in the same order as
+        :meth:`paginate`.
+        """
+        queries = page_queries(total, query)
+        self._logger.debug("Fetching counted pages", extra={"pages": len(queries), "url": url})
+
+        def fetch(page_query: Mapping[str, Any]) -> list:
+            data = self.get(url, page_query, response_key, list, version=version)
+            return data if isinstance(data, list) else []
+
         data: list = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            for page in pool.map(fetch, queries):
+                data.extend(page)
+        return data
+
+
+class AsyncRechargeClient(BaseRechargeClient):
+    """asyncio counterpart of :class:`RechargeClient`.
+
+    Requests are awaited on the transport and retry delays use ``asyncio.sleep``,
+    so a single event loop can keep many requests in flight. Rate limiter and
+    cache calls, which may wait on a lock or a SQLite transaction, run on a
+    worker thread so they never block the loop.
+    """
+
+    def __init__(
+        self,
+        access_token: str,
+        transport: Optional[AsyncHttpTransport] = None,
+        retry_strategy: Optional[RetryStrategy] = None,
+        logger: Optional[logging.Logger] = None,
+        logging_level: int = logging.DEBUG,
+        rate_limiter: Optional[RateLimiter] = None,
+        validation: ValidationMode = "full",
+        compact: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        super().__init__(
+            access_token,
+            retry_strategy,
+            logger,
+            logging_level,
+            rate_limiter,
+            validation,
+            compact,
+            cache,
+        )
+        self._transport = transport or HttpxTransport()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._transport, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "AsyncRechargeClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _athrottle_delay(self) -> float:
+        if self._rate_limiter is None:
+            return 0.0
+        return await asyncio.to_thread(self._throttle_delay)
+
+    async def _aobserve(self, response: HttpResponse) -> None:
+        if self._rate_limiter is not None:
+            await asyncio.to_thread(self._observe, response)
+
+    async def _acached(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[RechargeVersion],
+    ) -> Optional[HttpResponse]:
+        if self._cache is None or method != "GET":
+            return None
+        return await asyncio.to_thread(self._cached, method, url, params, version)
+
+    async def _aremember(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        version: Optional[RechargeVersion],
+        response: HttpResponse,
+    ) -> None:
+        if self._cache is not None:
+            await asyncio.to_thread(self._remember, method, url, params, version, response)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        json_body: Optional[Mapping[str, Any]],
+        version: Optional[RechargeVersion] = None,
+    ) -> HttpResponse:
+        cached = await self._acached(method, url, params, version)
+        if cached is not None:
+            return cached
+        headers = self._build_headers(version)
+        attempt = 0
+        started = time.monotonic()
+
+        while True:
+            self._logger.debug(
+                "Sending request",
+                extra={"method": method, "url": url, "headers": self._redact(headers)},
+            )
+            delay = await self._athrottle_delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._transport.send(method, url, headers, params, json_body)
+            except RequestException as exc:
+                self._logger.critical("Transport error", extra={"error": str(exc)})
+                raise RechargeRequestException("Request failed", cause=exc) from exc
+            await self._aobserve(response)
+
+            if self._retry_strategy.should_retry(attempt, response.status_code):
+                delay = self._retry_delay(attempt, response, time.monotonic() - started)
+                self._logger.warning(
+                    "Retrying request",
+                    extra={"attempt": attempt, "status_code": response.status_code, "delay": delay},
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self._raise_for_status(response)
+
+            self._logger.debug("Request successful", extra={"status_code": response.status_code})
+            await self._aremember(method, url, params, version, response)
+            return response
+
+    # ── Public HTTP methods ────────────────────────────────────────────────
+
+    async def get(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
+    ) -> Union[dict, list]:
+        response = await self._send("GET", url, params=query, json_body=None, version=version)
+        return self._extract_data(response, response_key, expected)
+
+    async def post(
+        self,
+        url: str,
+        body: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
+    ) -> Union[dict, list]:
+        response = await self._send("POST", url, params=query, json_body=body, version=version)
+        return self._extract_data(response, response_key, expected)
+
+    async def put(
+        self,
+        url: str,
+        body: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
+    ) -> Union[dict, list]:
+        response = await self._send("PUT", url, params=query, json_body=body, version=version)
+        return self._extract_data(response, response_key, expected)
+
+    async def delete(
+        self,
+        url: str,
+        body: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        expected: type[Union[dict, list]] = dict,
+        version: Optional[RechargeVersion] = None,
+    ) -> Union[dict, list]:
+        response = await self._send("DELETE", url, params=None, json_body=body, version=version)
+        return self._extract_data(response, response_key, expected)
+
+    async def _fetch_page(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]],
+        version: RechargeVersion,
+    ) -> HttpResponse:
+        """GET one page of a listing, retrying transport errors before giving up."""
+        attempt = 0
+        while True:
+            try:
+                return await self._send("GET", url, params=query, json_body=None, version=version)
+            except RechargeRequestException as exc:
+                if attempt >= self._page_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                self._logger.warning(
+                    "Retrying page after transport error",
+                    extra={
+                        "attempt": attempt,
+                        "url": url,
+                        "error": str(exc.cause),
+                        "delay": delay,
+                    },
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def walk_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+    ) -> AsyncIterator[Page]:
+        """Yield each page of a listing together with the URL of the page after it.
+
+        Calling again with a yielded ``next_url`` as ``url`` (and no ``query``)
+        continues the listing from that page.
+        """
+        version = version or self._version or "2021-11"
+        base_url, limit = page_base(url, query)
         page = 0
+        records = 0
         current_url: Optional[str] = url
         current_query = query
 
         while current_url:
             page += 1
             self._logger.debug("Fetching page", extra={"page": page, "url": current_url})
-            response = self._send("GET", current_url, params=current_query, json_body=None)
+            response = await self._fetch_page(current_url, current_query, version)
             try:
                 body = response.json()
-                data.extend(body.get(response_key, []) if response_key else [])
+                data = body.get(response_key, []) if response_key else []
             except Exception:
                 self._logger.error("Failed to decode page response")
                 break
-            current_url = get_next_page_url(response, self._version or "2021-11") or None
+            current_url = next_page_url(response, body, version, base_url, limit) or None
             current_query = None
+            records += len(data)
+            yield Page(data, current_url)
+
+        self._logger.debug("Pagination complete", extra={"pages": page, "records": records})
+
+    async def iter_pages(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+    ) -> AsyncIterator[list]:
+        """Yield the records of each page in turn, holding only one page in memory."""
+        async for page in self.walk_pages(url, query, response_key, version):
+            yield page.records
+
+    async def paginate(
+        self,
+        url: str,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+    ) -> list:
+        """Fetch every page of a listing into one list.
+
+        With a ``checkpoint`` store, each page is saved as it arrives under
+        ``checkpoint_key`` (by default the first-page URL). If the call fails,
+        a later call with the same store and key returns the saved records
+        and fetches only the pages after them. The key is cleared once the
+        listing is complete.
+        """
+        if checkpoint is None:
+            data: list = []
+            async for page in self.iter_pages(url, query, response_key, version):
+                data.extend(page)
+            return data
+
+        key = checkpoint_key or listing_url(url, query)
+        state = checkpoint.load(key)
+        if state is None:
+            data, next_url, next_query = [], url, query
+        else:
+            self._logger.debug(
+                "Resuming pagination", extra={"key": key, "records": len(state.records)}
+            )
+            data, next_url, next_query = state.records, state.next_url, None
+        if next_url:
+            async for page in self.walk_pages(next_url, next_query, response_key, version):
+                checkpoint.save(key, page)
+                data.extend(page.records)
+        checkpoint.clear(key)
+        return data
 
-        self._logger.debug("Pagination complete", extra={"pages": page, "records": len(data)})
+    async def paginate_counted(
+        self,
+        url: str,
+        total: int,
+        query: Optional[Mapping[str, Any]] = None,
+        response_key: Optional[str] = None,
+        version: Optional[RechargeVersion] = None,
+        max_workers: int = 4,
+    ) -> list:
+        """Fetch a v1 listing of ``total`` records with up to ``max_workers`` pages in flight."""
+        queries = page_queries(total, query)
+        self._logger.debug("Fetching counted pages", extra={"pages": len(queries), "url": url})
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(page_query: Mapping[str, Any]) -> list:
+            async with semaphore:
+                data = await self.get(url, page_query, response_key, list, version=version)
+            return data if isinstance(data, list) else []
+
+        data: list = []
+        for page in await asyncio.gather(*(fetch(q) for q in queries)):
+            data.extend(page)
         return data
@@ -0,0 +1,207 @@
+"""
+DataLoader-style batching of single-record lookups into ``ids=`` list queries.
+
+Code that calls ``get(id)`` for many objects at once (from threads, or from
+tasks on one event loop) pays one request per object. A loader collects the
+ids asked for within a short window and fetches them with one
+``list_({"ids": "1,2,3", ...})`` per ``MAX_PAGE_SIZE`` ids, then hands every
+caller its own record. Ids the API does not return fail with the same 404
+:class:`~recharge.exceptions.RechargeHTTPError` a ``get`` would raise.
+
+Only resources whose list query accepts ``ids`` can be batched, e.g.
+``api.v2.Subscription``, ``api.v2.Charge`` or ``api.v1.Customer``.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Generic, Hashable, Iterable, Optional, TypeVar
+
+from recharge.exceptions import RechargeHTTPError
+from recharge.pagination import MAX_PAGE_SIZE
+
+T = TypeVar("T")
+
+
+def ids_query(ids: Iterable[Hashable]) -> dict[str, str]:
+    """A list query for exactly ``ids``, large enough to return them in one page."""
+    ids = [str(id) for id in ids]
+    return {"ids": ",".join(ids), "limit": str(max(len(ids), 1))}
+
+
+def index_by_id(records: Iterable[Any]) -> dict[str, Any]:
+    """Records keyed by ``str(id)``, so ``"12"`` and ``12`` find the same record."""
+    index = {}
+    for record in records:
+        record_id = record.get("id") if isinstance(record, dict) else getattr(record, "id", None)
+        index[str(record_id)] = record
+    return index
+
+
+def not_found(resource: Any, id: Hashable) -> RechargeHTTPError:
+    """The error a ``get`` of a missing record raises, for ids absent from an ``ids=`` page."""
+    name = getattr(resource, "object_dict_key", "record")
+    return RechargeHTTPError(f"HTTP 404: {name} {id} not found", status_code=404, body=None)
+
+
+class BatchLoader(Generic[T]):
+    """Batches blocking ``load(id)`` calls made from many threads.
+
+    The first id of a batch starts a ``wait``-second window; every id asked
+    for during it joins the batch, and a batch that reaches ``max_batch``
+    ids is sent at once. Concurrent loads of the same id share one result.
+    Nothing is cached once a batch has been answered.
+    """
+
+    def __init__(
+        self, resource: Any, max_batch: int = MAX_PAGE_SIZE, wait: float = 0.005
+    ) -> None:
+        self.resource = resource
+        self.max_batch = max(1, min(max_batch, MAX_PAGE_SIZE))
+        self.wait = wait
+        self._lock = threading.Lock()
+        self._batch: dict[str, "Future[T]"] = {}
+        self._timer: Optional[threading.Timer] = None
+
+    def _take(self) -> dict[str, "Future[T]"]:
+        # Called with the lock held.
+        batch, self._batch = self._batch, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self) -> None:
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: dict[str, "Future[T]"]) -> None:
+        try:
+            found = index_by_id(self.resource.list_(ids_query(batch)))
+        except BaseException as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+            return
+        for id, future in batch.items():
+            if id in found:
+                future.set_result(found[id])
+            else:
+                future.set_exception(not_found(self.resource, id))
+
+    def _add(self, id: Hashable) -> tuple["Future[T]", Optional[dict[str, "Future[T]"]]]:
+        # Called with the lock held; also returns the batch if this id filled it.
+        key = str(id)
+        future = self._batch.get(key)
+        if future is not None:
+            return future, None
+        future = self._batch[key] = Future()
+        if len(self._batch) >= self.max_batch:
+            return future, self._take()
+        if self._timer is None:
+            self._timer = threading.Timer(self.wait, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+        return future, None
+
+    def submit(self, id: Hashable) -> "Future[T]":
+        """Queue ``id`` for the current batch and return the future of its record."""
+        with self._lock:
+            future, full = self._add(id)
+        if full:
+            self._dispatch(full)
+        return future
+
+    def load(self, id: Hashable) -> T:
+        """The record with this id, fetched together with other threads' loads."""
+        return self.submit(id).result()
+
+    def load_many(self, ids: Iterable[Hashable]) -> list[T]:
+        """Records for ``ids`` in order; fails with the first missing id's error."""
+        futures, full = [], []
+        with self._lock:  # so the timer cannot send a half-built batch
+            for id in ids:
+                future, batch = self._add(id)
+                futures.append(future)
+                if batch:
+                    full.append(batch)
+        for batch in full:
+            self._dispatch(batch)
+        self._flush()
+        return [future.result() for future in futures]
+
+
+class AsyncBatchLoader(Generic[T]):
+    """Batches ``await load(id)`` calls made by tasks on one event loop.
+
+    Ids asked for before the loop gets round to the batch (one tick, or
+    ``wait`` seconds when set) are fetched together; a batch that reaches
+    ``max_batch`` ids is sent at once. ``resource`` is an async resource.
+    """
+
+    def __init__(
+        self, resource: Any, max_batch: int = MAX_PAGE_SIZE, wait: float = 0.0
+    ) -> None:
+        self.resource = resource
+        self.max_batch = max(1, min(max_batch, MAX_PAGE_SIZE))
+        self.wait = wait
+        self._batch: dict[str, "asyncio.Future[T]"] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        self._tasks: set["asyncio.Task[None]"] = set()
+
+    def _flush(self) -> None:
+        batch, self._batch = self._batch, {}
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)  # keep a reference until the batch is answered
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: dict[str, "asyncio.Future[T]"]) -> None:
+        try:
+            found = index_by_id(await self.resource.list_(ids_query(batch)))
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled, e.g. at loop shutdown: the callers' loads must not wait forever.
+            for future in batch.values():
+                future.cancel()
+            raise
+        for id, future in batch.items():
+            if future.done():
+                continue  # the caller was cancelled
+            if id in found:
+                future.set_result(found[id])
+            else:
+                future.set_exception(not_found(self.resource, id))
+
+    def submit(self, id: Hashable) -> "asyncio.Future[T]":
+        """Queue ``id`` for the current batch and return the future of its record."""
+        key = str(id)
+        future = self._batch.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._batch[key] = loop.create_future()
+            if len(self._batch) >= self.max_batch:
+                self._flush()
+            elif self._handle is None:
+                if self.wait > 0:
+                    self._handle = loop.call_later(self.wait, self._flush)
+                else:
+                    self._handle = loop.call_soon(self._flush)
+        return future
+
+    async def load(self, id: Hashable) -> T:
+        """The record with this id, fetched together with other tasks' loads."""
+        return await asyncio.shield(self.submit(id))
+
+    async def load_many(self, ids: Iterable[Hashable]) -> list[T]:
+        """Records for ``ids`` in order; fails with the first missing id's error."""
+        futures = [asyncio.shield(self.submit(id)) for id in ids]
+        return list(await asyncio.gather(*futures))
@@ -0,0 +1,312 @@
+"""
+A local SQLite replica of a store's core collections, for lookups without round-trips.
+
+:class:`Mirror` copies customers, addresses, subscriptions, charges,
+orders, plans and products into one SQLite file and keeps them current with
+:class:`~recharge.sync.IncrementalSync`. Each table holds the raw records as
+JSON next to indexed copies of the fields support tools filter on, and
+queries return the same models the resources' ``list_`` does.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Mapping, Optional, Sequence
+
+from recharge.model.base import RechargeModel
+from recharge.model.v2.address import Address
+from recharge.model.v2.charge import Charge
+from recharge.model.v2.customer import Customer
+from recharge.model.v2.order import Order
+from recharge.model.v2.plan import Plan
+from recharge.model.v2.product import Product
+from recharge.model.v2.subscription import Subscription
+from recharge.sync import IncrementalSync, MemoryWatermarkStore, SQLiteWatermarkStore
+
+# Columns compared case-insensitively, like the API does for these filters.
+_NOCASE = frozenset({"email", "status"})
+
+
+@dataclass(frozen=True)
+class MirrorTable:
+    """How one collection is mirrored.
+
+    ``resource`` is the attribute of ``api.v2`` it is listed from and
+    ``columns`` maps each indexed column to its dotted path in the record.
+    Collections whose listing has no ``updated_at_min`` filter
+    (``incremental=False``) are re-listed in full on every sync.
+    """
+
+    name: str
+    resource: str
+    model: type[RechargeModel]
+    columns: Mapping[str, str] = field(default_factory=dict)
+    key: str = "id"
+    incremental: bool = True
+
+
+TABLES: tuple[MirrorTable, ...] = (
+    MirrorTable("customers", "Customer", Customer, {"email": "email", "status": "status"}),
+    MirrorTable("addresses", "Address", Address, {"customer_id": "customer_id"}),
+    MirrorTable(
+        "subscriptions",
+        "Subscription",
+        Subscription,
+        {
+            "customer_id": "customer_id",
+            "address_id": "address_id",
+            "status": "status",
+            "scheduled_at": "next_charge_scheduled_at",
+        },
+    ),
+    MirrorTable(
+        "charges",
+        "Charge",
+        Charge,
+        {
+            "customer_id": "customer.id",
+            "address_id": "address_id",
+            "status": "status",
+            "scheduled_at": "scheduled_at",
+            "email": "customer.email",
+        },
+    ),
+    MirrorTable(
+        "orders",
+        "Order",
+        Order,
+        {
+            "customer_id": "customer.id",
+            "address_id": "address_id",
+            "status": "status",
+            "scheduled_at": "scheduled_at",
+            "email": "customer.email",
+        },
+    ),
+    MirrorTable(
+        "plans", "Plan", Plan, {"external_product_id": "external_product_id.ecommerce"}
+    ),
+    MirrorTable("products", "Product", Product, key="external_product_id", incremental=False),
+)
+
+
+def _dig(record: Mapping[str, Any], path: str) -> Any:
+    value: Any = record
+    for part in path.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return value
+
+
+class MirroredTable:
+    """Read access to one mirrored collection, shaped like the resource it mirrors."""
+
+    def __init__(self, mirror: "Mirror", spec: MirrorTable) -> None:
+        self._mirror = mirror
+        self.spec = spec
+
+    def _where(self, query: Optional[Mapping[str, Any]]) -> tuple[str, list]:
+        clauses, params = [], []
+        for name, value in (query or {}).items():
+            if name == "limit":
+                continue
+            column = "id" if name in ("id", "ids", self.spec.key) else name
+            if column != "id" and column not in self.spec.columns:
+                supported = ", ".join(["ids", *self.spec.columns])
+                raise ValueError(
+                    f"Mirrored {self.spec.name} can be filtered by {supported}, not {name!r}"
+                )
+            if name == "ids" and isinstance(value, str):
+                value = value.split(",")
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values = list(value)
+                if column == "id" and self.spec.key == "id":
+                    values = [int(v) for v in values]
+                clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def list_(self, query: Optional[Mapping[str, Any]] = None) -> list:
+        """Mirrored records matching ``query``, in ``id`` order.
+
+        ``query`` takes equality filters on the indexed columns and ``ids``
+        (a list or comma-separated string); a list value matches any of its
+        items. ``limit`` caps the number of records.
+        """
+        where, params = self._where(query)
+        sql = f"SELECT data FROM {self.spec.name}{where} ORDER BY id"
+        limit = (query or {}).get("limit")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self._mirror._connection().execute(sql, params).fetchall()
+        data = [json.loads(row[0]) for row in rows]
+        return self._mirror._resource(self.spec)._validate_list(self.spec.model, data)
+
+    def get(self, id: Any) -> Optional[Any]:
+        """The mirrored record with this ``id`` (or key), or ``None``."""
+        records = self.list_({"id": id})
+        return records[0] if records else None
+
+    def count(self, query: Optional[Mapping[str, Any]] = None) -> int:
+        where, params = self._where(query)
+        sql = f"SELECT COUNT(*) FROM {self.spec.name}{where}"
+        return self._mirror._connection().execute(sql, params).fetchone()[0]
+
+
+def _create_table(conn: sqlite3.Connection, spec: MirrorTable, table: str) -> None:
+    key_type = "INTEGER" if spec.key == "id" else "TEXT"
+    columns = "".join(
+        f", {column}{' COLLATE NOCASE' if column in _NOCASE else ''}" for column in spec.columns
+    )
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table} ("
+        f"id {key_type} PRIMARY KEY{columns}, data TEXT NOT NULL)"
+    )
+
+
+class Mirror:
+    """A SQLite replica of a store, refreshed by :meth:`sync`.
+
+    ``api`` is an ``api.v2`` namespace (any object with the resources named
+    in ``tables`` works). Each table is reachable as an attribute named
+    after it, e.g. ``mirror.subscriptions.list_({"customer_id": 1})``.
+    Watermarks live in the same file, so any process that can open it can
+    read or sync the mirror.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        api: Any,
+        tables: Sequence[MirrorTable] = TABLES,
+        overlap: timedelta = timedelta(minutes=5),
+        timeout: float = 30.0,
+    ) -> None:
+        self.path = path
+        self.api = api
+        self.timeout = timeout
+        self.tables = {spec.name: spec for spec in tables}
+        self._watermarks = SQLiteWatermarkStore(path, timeout)
+        self._sync = IncrementalSync(self._watermarks, overlap)
+        self._local = threading.local()
+        for spec in tables:
+            setattr(self, spec.name, MirroredTable(self, spec))
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread and per process, as in SQLiteRateLimiter.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        for spec in self.tables.values():
+            _create_table(conn, spec, spec.name)
+            for column in spec.columns:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {spec.name}_{column} ON {spec.name} ({column})"
+                )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _write(self, spec: MirrorTable, records: list, table: Optional[str] = None) -> None:
+        columns = ", ".join(["id", *spec.columns, "data"])
+        marks = ", ".join("?" * (len(spec.columns) + 2))
+        rows = [
+            (
+                record[spec.key],
+                *(_dig(record, path) for path in spec.columns.values()),
+                json.dumps(record),
+            )
+            for record in records
+        ]
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table or spec.name} ({columns}) VALUES ({marks})", rows
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def sync(self, *names: str, full: bool = False) -> dict[str, int]:
+        """Bring the named tables (all by default) up to date; returns records written per table.
+
+        Incremental tables fetch only what changed since their last sync.
+        Records deleted upstream are not seen by an incremental sync; pass
+        ``full=True`` to list the tables again and replace their contents.
+        """
+        written: dict[str, int] = {}
+        for name in names or self.tables:
+            spec = self.tables[name]
+            key = f"mirror:{spec.name}"
+            # Lazy proxies skip validation and keep the decoded dicts in ``raw``.
+            resource = self._resource(spec).with_validation("lazy").with_compact(False)
+            if full or not spec.incremental:
+                written[name] = self._rebuild(spec, resource, key)
+                continue
+            written[name] = 0
+            for page in self._sync.iter_changes(resource, key=key):
+                self._write(spec, [record.raw for record in page])
+                written[name] += len(page)
+        # Without statistics SQLite may pick the status index over a far more
+        # selective one, e.g. for customer_id + status.
+        for name, count in written.items():
+            if count:
+                self._connection().execute(f"ANALYZE {name}")
+        return written
+
+    def _rebuild(self, spec: MirrorTable, resource: Any, key: str) -> int:
+        """List a table in full into a staging table, then swap it in with one transaction.
+
+        Readers see the old contents until the swap, and a sync that fails
+        part-way leaves the table and its watermark as they were.
+        """
+        staging = f"temp.{spec.name}_staging"  # per connection, so syncs cannot collide
+        conn = self._connection()
+        conn.execute(f"DROP TABLE IF EXISTS {staging}")
+        _create_table(conn, spec, staging)
+        # The watermark is kept aside until the swap, so it never runs ahead of the table.
+        watermarks = MemoryWatermarkStore()
+        if spec.incremental:
+            pages = IncrementalSync(watermarks, self._sync.overlap).iter_changes(resource, key=key)
+        else:
+            pages = resource.iter_pages()
+        count = 0
+        for page in pages:
+            self._write(spec, [record.raw for record in page], staging)
+            count += len(page)
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(f"DELETE FROM {spec.name}")
+            conn.execute(f"INSERT INTO {spec.name} SELECT * FROM {staging}")
+            conn.execute(f"DROP TABLE {staging}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        state = watermarks.load(key)
+        if state is not None:
+            self._watermarks.save(key, state)
+        return count
+
+    def _resource(self, spec: MirrorTable) -> Any:
+        return getattr(self.api, spec.resource)
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        self._watermarks.close()
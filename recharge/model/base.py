@@ -1,17 +1,349 @@
-from typing import get_origin
+import copy
+import sys
+import types
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter, model_validator
+
+from recharge.types import ValidationMode
+
+M = TypeVar("M", bound=BaseModel)
+
+# Origins of ``Optional[X]`` and ``X | None``; the latter only exists from Python 3.10.
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
 
 
 class RechargeModel(BaseModel):
     model_config = ConfigDict(extra="allow", populate_by_name=True)
 
+    # Names of the ``list[...]`` fields, computed once per class so the
+    # before-validator below does not walk model_fields for every record.
+    _list_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._list_fields = tuple(
+            name
+            for name, field_info in cls.model_fields.items()
+            if get_origin(field_info.annotation) is list
+        )
+
     @model_validator(mode="before")
     @classmethod
     def _coerce_none_lists(cls, data):
         if not isinstance(data, dict):
             return data
-        for field_name, field_info in cls.model_fields.items():
-            if get_origin(field_info.annotation) is list and data.get(field_name) is None:
+        for field_name in cls._list_fields:
+            if data.get(field_name) is None:
                 data[field_name] = []
         return data
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[M]) -> TypeAdapter[list[M]]:
+    """The (cached) ``TypeAdapter`` that validates a whole list of ``model`` in one call."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def validate_list(model: type[M], data: Any) -> list[M]:
+    """Validate a page of records as ``model`` instances with a single pydantic-core call."""
+    return list_adapter(model).validate_python(data)
+
+
+def _nested_model(annotation: Any) -> Optional[tuple[type[BaseModel], bool]]:
+    """``(model, is_list)`` if ``annotation`` holds a model or a list of models."""
+    if get_origin(annotation) in _UNION_TYPES:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    many = get_origin(annotation) is list
+    if many:
+        annotation = (get_args(annotation) or (None,))[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, many
+    return None
+
+
+# String fields whose values repeat across the records of a store (catalog
+# data, enums the models type as ``str``, dates); interned in compact mode.
+# Literal-typed fields are interned as well.
+LOW_CARDINALITY_FIELDS = frozenset(
+    {
+        "charge_interval_unit",
+        "country",
+        "country_code",
+        "currency",
+        "currency_code",
+        "ecommerce",
+        "next_charge_scheduled_at",
+        "order_interval_unit",
+        "original_price",
+        "payment_processor",
+        "presentment_currency",
+        "price",
+        "product_title",
+        "province",
+        "purchase_item_type",
+        "rate",
+        "scheduled_at",
+        "sku",
+        "status",
+        "tags",
+        "title",
+        "type",
+        "unit_price",
+        "utm_campaign",
+        "utm_medium",
+        "utm_source",
+        "variant_title",
+    }
+)
+
+
+def _is_literal(annotation: Any) -> bool:
+    if get_origin(annotation) in _UNION_TYPES:
+        return any(_is_literal(arg) for arg in get_args(annotation))
+    return get_origin(annotation) is Literal
+
+
+@dataclass(frozen=True)
+class _ConstructPlan:
+    """Per-class field table for :func:`construct`, built once instead of per record."""
+
+    fields: dict[str, Any]  # every field in declaration order; _MISSING if required
+    names: frozenset[str]
+    keys: frozenset[str]  # names plus aliases: the input keys that are not extras
+    interned: tuple[str, ...]
+    required: tuple[str, ...]
+    mutable_defaults: tuple[str, ...]
+    list_fields: tuple[str, ...]
+    nested: tuple[tuple[str, type[BaseModel], bool], ...]
+    fast: bool
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model: type[BaseModel]) -> _ConstructPlan:
+    # Built lazily rather than at class creation so forward references between
+    # models in the same module are already resolved.
+    fields: dict[str, Any] = {}
+    nested = []
+    for name, field_info in model.model_fields.items():
+        if field_info.is_required():
+            fields[name] = _MISSING
+        else:
+            fields[name] = field_info.get_default(call_default_factory=True)
+        nested_model = _nested_model(field_info.annotation)
+        if nested_model is not None:
+            nested.append((name, *nested_model))
+    aliases = {info.alias for info in model.model_fields.values() if info.alias}
+    return _ConstructPlan(
+        fields=fields,
+        names=frozenset(fields),
+        keys=frozenset(fields) | aliases,
+        interned=tuple(
+            name
+            for name, info in model.model_fields.items()
+            if name in LOW_CARDINALITY_FIELDS or _is_literal(info.annotation)
+        ),
+        required=tuple(name for name, value in fields.items() if value is _MISSING),
+        mutable_defaults=tuple(
+            name for name, value in fields.items() if isinstance(value, (list, dict, set))
+        ),
+        list_fields=getattr(model, "_list_fields", ()),
+        nested=tuple(nested),
+        fast=(
+            model.model_config.get("extra") == "allow"
+            and not model.__pydantic_post_init__
+            and not model.__pydantic_root_model__
+            and not any(
+                info.alias or info.validation_alias for info in model.model_fields.values()
+            )
+        ),
+    )
+
+
+def _construct_nested(plan: _ConstructPlan, data: dict) -> dict:
+    values = dict(data)
+    for name in plan.list_fields:
+        if values.get(name) is None:
+            values[name] = []
+    for name, nested, many in plan.nested:
+        value = values.get(name)
+        if value is None:
+            continue
+        if many and isinstance(value, list):
+            values[name] = [construct(nested, item) for item in value]
+        elif not many:
+            values[name] = construct(nested, value)
+    return values
+
+
+def construct(model: type[M], data: Any) -> M:
+    """Build ``model`` from trusted ``data`` without validation, recursing into nested models.
+
+    Equivalent to ``model_construct`` applied at every level, with the field
+    table computed once per class. Field validators do not run, but ``None``
+    lists still become ``[]``, so attribute access works as usual.
+    """
+    if not isinstance(data, dict):
+        return data
+    plan = _construct_plan(model)
+    if not plan.fast:
+        return model.model_construct(**_construct_nested(plan, data))
+
+    fields = {**plan.fields, **data}
+    for name in plan.required:
+        if fields[name] is _MISSING:
+            del fields[name]
+    for name in plan.mutable_defaults:
+        if fields[name] is plan.fields[name]:
+            fields[name] = copy.copy(fields[name])
+    for name in plan.list_fields:
+        if fields.get(name) is None:
+            fields[name] = []
+    for name, nested, many in plan.nested:
+        value = fields.get(name)
+        if not value:
+            continue
+        if not many:
+            fields[name] = construct(nested, value)
+        elif isinstance(value, list):
+            fields[name] = [construct(nested, item) for item in value]
+    extra_names = data.keys() - plan.names
+    extra = {name: fields.pop(name) for name in extra_names} if extra_names else {}
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__pydantic_fields_set__", data.keys() | plan.list_fields)
+    object.__setattr__(instance, "__pydantic_extra__", extra)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _compact(plan: _ConstructPlan, data: dict) -> dict:
+    values = {key: value for key, value in data.items() if key in plan.keys}
+    for name in plan.interned:
+        value = values.get(name)
+        if type(value) is str:
+            values[name] = sys.intern(value)
+    for name, nested, many in plan.nested:
+        value = values.get(name)
+        if not value:
+            continue
+        nested_plan = _construct_plan(nested)
+        if many and isinstance(value, list):
+            values[name] = [
+                _compact(nested_plan, item) if isinstance(item, dict) else item
+                for item in value
+            ]
+        elif not many and isinstance(value, dict):
+            values[name] = _compact(nested_plan, value)
+    return values
+
+
+def compact_list(model: type[BaseModel], data: list) -> list:
+    """Strip a page of raw records down to what ``model`` declares, sharing repeated strings.
+
+    Undeclared keys are dropped at every level, so models built from the
+    result carry no ``extra`` payload, and the values of low-cardinality
+    string fields (:data:`LOW_CARDINALITY_FIELDS` and ``Literal`` fields) are
+    interned so a million records hold one ``"month"`` or SKU string each.
+    Records are copied into new, tightly sized dicts; ``data`` is not modified.
+    """
+    plan = _construct_plan(model)
+    return [_compact(plan, item) if isinstance(item, dict) else item for item in data]
+
+
+class LazyModel(Generic[M]):
+    """Read-only proxy over one raw record that validates nested models on first access.
+
+    Plain fields are returned as decoded, the same trust level as
+    ``validation="none"``. A field holding a model or a list of models is
+    validated when first read and cached, so records whose line items or
+    addresses are never touched never pay for them. :meth:`validate` returns
+    the fully validated model.
+    """
+
+    def __init__(self, model: type[M], data: dict) -> None:
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_validated", None)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached on a cache miss: resolved values are stored in __dict__.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        plan = _construct_plan(self._model)
+        data = self._data
+        if name in data:
+            value = data[name]
+        elif name in plan.names and plan.fields[name] is not _MISSING:
+            value = plan.fields[name]
+            if name in plan.mutable_defaults:
+                value = copy.copy(value)
+        else:
+            raise AttributeError(f"{self._model.__name__!r} record has no field {name!r}")
+        if value is None and name in plan.list_fields:
+            value = []
+        for field_name, nested, many in plan.nested:
+            if field_name == name and value:
+                value = validate_list(nested, value) if many else nested.model_validate(value)
+                break
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}](id={self._data.get('id')!r})"
+
+    @property
+    def raw(self) -> dict:
+        """The record as decoded from the response."""
+        return self._data
+
+    def validate(self) -> M:
+        """Fully validate the record (once) and return the model instance."""
+        if self._validated is None:
+            object.__setattr__(self, "_validated", self._model.model_validate(self._data))
+        return self._validated
+
+
+def load_list(
+    model: type[M], data: list, validation: ValidationMode = "full", compact: bool = False
+) -> list[M]:
+    """Turn a page of records into ``model`` instances at the requested validation level.
+
+    ``"full"`` validates everything and ``"none"`` trusts the payload entirely
+    (see :func:`construct`). ``"lazy"`` returns :class:`LazyModel` proxies
+    that validate nested models on first access. ``"none"`` tolerates
+    payloads that drift from the models; it is not faster than ``"full"``,
+    which builds its objects inside pydantic-core.
+
+    With ``compact``, the records first go through :func:`compact_list`.
+    """
+    if compact:
+        data = compact_list(model, data)
+    if validation == "none":
+        return [construct(model, item) for item in data]
+    if validation == "lazy":
+        return [LazyModel(model, item) for item in data]  # type: ignore[misc]
+    return validate_list(model, data)
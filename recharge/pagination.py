@@ -1,25 +1,386 @@
-from typing import TYPE_CHECKING
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+import asyncio
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+from urllib.parse import parse_qs, urlencode
 
 if TYPE_CHECKING:
     from recharge.transport import HttpResponse
     from recharge.types import RechargeVersion
 
+T = TypeVar("T")
 
-def get_next_page_url(response: "HttpResponse", version: "RechargeVersion") -> str:
+MAX_PAGE_SIZE = 250
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class Page:
+    """One page of a listing and the URL of the page after it (``None`` on the last page)."""
+
+    records: list
+    next_url: Optional[str]
+
+
+@dataclass(frozen=True)
+class Listing:
+    """The request behind a resource's ``iter_pages``, as returned by its ``listing`` method.
+
+    Enough to page the listing through the client directly, e.g. to read raw
+    dicts or resume from a saved page URL.
+    """
+
+    url: str
+    query: Optional[Mapping[str, Any]]
+    response_key: str
+    version: "RechargeVersion"
+
+    @property
+    def first_url(self) -> str:
+        """The first-page URL with the query encoded into it."""
+        return listing_url(self.url, self.query)
+
+
+def page_base(url: str, query: Optional[Mapping[str, Any]] = None) -> tuple[str, Optional[str]]:
+    """Split a first-page URL into the URL cursor pages are requested from and the page ``limit``."""
+    base, _, query_string = url.partition("?")
+    limit = (query or {}).get("limit")
+    if limit is None and query_string:
+        limit = parse_qs(query_string).get("limit", [None])[-1]
+    return base, None if limit is None else str(limit)
+
+
+def next_page_url(
+    response: "HttpResponse",
+    body: Any,
+    version: "RechargeVersion",
+    base_url: str,
+    limit: Optional[str] = None,
+) -> str:
+    """URL of the page after ``response``, or ``""`` on the last page.
+
+    ``body`` is the page's already-decoded JSON, so the response is never
+    decoded twice. 2021-11 cursor requests only accept ``cursor`` and
+    ``limit``, so the URL is built straight from ``base_url`` and the cursor.
+    """
     if version == "2021-01":
         return response.links.get("next", {}).get("url", "")
     if version == "2021-11":
-        try:
-            data = response.json()
-            cursor = data.get("next_cursor")
-            if cursor:
-                parsed = urlparse(response.url)
-                params = parse_qs(parsed.query)
-                params = {k: v for k, v in params.items() if k in ("cursor", "limit")}
-                params["cursor"] = [cursor]
-                new_query = urlencode(params, doseq=True)
-                return urlunparse(parsed._replace(query=new_query))
-        except Exception:
-            pass
+        cursor = body.get("next_cursor") if isinstance(body, dict) else None
+        if cursor:
+            params = {"limit": limit, "cursor": cursor} if limit else {"cursor": cursor}
+            return f"{base_url}?{urlencode(params)}"
     return ""
+
+
+def get_next_page_url(response: "HttpResponse", version: "RechargeVersion") -> str:
+    """Standalone :func:`next_page_url` that decodes ``response`` itself."""
+    try:
+        body = response.json() if version == "2021-11" else None
+        base_url, limit = page_base(str(response.url))
+        return next_page_url(response, body, version, base_url, limit)
+    except Exception:
+        return ""
+
+
+def listing_url(url: str, query: Optional[Mapping[str, Any]] = None) -> str:
+    """The first-page URL of a listing with ``query`` encoded into it, e.g. as a checkpoint key."""
+    return f"{url}?{urlencode(query, doseq=True)}" if query else url
+
+
+def count_query(query: Optional[Mapping[str, Any]] = None) -> dict[str, Any]:
+    """The filters of a v1 list query, without the paging parameters ``/count`` rejects."""
+    return {k: v for k, v in (query or {}).items() if k not in ("limit", "page")}
+
+
+def page_queries(total: int, query: Optional[Mapping[str, Any]] = None) -> list[dict[str, Any]]:
+    """One query per page for a v1 page-numbered listing holding ``total`` records.
+
+    Pages hold ``limit`` records (``MAX_PAGE_SIZE`` unless the query sets one)
+    and are numbered from 1, as the 2021-01 API expects.
+    """
+    base = {k: v for k, v in (query or {}).items() if k != "page"}
+    limit = int(base.setdefault("limit", MAX_PAGE_SIZE))
+    pages = -(-max(0, total) // limit)
+    return [{**base, "page": number} for number in range(1, pages + 1)]
+
+
+def prefetch_pages(pages: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """Iterate over ``pages`` while a background thread fetches up to ``depth`` pages ahead.
+
+    ``pages`` is typically a resource's ``iter_pages(...)``. The next request
+    goes out as soon as the consumer takes a page, so downloading page N+1
+    overlaps with processing page N. Errors raised while fetching are re-raised
+    to the consumer in page order. A ``depth`` below 1 disables prefetching;
+    the default of 2 leaves slack for GIL hand-offs when the consumer is
+    CPU-bound, which a single page of lookahead does not.
+    """
+    if depth < 1:
+        yield from pages
+        return
+
+    buffer: "queue.SimpleQueue[tuple[Any, Optional[BaseException]]]" = queue.SimpleQueue()
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        iterator = iter(pages)
+        try:
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                try:
+                    page = next(iterator)
+                except StopIteration:
+                    buffer.put((_DONE, None))
+                    return
+                buffer.put((page, None))
+        except BaseException as exc:
+            buffer.put((_DONE, exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=produce, name="recharge-prefetch", daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield page
+    finally:
+        stop.set()
+        slots.release()
+
+
+async def prefetch_pages_async(pages: AsyncIterable[T], depth: int = 2) -> AsyncIterator[T]:
+    """asyncio counterpart of :func:`prefetch_pages`, fetching ahead in a background task."""
+    if depth < 1:
+        async for page in pages:
+            yield page
+        return
+
+    buffer: "asyncio.Queue[tuple[Any, Optional[BaseException]]]" = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        iterator = pages.__aiter__()
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    page = await iterator.__anext__()
+                except StopAsyncIteration:
+                    buffer.put_nowait((_DONE, None))
+                    return
+                buffer.put_nowait((page, None))
+        except Exception as exc:
+            buffer.put_nowait((_DONE, exc))
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            slots.release()
+            yield page
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+def _parse_bound(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ValueError(f"Cannot parse {value!r} as an ISO 8601 timestamp") from exc
+
+
+def _window_bounds(query: Mapping[str, Any], field: str) -> tuple[datetime, datetime]:
+    lower = query.get(f"{field}_min")
+    if not lower:
+        raise ValueError(f"Sharded pagination needs '{field}_min' in the query")
+    start = _parse_bound(lower)
+    upper = query.get(f"{field}_max")
+    end = _parse_bound(upper) if upper else datetime.now(start.tzinfo or None)
+    if end <= start:
+        raise ValueError(f"'{field}_max' must be later than '{field}_min'")
+    return start, end
+
+
+def _split_window(start: datetime, end: datetime, parts: int) -> list[tuple[datetime, datetime]]:
+    step = (end - start) / parts
+    bounds = [start + step * i for i in range(parts)] + [end]
+    return list(zip(bounds, bounds[1:]))
+
+
+def _window_query(
+    query: Mapping[str, Any], field: str, window: tuple[datetime, datetime]
+) -> dict[str, Any]:
+    lower, upper = window
+    return {
+        **query,
+        f"{field}_min": lower.isoformat(timespec="seconds"),
+        f"{field}_max": upper.isoformat(timespec="seconds"),
+    }
+
+
+def _merge_windows(results: dict[datetime, list]) -> list:
+    """Concatenate window results in time order, dropping records already seen by ``id``."""
+    merged: list = []
+    seen: set = set()
+    for start in sorted(results):
+        for record in results[start]:
+            record_id = record.get("id") if isinstance(record, dict) else getattr(record, "id", None)
+            if record_id is not None:
+                if record_id in seen:
+                    continue
+                seen.add(record_id)
+            merged.append(record)
+    return merged
+
+
+@dataclass
+class _ShardPlan:
+    query: dict[str, Any]
+    field: str
+    page_size: int
+    min_window: timedelta
+    max_shards: int
+    shards: int = 0
+
+    def can_split(self, window: tuple[datetime, datetime]) -> bool:
+        lower, upper = window
+        return self.shards < self.max_shards and upper - lower >= 2 * self.min_window
+
+
+def _plan(
+    query: Optional[Mapping[str, Any]],
+    field: str,
+    shards: int,
+    min_window: timedelta,
+    max_shards: int,
+) -> tuple[_ShardPlan, list[tuple[datetime, datetime]]]:
+    base = dict(query or {})
+    base.setdefault("limit", str(MAX_PAGE_SIZE))
+    start, end = _window_bounds(base, field)
+    plan = _ShardPlan(base, field, int(base["limit"]), min_window, max(shards, max_shards))
+    windows = _split_window(start, end, max(1, shards))
+    plan.shards = len(windows)
+    return plan, windows
+
+
+def paginate_sharded(
+    iter_pages: Callable[[Any], Iterator[list[T]]],
+    query: Optional[Mapping[str, Any]] = None,
+    *,
+    field: str = "created_at",
+    shards: int = 4,
+    max_workers: Optional[int] = None,
+    min_window: timedelta = timedelta(minutes=1),
+    max_shards: int = 64,
+) -> list[T]:
+    """Fetch every record of a time-filterable listing by paginating time windows in parallel.
+
+    ``iter_pages`` is a resource's ``iter_pages`` method (for example
+    ``api.v2.Charge.iter_pages``) and ``query`` its usual list query, which must
+    include ``{field}_min``; ``{field}_max`` defaults to now. The range is cut
+    into ``shards`` windows that are paginated on a thread pool. A window whose
+    first page comes back full is dense, so it is split in half and both halves
+    are queued, until windows reach ``min_window`` or ``max_shards`` is hit.
+    Records are returned in window order, de-duplicated by ``id``.
+    """
+    plan, windows = _plan(query, field, shards, min_window, max_shards)
+    results: dict[datetime, list] = {}
+
+    def fetch(window: tuple[datetime, datetime], splittable: bool):
+        pages = iter_pages(_window_query(plan.query, plan.field, window))
+        first = next(pages, [])
+        if splittable and len(first) >= plan.page_size:
+            pages.close()
+            return first, _split_window(*window, 2)
+        records = list(first)
+        for page in pages:
+            records.extend(page)
+        return records, []
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, shards)) as pool:
+        pending = {
+            pool.submit(fetch, window, plan.can_split(window)): window for window in windows
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                window = pending.pop(future)
+                records, halves = future.result()
+                results.setdefault(window[0], []).extend(records)
+                plan.shards += len(halves) - 1 if halves else 0
+                for half in halves:
+                    pending[pool.submit(fetch, half, plan.can_split(half))] = half
+
+    return _merge_windows(results)
+
+
+async def paginate_sharded_async(
+    iter_pages: Callable[[Any], AsyncIterator[list[T]]],
+    query: Optional[Mapping[str, Any]] = None,
+    *,
+    field: str = "created_at",
+    shards: int = 4,
+    concurrency: Optional[int] = None,
+    min_window: timedelta = timedelta(minutes=1),
+    max_shards: int = 64,
+) -> list[T]:
+    """asyncio counterpart of :func:`paginate_sharded` for the async resources."""
+    plan, windows = _plan(query, field, shards, min_window, max_shards)
+    results: dict[datetime, list] = {}
+    semaphore = asyncio.Semaphore(concurrency or max(1, shards))
+
+    async def fetch(window: tuple[datetime, datetime]) -> None:
+        async with semaphore:
+            pages = iter_pages(_window_query(plan.query, plan.field, window))
+            try:
+                first = await pages.__anext__()
+            except StopAsyncIteration:
+                first = []
+            records = results.setdefault(window[0], [])
+            records.extend(first)
+            if plan.can_split(window) and len(first) >= plan.page_size:
+                await pages.aclose()
+                halves = _split_window(*window, 2)
+                plan.shards += 1
+            else:
+                async for page in pages:
+                    records.extend(page)
+                return
+        await asyncio.gather(*(fetch(half) for half in halves))
+
+    await asyncio.gather(*(fetch(window) for window in windows))
+    return _merge_windows(results)
@@ -0,0 +1,197 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Protocol, runtime_checkable
+
+from recharge.transport import HttpResponse
+
+LIMIT_HEADER = "X-Recharge-Limit"
+
+
+@runtime_checkable
+class RateLimiter(Protocol):
+    def reserve(self) -> float: ...
+    def observe(self, response: HttpResponse) -> None: ...
+
+
+def parse_limit_header(response: HttpResponse) -> Optional[tuple[int, int]]:
+    """Return ``(used, bucket_size)`` from an ``X-Recharge-Limit: 12/40`` header, if present."""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get(LIMIT_HEADER)
+    if not value:
+        return None
+    try:
+        used, size = value.split("/", 1)
+        return int(used), int(size)
+    except ValueError:
+        return None
+
+
+def leak(level: float, elapsed: float, leak_rate: float) -> float:
+    return max(0.0, level - elapsed * leak_rate)
+
+
+def reserve_slot(level: float, capacity: float, leak_rate: float) -> tuple[float, float]:
+    """Add one request to a bucket at ``level`` and return ``(new_level, delay)``.
+
+    The request is admitted immediately while the bucket has room. Otherwise it
+    is queued behind earlier reservations and must wait until enough has leaked
+    out for it to fit, which keeps concurrent callers in FIFO order.
+    """
+    new_level = level + 1
+    overflow = new_level - capacity
+    return new_level, (overflow / leak_rate if overflow > 0 else 0.0)
+
+
+@dataclass
+class LeakyBucketRateLimiter:
+    """Client-side pacing for Recharge's leaky-bucket API call limit.
+
+    Recharge gives each store a bucket of ``bucket_size`` calls that drains at
+    ``leak_rate`` calls per second and answers 429 once it overflows. The
+    limiter mirrors that bucket locally and delays requests that would
+    overflow it, keeping ``headroom`` slots free for other clients of the
+    store. ``X-Recharge-Limit`` response headers resync the local level (and
+    the bucket size) with the server. A single instance is safe to share
+    between threads and between sync and async clients.
+    """
+
+    bucket_size: int = 40
+    leak_rate: float = 2.0
+    headroom: int = 2
+    clock: Callable[[], float] = time.monotonic
+    _level: float = field(default=0.0, init=False, repr=False)
+    _updated_at: Optional[float] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def capacity(self) -> float:
+        return max(1, self.bucket_size - self.headroom)
+
+    def _drain(self, now: float) -> None:
+        if self._updated_at is not None:
+            self._level = leak(self._level, now - self._updated_at, self.leak_rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Reserve a slot for one request and return how long to wait before sending it."""
+        with self._lock:
+            self._drain(self.clock())
+            self._level, delay = reserve_slot(self._level, self.capacity, self.leak_rate)
+            return delay
+
+    def observe(self, response: HttpResponse) -> None:
+        """Resync the bucket from the server's view after a response."""
+        limit = parse_limit_header(response)
+        with self._lock:
+            self._drain(self.clock())
+            if limit is not None:
+                used, size = limit
+                self.bucket_size = size
+                self._level = max(self._level, float(used))
+            elif response.status_code == 429:
+                self._level = max(self._level, float(self.bucket_size))
+
+
+class SQLiteRateLimiter:
+    """Leaky-bucket limiter whose state lives in a SQLite file shared by every process.
+
+    Each reservation is a short ``BEGIN IMMEDIATE`` transaction, so all
+    ``RechargeClient`` instances on a host that point at the same ``path`` (and
+    ``key``, one per store) draw from a single bucket. Wall-clock time is used
+    because the state outlives and is shared between processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        bucket_size: int = 40,
+        leak_rate: float = 2.0,
+        headroom: int = 2,
+        key: str = "default",
+        clock: Callable[[], float] = time.time,
+        timeout: float = 30.0,
+    ) -> None:
+        self.path = path
+        self.bucket_size = bucket_size
+        self.leak_rate = leak_rate
+        self.headroom = headroom
+        self.key = key
+        self.clock = clock
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread and per process: sqlite3 objects must not
+        # cross threads, and must not be inherited across fork().
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS recharge_rate_limit ("
+            "key TEXT PRIMARY KEY, level REAL NOT NULL, updated_at REAL NOT NULL, "
+            "bucket_size INTEGER NOT NULL)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _update(self, apply: Callable[[float, int], tuple[float, int, float]]) -> float:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = self.clock()
+            row = conn.execute(
+                "SELECT level, updated_at, bucket_size FROM recharge_rate_limit WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            if row is None:
+                level, size = 0.0, self.bucket_size
+            else:
+                level = leak(row[0], now - row[1], self.leak_rate)
+                size = row[2]
+            level, size, delay = apply(level, size)
+            conn.execute(
+                "INSERT OR REPLACE INTO recharge_rate_limit (key, level, updated_at, bucket_size) "
+                "VALUES (?, ?, ?, ?)",
+                (self.key, level, now, size),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return delay
+
+    def reserve(self) -> float:
+        """Reserve a slot in the shared bucket and return how long to wait before sending."""
+
+        def apply(level: float, size: int) -> tuple[float, int, float]:
+            capacity = max(1, size - self.headroom)
+            level, delay = reserve_slot(level, capacity, self.leak_rate)
+            return level, size, delay
+
+        return self._update(apply)
+
+    def observe(self, response: HttpResponse) -> None:
+        """Resync the shared bucket from the server's view after a response."""
+        limit = parse_limit_header(response)
+        if limit is None and response.status_code != 429:
+            return
+
+        def apply(level: float, size: int) -> tuple[float, int, float]:
+            if limit is not None:
+                used, size = limit
+                return max(level, float(used)), size, 0.0
+            return max(level, float(size)), size, 0.0
+
+        self._update(apply)
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -1,24 +1,105 @@
+import inspect
 import random
 from dataclasses import dataclass, field
-from typing import Protocol, runtime_checkable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Protocol, runtime_checkable
+
+from recharge.ratelimit import parse_limit_header
+from recharge.transport import HttpResponse
 
 
 @runtime_checkable
 class RetryStrategy(Protocol):
+    """Decides whether and how long to wait before repeating a request.
+
+    The client passes ``delay_for`` the response being retried and the
+    seconds ``elapsed`` since the first attempt. Strategies written as
+    ``delay_for(self, attempt)`` are still supported; the client then
+    calls them with the attempt alone.
+    """
+
     def should_retry(self, attempt: int, status_code: int) -> bool: ...
-    def delay_for(self, attempt: int) -> float: ...
+    def delay_for(
+        self, attempt: int, response: Optional[HttpResponse] = None, elapsed: float = 0.0
+    ) -> float: ...
+
+
+def takes_response(strategy: RetryStrategy) -> bool:
+    """Whether ``strategy.delay_for`` accepts the ``response`` and ``elapsed`` keywords."""
+    try:
+        parameters = inspect.signature(strategy.delay_for).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    names = {p.name for p in parameters}
+    return {"response", "elapsed"} <= names or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters
+    )
+
+
+def parse_retry_after(response: HttpResponse) -> Optional[float]:
+    """Seconds to wait according to a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
 
 
 @dataclass
 class ExponentialBackoffRetry:
+    """Retry throttled and failed requests, waiting as little as the server allows.
+
+    ``Retry-After`` wins when the server sends it. For a 429 without it, the
+    ``X-Recharge-Limit`` header tells how far the bucket overflowed, so the
+    wait is just long enough for ``leak_rate`` to make room. Otherwise the
+    delay grows as ``base_delay * 2**attempt``. Header-derived delays get at
+    most one leak interval of jitter so concurrent callers do not retry in
+    lockstep. ``max_delay``, if set, caps the exponential delays only; a wait
+    the server asked for is never cut short. ``elapsed`` is accepted for
+    the protocol's sake and ignored; a strategy with a total-time budget can
+    use it.
+    """
+
     max_retries: int = 3
     base_delay: float = 2.0
     retryable_status_codes: frozenset[int] = field(
         default_factory=lambda: frozenset({429, 500, 502, 503, 504})
     )
+    leak_rate: float = 2.0
+    jitter: float = 1.0
+    max_delay: Optional[float] = None
 
     def should_retry(self, attempt: int, status_code: int) -> bool:
         return attempt < self.max_retries and status_code in self.retryable_status_codes
 
-    def delay_for(self, attempt: int) -> float:
-        return (self.base_delay * (2**attempt)) + random.uniform(0, 1)
+    def _server_delay(self, response: HttpResponse) -> Optional[float]:
+        retry_after = parse_retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        if response.status_code == 429:
+            limit = parse_limit_header(response)
+            if limit is not None:
+                used, size = limit
+                return max(1, used + 1 - size) / self.leak_rate
+        return None
+
+    def delay_for(
+        self, attempt: int, response: Optional[HttpResponse] = None, elapsed: float = 0.0
+    ) -> float:
+        server_delay = self._server_delay(response) if response is not None else None
+        if server_delay is not None:
+            jitter = random.uniform(0, min(self.jitter, 1 / self.leak_rate))
+            return server_delay + jitter
+        delay = (self.base_delay * (2**attempt)) + random.uniform(0, self.jitter)
+        return delay if self.max_delay is None else min(delay, self.max_delay)
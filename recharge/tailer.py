@@ -0,0 +1,225 @@
+"""
+Change-data-capture over the 2021-11 events listing.
+
+:class:`EventTailer` polls ``/events`` from a persisted ``created_at``
+watermark and hands every new event to the handler registered for its
+``object_type``. Polls repeat quickly while events keep arriving and back
+off towards ``max_interval`` while the feed is idle, so an idle tailer costs
+a request a minute rather than a request a second. Events re-listed at a
+window boundary are recognised by ``id`` and dispatched once.
+"""
+
+import queue
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Hashable, Mapping, Optional
+
+from recharge.sync import WatermarkStore, _get, _moment, _Run
+
+EventHandler = Callable[[Any], None]
+
+_STOP = object()
+_UNDATED = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _order(event: Any) -> tuple[datetime, Any]:
+    """Sort key putting events oldest first; events without ``created_at`` go first."""
+    stamp = _get(event, "created_at")
+    return (_moment(stamp) if stamp else _UNDATED, _get(event, "id") or 0)
+
+
+def _halve(query: Mapping[str, Any]) -> Optional[list]:
+    """Split a query's ``created_at`` range into two halves, or None if it is too narrow."""
+    lower = query.get("created_at_min")
+    if not lower:
+        return None
+    start = _moment(lower)
+    upper = query.get("created_at_max")
+    end = _moment(upper) if upper else datetime.now(timezone.utc)
+    if end - start < timedelta(seconds=2):
+        return None
+    middle = (start + (end - start) / 2).isoformat(timespec="seconds")
+    return [{**query, "created_at_max": middle}, {**query, "created_at_min": middle}]
+
+
+class _KeyedWorkers:
+    """Worker threads with one bounded queue each.
+
+    Events for the same object always go to the same worker, so they are
+    handled in the order they were submitted; a full queue blocks the
+    submitter, which keeps a burst of events from piling up in memory.
+    """
+
+    def __init__(self, workers: int, queue_size: int) -> None:
+        self._queues: list[queue.Queue] = [queue.Queue(queue_size) for _ in range(max(1, workers))]
+        self._errors: list[Exception] = []
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(
+                target=self._work, args=(jobs,), name=f"recharge-tailer-{i}", daemon=True
+            )
+            for i, jobs in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self, jobs: queue.Queue) -> None:
+        while True:
+            job = jobs.get()
+            try:
+                if job is _STOP:
+                    return
+                handler, event = job
+                try:
+                    handler(event)
+                except Exception as exc:
+                    with self._lock:
+                        self._errors.append(exc)
+            finally:
+                jobs.task_done()
+
+    def submit(self, key: Hashable, handler: EventHandler, event: Any) -> None:
+        self._queues[hash(key) % len(self._queues)].put((handler, event))
+
+    def drain(self) -> list[Exception]:
+        """Wait for every submitted event; returns the handler errors raised meanwhile."""
+        for jobs in self._queues:
+            jobs.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self) -> None:
+        for jobs in self._queues:
+            jobs.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+
+class EventTailer:
+    """Polls an event resource and dispatches new events to per-``object_type`` handlers.
+
+    ``resource`` is ``api.v2.Event`` and ``query`` its usual list query, e.g.
+    ``{"verbs": "created,updated"}``; tailing a single type is cheaper with
+    ``object_type`` in the query, as the API then filters. The watermark is kept in ``store``
+    under ``key`` (by default the listing URL and query). Without a saved
+    watermark, tailing starts at ``start``, which defaults to now.
+
+    Handlers run on ``workers`` threads, with events for one object always
+    handled in order. The watermark is saved only after every event of a
+    poll has been handled; if a handler raises, :meth:`poll` re-raises the
+    first error and the next poll dispatches the same events again, so
+    handlers should be idempotent.
+
+    A poll holds at most about ``max_events`` events in memory: when the
+    backlog since the watermark is larger, its ``created_at`` range is
+    halved and each half is paged, dispatched and saved in turn, oldest
+    first.
+    """
+
+    def __init__(
+        self,
+        resource: Any,
+        store: WatermarkStore,
+        handlers: Optional[Mapping[str, EventHandler]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        key: Optional[str] = None,
+        start: Optional[str] = None,
+        workers: int = 4,
+        queue_size: int = 100,
+        overlap: timedelta = timedelta(minutes=1),
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        max_events: int = 10_000,
+    ) -> None:
+        self.resource = resource
+        self.store = store
+        self.handlers: dict[str, EventHandler] = dict(handlers or {})
+        self.query = dict(query or {})
+        self.key = key
+        self.start = start or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overlap = overlap
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_events = max_events
+        self._pool: Optional[_KeyedWorkers] = None
+
+    def on(self, object_type: str, handler: Optional[EventHandler] = None) -> Any:
+        """Register ``handler`` for ``object_type``; without one, works as a decorator."""
+        if handler is None:
+
+            def register(handler: EventHandler) -> EventHandler:
+                self.handlers[object_type] = handler
+                return handler
+
+            return register
+        self.handlers[object_type] = handler
+        return handler
+
+    def poll(self) -> int:
+        """Fetch and dispatch the events since the watermark; returns how many were new.
+
+        Events are dispatched oldest first. Events without a handler still
+        move the watermark forward.
+        """
+        run = _Run(
+            self.store,
+            self.overlap,
+            self.resource,
+            self.query,
+            self.key,
+            field="created_at",
+            start=self.start,
+        )
+        if self._pool is None:
+            self._pool = _KeyedWorkers(self.workers, self.queue_size)
+        return self._dispatch(self._pool, run, run.query)
+
+    def _dispatch(self, pool: _KeyedWorkers, run: _Run, query: Mapping[str, Any]) -> int:
+        """Page ``query`` by cursor, dispatch its new events and save the watermark."""
+        pages = self.resource.iter_pages(query)
+        events: list = []
+        for page in pages:
+            events.extend(page)
+            halves = len(events) > self.max_events and _halve(query)
+            if halves:
+                pages.close()
+                return sum(self._dispatch(pool, run, half) for half in halves)
+        events = sorted(run.changed(events), key=_order)
+
+        for event in events:
+            object_type = _get(event, "object_type")
+            handler = self.handlers.get(object_type)
+            if handler is not None:
+                pool.submit((object_type, _get(event, "object_id")), handler, event)
+        errors = pool.drain()
+        if errors:
+            raise errors[0]
+        self.store.save(run.key, run.state())
+        return len(events)
+
+    def run(self, stop: Optional[threading.Event] = None) -> None:
+        """Poll until ``stop`` is set, or until a poll raises.
+
+        The wait after a poll that found events is ``min_interval``; each
+        empty poll doubles it, up to ``max_interval``.
+        """
+        stop = stop or threading.Event()
+        interval = self.min_interval
+        try:
+            while not stop.is_set():
+                if self.poll():
+                    interval = self.min_interval
+                else:
+                    interval = min(interval * 2, self.max_interval)
+                stop.wait(interval)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads; a later :meth:`poll` starts new ones."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
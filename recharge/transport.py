@@ -1,7 +1,7 @@
 from typing import Any, Mapping, Optional, Protocol, runtime_checkable
 
 from requests import Request, Session
-from requests.exceptions import RequestException
+from requests.exceptions import HTTPError, RequestException
 
 
 @runtime_checkable
@@ -14,6 +14,8 @@ class HttpResponse(Protocol):
     def url(self) -> str: ...
     @property
     def links(self) -> dict: ...
+    @property
+    def headers(self) -> Mapping[str, str]: ...
     def json(self) -> Any: ...
     def raise_for_status(self) -> None: ...
 
@@ -30,6 +32,18 @@ class HttpTransport(Protocol):
     ) -> HttpResponse: ...
 
 
+@runtime_checkable
+class AsyncHttpTransport(Protocol):
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: Optional[Mapping[str, Any]],
+        json: Optional[Mapping[str, Any]],
+    ) -> HttpResponse: ...
+
+
 class RequestsTransport:
     def __init__(self, session: Optional[Session] = None) -> None:
         self._session = session or Session()
@@ -48,3 +62,70 @@ class RequestsTransport:
             return self._session.send(prepared)
         except RequestException as exc:
             raise exc
+
+
+class HttpxResponse:
+    """Adapts an ``httpx.Response`` to the :class:`HttpResponse` protocol."""
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+
+    @property
+    def links(self) -> dict:
+        return self._response.links
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    def json(self) -> Any:
+        return self._response.json()
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class HttpxTransport:
+    """Async transport backed by ``httpx.AsyncClient`` (``pip install recharge-api[async]``)."""
+
+    def __init__(self, client: Optional[Any] = None) -> None:
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError(
+                "HttpxTransport requires httpx: pip install recharge-api[async]"
+            ) from exc
+        self._httpx = httpx
+        self._client = client or httpx.AsyncClient()
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        params: Optional[Mapping[str, Any]],
+        json: Optional[Mapping[str, Any]],
+    ) -> HttpResponse:
+        try:
+            response = await self._client.request(
+                method, url, headers=headers, params=params, json=json
+            )
+        except self._httpx.HTTPError as exc:
+            raise RequestException(str(exc)) from exc
+        return HttpxResponse(response)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -2,6 +2,8 @@ from typing import Literal
 
 RechargeVersion = Literal["2021-01", "2021-11"]
 
+ValidationMode = Literal["none", "lazy", "full"]
+
 RechargeScope = Literal[
     "write_orders",
     "read_orders",
@@ -0,0 +1,177 @@
+"""
+Generate the asyncio resource layer in recharge/api/aio from the sync resources.
+
+Every ``RechargeResource`` subclass in recharge/api/v1 and recharge/api/v2 gets an
+``Async*`` twin whose methods are coroutines awaiting ``AsyncRechargeResource``'s
+HTTP helpers. Request bodies, query types and models are imported from the sync
+module, so the two layers cannot drift apart.
+
+Usage:
+    python scripts/generate_async.py          # rewrite recharge/api/aio
+    python scripts/generate_async.py --check  # exit 1 if recharge/api/aio is stale
+"""
+
+import ast
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+API_DIR = ROOT / "recharge" / "api"
+AIO_DIR = API_DIR / "aio"
+VERSIONS = ("v1", "v2")
+LINE_LENGTH = 88
+
+HEADER = (
+    "# Generated by scripts/generate_async.py from {source}.\n"
+    "# Do not edit by hand: change the sync resource and re-run the script.\n"
+)
+
+_AWAITED = re.compile(r"(?<!await )\bself\.(_http_\w+|_paginate\w*)\(")
+_ITERATED = re.compile(r"^(\s*)for (\w+) in self\.(_?iter_\w+)\(")
+_YIELD_FROM = re.compile(r"^(\s*)yield from (\w+)$")
+_STDLIB = {"typing", "collections", "collections.abc"}
+# Methods that send no request and so stay plain functions on the async twin.
+_SYNC_METHODS = ("listing",)
+
+
+def _name_order(name: str) -> tuple[int, str]:
+    if name.isupper():
+        return 0, name
+    if name[0].isupper():
+        return 1, name
+    return 2, name
+
+
+def _format_import(module: str, names: list[str]) -> str:
+    names = sorted(set(names), key=_name_order)
+    line = f"from {module} import {', '.join(names)}"
+    if len(line) <= LINE_LENGTH:
+        return line + "\n"
+    body = "".join(f"    {name},\n" for name in names)
+    return f"from {module} import (\n{body})\n"
+
+
+def _async_class(source: str, name: str) -> str:
+    lines = []
+    for line in source.splitlines():
+        if line.startswith(f"class {name}(RechargeResource):"):
+            line = f"class Async{name}(AsyncRechargeResource):"
+        elif line.startswith("    def ") and not line.startswith(
+            tuple(f"    def {name}(" for name in _SYNC_METHODS)
+        ):
+            line = "    async def " + line[len("    def ") :]
+        line = _AWAITED.sub(r"await self.\1(", line)
+        line = _ITERATED.sub(r"\1async for \2 in self.\3(", line)
+        line = re.sub(r"\bIterator\[", "AsyncIterator[", line)
+        match = _YIELD_FROM.match(line)
+        if match:
+            indent, iterable = match.groups()
+            line = f"{indent}for item in {iterable}:\n{indent}    yield item"
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def _used(names: dict[str, str], code: str) -> dict[str, list[str]]:
+    words = set(re.findall(r"\b\w+\b", code))
+    by_module: dict[str, list[str]] = {}
+    for name, module in names.items():
+        if name in words:
+            by_module.setdefault(module, []).append(name)
+    return by_module
+
+
+def generate_module(path: Path, version: str) -> tuple[str, list[str]]:
+    """Return the generated source for ``path`` and the async class names it defines."""
+    source = path.read_text()
+    tree = ast.parse(source)
+    sync_module = f"recharge.api.{version}.{path.stem}"
+
+    available: dict[str, str] = {"AsyncIterator": "typing"}
+    resources: list[ast.ClassDef] = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module != "recharge.api":
+            for alias in node.names:
+                available[alias.asname or alias.name] = node.module or ""
+        elif isinstance(node, ast.ClassDef) and any(
+            isinstance(base, ast.Name) and base.id == "RechargeResource"
+            for base in node.bases
+        ):
+            resources.append(node)
+        elif isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            available[node.name] = sync_module
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    available[target.id] = sync_module
+
+    classes = [
+        _async_class(ast.get_source_segment(source, node) or "", node.name)
+        for node in resources
+    ]
+    code = "\n\n".join(classes)
+
+    imports = _used(available, code)
+    api_names = ["AsyncRechargeResource"] + [
+        name for name in ("RechargeScope", "RechargeVersion") if re.search(rf"\b{name}\b", code)
+    ]
+    imports.setdefault("recharge.api", []).extend(api_names)
+
+    stdlib = sorted(m for m in imports if m in _STDLIB)
+    first_party = sorted(m for m in imports if m not in _STDLIB)
+    header = HEADER.format(source=path.relative_to(ROOT).as_posix())
+    blocks = []
+    if stdlib:
+        blocks.append("".join(_format_import(m, imports[m]) for m in stdlib))
+    blocks.append("".join(_format_import(m, imports[m]) for m in first_party))
+    text = header + "\n" + "\n".join(blocks) + "\n\n" + code
+    return text, [f"Async{node.name}" for node in resources]
+
+
+def generate_package(version: str) -> dict[Path, str]:
+    outputs: dict[Path, str] = {}
+    exports: list[tuple[str, str]] = []
+    for path in sorted((API_DIR / version).glob("*.py")):
+        if path.name == "__init__.py":
+            continue
+        text, names = generate_module(path, version)
+        outputs[AIO_DIR / version / path.name] = text
+        exports.extend((path.stem, name) for name in names)
+
+    header = HEADER.format(source=f"recharge/api/{version}")
+    lines = [header, "\n"]
+    lines += [f"from .{module} import {name}\n" for module, name in exports]
+    lines.append("\n__all__ = [\n")
+    lines += [f'    "{name}",\n' for _, name in exports]
+    lines.append("]\n")
+    outputs[AIO_DIR / version / "__init__.py"] = "".join(lines)
+    return outputs
+
+
+def generate() -> dict[Path, str]:
+    outputs = {AIO_DIR / "__init__.py": HEADER.format(source="recharge/api")}
+    for version in VERSIONS:
+        outputs.update(generate_package(version))
+    return outputs
+
+
+def main(argv: list[str]) -> int:
+    outputs = generate()
+    if "--check" in argv:
+        stale = [
+            path
+            for path, text in outputs.items()
+            if not path.exists() or path.read_text() != text
+        ]
+        for path in stale:
+            print(f"stale: {path.relative_to(ROOT)}", file=sys.stderr)
+        return 1 if stale else 0
+
+    for path, text in outputs.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -8,6 +8,14 @@ from recharge.model.v2.charge import Charge as ChargeV2
 from recharge.model.v2.customer import Customer as CustomerV2, CustomerDeliverySchedule
 from recharge.model.v2.subscription import Subscription as SubV2
 from recharge.model.v2.plan import Plan
+from recharge.model.base import (
+    LazyModel,
+    compact_list,
+    construct,
+    list_adapter,
+    load_list,
+    validate_list,
+)
 
 
 # ── Extra field tolerance ──────────────────────────────────────────────────
@@ -121,3 +129,125 @@ def test_v2_customer_valid():
     })
     assert c.id == 1
     assert c.first_name == "Joe"
+
+
+# ── Batch validation ───────────────────────────────────────────────────────
+
+def test_validate_list_matches_per_item_validation():
+    data = [{"id": 1, "line_items": None, "extra": "x"}, {"id": 2, "type": "CHECKOUT"}]
+    expected = [ChargeV2.model_validate(dict(item)) for item in data]
+    assert validate_list(ChargeV2, data) == expected
+
+
+def test_validate_list_reuses_adapter():
+    assert list_adapter(ChargeV2) is list_adapter(ChargeV2)
+    assert list_adapter(ChargeV2) is not list_adapter(ChargeV1)
+
+
+def test_list_fields_precomputed_for_every_model():
+    import importlib
+    import pkgutil
+    from typing import get_origin
+
+    import recharge.model
+    from recharge.model.base import RechargeModel
+
+    for module in pkgutil.walk_packages(recharge.model.__path__, "recharge.model."):
+        importlib.import_module(module.name)
+
+    def subclasses(cls):
+        for sub in cls.__subclasses__():
+            yield sub
+            yield from subclasses(sub)
+
+    models = list(subclasses(RechargeModel))
+    assert len(models) > 50
+    for model in models:
+        expected = tuple(
+            name
+            for name, info in model.model_fields.items()
+            if get_origin(info.annotation) is list
+        )
+        assert model._list_fields == expected, model
+
+
+# ── Trusted construction ───────────────────────────────────────────────────
+
+def test_construct_matches_validation_for_clean_data():
+    data = {
+        "id": 1,
+        "status": "QUEUED",
+        "line_items": [{"title": "Coffee", "tax_lines": [{"price": "1.00"}]}],
+        "billing_address": {"city": "Springfield"},
+        "discounts": None,
+        "future_field": "x",
+    }
+    constructed = construct(ChargeV2, dict(data))
+    validated = ChargeV2.model_validate(dict(data))
+    assert constructed == validated
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert constructed.model_extra == {"future_field": "x"}
+    assert constructed.line_items[0].tax_lines[0].price == "1.00"
+
+
+def test_construct_does_not_share_mutable_defaults():
+    first = construct(ChargeV2, {"id": 1})
+    second = construct(ChargeV2, {"id": 2})
+    first.line_items.append("x")
+    assert second.line_items == []
+
+
+def test_load_list_validation_modes():
+    data = [{"id": "1", "status": "queued", "billing_address": {"zip": 1}}]
+    (trusted,) = load_list(ChargeV2, [dict(item) for item in data], "none")
+    assert trusted.id == "1" and trusted.status == "queued"
+    (validated,) = load_list(ChargeV2, [{**item, "billing_address": None} for item in data])
+    assert validated.id == 1 and validated.status == "QUEUED"
+
+
+def test_lazy_model_validates_nested_models_on_first_access():
+    data = {"id": 1, "status": "queued", "line_items": [{"title": "Coffee"}], "discounts": None}
+    (charge,) = load_list(ChargeV2, [data], "lazy")
+    assert isinstance(charge, LazyModel)
+    assert charge.id == 1 and charge.status == "queued"
+    assert "line_items" not in charge.__dict__
+    line_items = charge.line_items
+    assert type(line_items[0]).__name__ == "ChargeLineItem"
+    assert charge.line_items is line_items
+    assert charge.discounts == [] and charge.note is None
+    assert charge.validate() == ChargeV2.model_validate(data)
+    with pytest.raises(AttributeError):
+        charge.not_a_field
+    with pytest.raises(AttributeError):
+        charge.id = 2
+
+
+# ── Compact records ────────────────────────────────────────────────────────
+
+def test_compact_list_drops_extras_and_interns_repeated_strings():
+    def record(i):
+        # Built at runtime so equal values are distinct string objects.
+        return {
+            "id": i,
+            "currency": "".join(["US", "D"]),
+            "status": "".join(["QUEU", "ED"]),
+            "line_items": [{"sku": "-".join(["COFFEE", "1LB"]), "legacy_sku": "C1"}],
+            "commit_update": False,
+        }
+
+    data = [record(1), record(2)]
+    compacted = compact_list(ChargeV2, data)
+    assert "commit_update" not in compacted[0]
+    assert compacted[0]["line_items"] == [{"sku": "COFFEE-1LB"}]
+    assert "commit_update" in data[0]  # the input is left alone
+    first, second = compacted
+    assert first["currency"] is second["currency"]
+    assert first["status"] is second["status"]
+    assert first["line_items"][0]["sku"] is second["line_items"][0]["sku"]
+
+    for validation in ("full", "none", "lazy"):
+        models = load_list(ChargeV2, [record(1), record(2)], validation, compact=True)
+        assert models[0].currency is models[1].currency
+        if validation != "lazy":
+            assert models[0].model_extra == {}
+
@@ -0,0 +1,136 @@
+import asyncio
+import copy
+import json
+from decimal import Decimal
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.aio.v2 import AsyncChargeResource
+from recharge.api.v1.addresses import AddressResource
+from recharge.api.v2.charges import ChargeResource
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.arrow import (
+    aiter_record_batches,
+    arrow_schema,
+    iter_record_batches,
+    record_batch,
+    resource_model,
+    to_table,
+    write_parquet,
+)
+from recharge.model.v2.charge import Charge
+from recharge.model.v2.subscription import Subscription
+from tests.conftest import ALL_SCOPES, BASE_URL, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+
+pa = pytest.importorskip("pyarrow")
+
+CHARGE = {
+    "id": 1,
+    "status": "success",
+    "currency": "USD",
+    "total_price": "40.32",
+    "total_discounts": "",
+    "line_items": [
+        {
+            "title": "Coffee",
+            "unit_price": "18.00",
+            "quantity": 2,
+            "tax_lines": [{"price": "1.44", "rate": 0.08}],
+            "not_in_the_model": True,
+        }
+    ],
+    "billing_address": {"city": "Springfield"},
+    "analytics_data": {"utm_params": []},
+    "undocumented": {"x": 1},
+}
+
+
+def _charge(**overrides):
+    # record_batch converts records in place, so every use gets its own copy.
+    return {**copy.deepcopy(CHARGE), **overrides}
+
+
+def test_schema_follows_the_model():
+    schema = arrow_schema(Subscription)
+    assert schema.names == list(Subscription.model_fields)
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("is_prepaid").type == pa.bool_()
+    assert schema.field("price").type == pa.decimal128(19, 4)
+    assert schema.field("status").type == pa.string()
+    assert schema.field("external_product_id").type == pa.struct([("ecommerce", pa.string())])
+    assert schema.field("properties").type == pa.list_(
+        pa.struct([("name", pa.string()), ("value", pa.string())])
+    )
+
+
+def test_record_batch_parses_money_and_ignores_undeclared_keys():
+    batch = record_batch(Charge, [_charge(), {"id": 2, "total_price": None}])
+    rows = batch.to_pylist()
+    assert batch.schema == arrow_schema(Charge)
+    assert rows[0]["total_price"] == Decimal("40.32")
+    assert rows[0]["total_discounts"] is None
+    assert rows[0]["line_items"][0]["unit_price"] == Decimal("18.00")
+    assert rows[0]["line_items"][0]["tax_lines"][0]["rate"] == "0.08"  # str | float as text
+    assert "undocumented" not in batch.schema.names
+    assert rows[1]["line_items"] is None and rows[1]["total_price"] is None
+
+
+def test_conversion_errors_name_the_field():
+    with pytest.raises(ValueError, match=r"Charge\.total_price 'n/a'"):
+        record_batch(Charge, [_charge(total_price="n/a")])
+    with pytest.raises(ValueError, match=r"Charge\.id of record 'abc' to int64"):
+        record_batch(Charge, [_charge(), _charge(id="abc")])
+
+
+def test_resource_model_reads_iter_pages_annotation(client):
+    assert resource_model(make_resource(ChargeResource, client)) is Charge
+    assert resource_model(make_resource(SubscriptionResource, client)) is Subscription
+
+
+@responses_lib.activate
+def test_streams_pages_without_validation(client, tmp_path):
+    def page(request):
+        # "success" would fail validation: charge statuses are uppercase literals.
+        if "cursor=abc" in request.url:
+            return 200, {}, json.dumps({"charges": [_charge(id=2)], "next_cursor": None})
+        return 200, {}, json.dumps({"charges": [_charge()], "next_cursor": "abc"})
+
+    responses_lib.add_callback(responses_lib.GET, f"{BASE_URL}/charges", callback=page)
+    resource = make_resource(ChargeResource, client)
+    batches = list(iter_record_batches(resource, {"limit": "1"}))
+    assert [batch.num_rows for batch in batches] == [1, 1]
+
+    table = to_table(resource, {"limit": "1"})
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("status").to_pylist() == ["success", "success"]
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "charges.parquet"
+    assert write_parquet(resource, path, {"limit": "1"}) == 2
+    assert pq.read_table(path).equals(table)
+
+
+@responses_lib.activate
+def test_args_come_before_the_query(client):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/customers/7/addresses",
+        json={"addresses": [{"id": 3, "customer_id": 7, "city": "Springfield"}]},
+    )
+    table = to_table(make_resource(AddressResource, client), args=("7",))
+    assert table.column("city").to_pylist() == ["Springfield"]
+
+
+def test_async_resources_stream_record_batches():
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(200, {"charges": [_charge()], "next_cursor": None})]
+    )
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+
+    async def run():
+        return [batch async for batch in aiter_record_batches(resource)]
+
+    (batch,) = asyncio.run(run())
+    assert batch.column("total_price").to_pylist() == [Decimal("40.32")]
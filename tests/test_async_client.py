@@ -0,0 +1,238 @@
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from requests.exceptions import HTTPError, RequestException
+
+from recharge import AsyncRechargeAPI
+from recharge.api.aio.v1 import AsyncOrderResource
+from recharge.api.aio.v2 import AsyncChargeResource
+from recharge.client import AsyncRechargeClient
+from recharge.exceptions import RechargeHTTPError, RechargeRequestException
+from recharge.retry import ExponentialBackoffRetry
+from tests.conftest import ALL_SCOPES, BASE_URL
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class _FakeResponse:
+    def __init__(self, status, data, url=f"{BASE_URL}/charges", links=None):
+        self.status_code = status
+        self._data = data
+        self.text = str(data)
+        self.url = url
+        self.links = links or {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(response=self)
+
+
+class _FakeAsyncTransport:
+    """Serves queued responses, optionally sleeping to simulate network latency."""
+
+    def __init__(self, responses=(), latency=0.0):
+        self.responses = list(responses)
+        self.latency = latency
+        self.calls = []
+
+    async def send(self, method, url, headers, params, json):
+        self.calls.append((method, url, dict(headers), params, json))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _make_client(transport, max_retries=0):
+    return AsyncRechargeClient(
+        access_token="test",
+        transport=transport,
+        retry_strategy=ExponentialBackoffRetry(max_retries=max_retries, base_delay=0.001),
+        logging_level=50,
+    )
+
+
+def test_async_get_returns_data():
+    transport = _FakeAsyncTransport([_FakeResponse(200, {"charges": [{"id": 1}]})])
+    client = _make_client(transport)
+    data = asyncio.run(client.get(f"{BASE_URL}/charges", response_key="charges", expected=list))
+    assert data == [{"id": 1}]
+
+
+def test_async_retry_on_429_then_success():
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(429, {"error": "rate limited"}), _FakeResponse(200, {"charge": {"id": 3}})]
+    )
+    client = _make_client(transport, max_retries=1)
+    data = asyncio.run(client.get(f"{BASE_URL}/charges", response_key="charge"))
+    assert data["id"] == 3
+    assert len(transport.calls) == 2
+
+
+def test_async_http_error_raises():
+    transport = _FakeAsyncTransport([_FakeResponse(404, {"error": "Not found"})])
+    client = _make_client(transport)
+    with pytest.raises(RechargeHTTPError) as exc_info:
+        asyncio.run(client.get(f"{BASE_URL}/charges/999"))
+    assert exc_info.value.status_code == 404
+
+
+def test_async_transport_error_raises():
+    transport = _FakeAsyncTransport([RequestException("boom")])
+    client = _make_client(transport)
+    with pytest.raises(RechargeRequestException):
+        asyncio.run(client.get(f"{BASE_URL}/charges"))
+
+
+def test_async_resource_get_sends_version_header():
+    charge = {"id": 1, "status": "SUCCESS", "type": "RECURRING"}
+    transport = _FakeAsyncTransport([_FakeResponse(200, {"charge": charge})])
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+    result = asyncio.run(resource.get("1"))
+    assert result.id == 1
+    assert transport.calls[0][2]["X-Recharge-Version"] == "2021-11"
+
+
+def test_async_list_all_follows_cursor():
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(
+                200,
+                {"charges": [{"id": 1}], "next_cursor": "abc"},
+                url=f"{BASE_URL}/charges?limit=1",
+            ),
+            _FakeResponse(200, {"charges": [{"id": 2}], "next_cursor": None}),
+        ]
+    )
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+    results = asyncio.run(resource.list_all({"limit": "1"}))
+    assert [c.id for c in results] == [1, 2]
+    assert "cursor=abc" in transport.calls[1][1]
+
+
+def test_async_iter_all_streams_pages():
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(
+                200,
+                {"charges": [{"id": 1}], "next_cursor": "abc"},
+                url=f"{BASE_URL}/charges?limit=1",
+            ),
+            _FakeResponse(200, {"charges": [{"id": 2}], "next_cursor": None}),
+        ]
+    )
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+
+    async def run():
+        seen = []
+        async for charge in resource.iter_all({"limit": "1"}):
+            seen.append((charge.id, len(transport.calls)))
+        return seen
+
+    assert asyncio.run(run()) == [(1, 1), (2, 2)]
+
+
+def test_async_v1_list_all_follows_link_header():
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(
+                200,
+                {"orders": [{"id": 1}]},
+                links={"next": {"url": f"{BASE_URL}/orders?page=2"}},
+            ),
+            _FakeResponse(200, {"orders": [{"id": 2}]}),
+        ]
+    )
+    resource = AsyncOrderResource(_make_client(transport), scopes=ALL_SCOPES)
+    results = asyncio.run(resource.list_all())
+    assert [o.id for o in results] == [1, 2]
+    assert transport.calls[0][2]["X-Recharge-Version"] == "2021-01"
+
+
+def test_async_v1_list_all_with_concurrency_keeps_page_order():
+    """Later pages answering first must not reorder the results."""
+    transport = _FakeAsyncTransport([_FakeResponse(200, {"count": 3})])
+    resource = AsyncOrderResource(_make_client(transport), scopes=ALL_SCOPES)
+
+    async def send(method, url, headers, params, json):
+        transport.calls.append((method, url, dict(headers), params, json))
+        if url.endswith("/count"):
+            return _FakeResponse(200, {"count": 3})
+        page = params["page"]
+        await asyncio.sleep(0.01 * (4 - page))
+        return _FakeResponse(200, {"orders": [{"id": page}]})
+
+    transport.send = send
+    results = asyncio.run(resource.list_all({"limit": 1}, concurrency=3))
+    assert [o.id for o in results] == [1, 2, 3]
+    assert len(transport.calls) == 4
+
+
+def test_async_requests_run_concurrently():
+    """Many in-flight requests on one loop should take roughly one latency, not N."""
+    n = 50
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(200, {"charge": {"id": i}}) for i in range(n)], latency=0.05
+    )
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+
+    async def run():
+        return await asyncio.gather(*(resource.get(str(i)) for i in range(n)))
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    assert len(results) == n
+    assert elapsed < 0.05 * n / 4
+
+
+def test_async_rate_limiter_runs_off_the_event_loop():
+    threads = []
+
+    class _Limiter:
+        def reserve(self):
+            threads.append(threading.get_ident())
+            return 0.0
+
+        def observe(self, response):
+            threads.append(threading.get_ident())
+
+    transport = _FakeAsyncTransport([_FakeResponse(200, {"charge": {"id": 1}})])
+    client = AsyncRechargeClient("test", transport=transport, rate_limiter=_Limiter())
+
+    async def run():
+        await client.get(f"{BASE_URL}/charges/1", response_key="charge")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+def test_async_api_create_fetches_scopes():
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(200, {"token_information": {"scopes": ["read_orders"]}})]
+    )
+    client = _make_client(transport)
+    api = asyncio.run(AsyncRechargeAPI.create("test", client=client))
+    assert api.scopes == ["read_orders"]
+    assert isinstance(api.v2.Charge, AsyncChargeResource)
+
+
+def test_generated_async_resources_are_up_to_date():
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "scripts" / "generate_async.py"), "--check"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
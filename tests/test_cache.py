@@ -0,0 +1,237 @@
+import asyncio
+import json
+import threading
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.v2.plans import PlanResource
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.cache import (
+    BaseResponseCache,
+    CachedResponse,
+    MemoryResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+)
+from recharge.client import RechargeClient
+from recharge.retry import ExponentialBackoffRetry
+from tests.conftest import BASE_URL, TEST_TOKEN, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+
+PLANS = {"plans": [{"id": 1, "title": "Monthly"}], "next_cursor": None}
+
+
+def _client(cache, token=TEST_TOKEN):
+    return RechargeClient(
+        access_token=token,
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=50,
+        cache=cache,
+    )
+
+
+@responses_lib.activate
+def test_repeated_reads_are_served_from_the_cache():
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/plans", json=PLANS)
+    cache = MemoryResponseCache()
+    assert isinstance(cache, ResponseCache)
+    plans = make_resource(PlanResource, _client(cache)).with_validation("none")
+
+    first = plans.list_({"type": "subscription"})
+    first[0].title = "changed by the caller"
+    assert plans.list_({"type": "subscription"})[0].title == "Monthly"
+    plans.list_({"type": "prepaid"})
+    assert len(responses_lib.calls) == 2
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+
+@responses_lib.activate
+def test_tokens_do_not_share_entries():
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/store", json={"store": {"id": 1}})
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/store", json={"store": {"id": 2}})
+    cache = MemoryResponseCache()
+    first, second = _client(cache, "token-one"), _client(cache, "token-two")
+
+    assert first.get(f"{BASE_URL}/store", response_key="store") == {"id": 1}
+    assert second.get(f"{BASE_URL}/store", response_key="store") == {"id": 2}
+    assert first.get(f"{BASE_URL}/store", response_key="store") == {"id": 1}
+    assert len(responses_lib.calls) == 2
+    assert cache.stats().entries == 2
+    assert not any("token-" in key for key in cache._entries)
+
+
+def test_backends_must_implement_the_storage_hooks():
+    class _Incomplete(BaseResponseCache):
+        def _get(self, key):
+            return None
+
+    with pytest.raises(TypeError, match="_drop"):
+        _Incomplete()
+
+
+@responses_lib.activate
+def test_only_configured_segments_are_cached():
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/subscriptions", json={"subscriptions": []})
+    cache = MemoryResponseCache()
+    subscriptions = make_resource(SubscriptionResource, _client(cache))
+    subscriptions.list_()
+    subscriptions.list_()
+    assert len(responses_lib.calls) == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+@responses_lib.activate
+def test_writes_invalidate_their_segment():
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/plans", json=PLANS)
+    responses_lib.add(responses_lib.POST, f"{BASE_URL}/plans", json={"plan": {"id": 2}})
+    plans = make_resource(PlanResource, _client(MemoryResponseCache())).with_validation("none")
+    plans.list_()
+    plans._http_post(plans._url, {"title": "Weekly"})
+    plans.list_()
+    assert [call.request.method for call in responses_lib.calls] == ["GET", "POST", "GET"]
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("recharge.cache.time.monotonic", lambda: now[0])
+    cache = MemoryResponseCache(ttls={"plans": 60})
+    response = CachedResponse(200, b"{}", f"{BASE_URL}/plans")
+    cache.store("GET", f"{BASE_URL}/plans", None, "2021-11", response)
+    now[0] += 59
+    assert cache.lookup("GET", f"{BASE_URL}/plans", None, "2021-11") is not None
+    now[0] += 2
+    assert cache.lookup("GET", f"{BASE_URL}/plans", None, "2021-11") is None
+    assert cache.stats().entries == 0
+
+
+def test_least_recently_used_entries_are_evicted_by_size():
+    cache = MemoryResponseCache(ttls={"plans": 60}, max_size=25)
+    for page in ("1", "2", "3"):
+        url = f"{BASE_URL}/plans?page={page}"
+        cache.store("GET", url, None, "2021-11", CachedResponse(200, b"0123456789", url))
+        cache.lookup("GET", f"{BASE_URL}/plans?page=1", None, "2021-11")  # keep page 1 warm
+    assert cache.lookup("GET", f"{BASE_URL}/plans?page=2", None, "2021-11") is None
+    assert cache.lookup("GET", f"{BASE_URL}/plans?page=3", None, "2021-11") is not None
+    assert cache.stats().size == 20
+
+
+def test_async_client_uses_the_cache():
+    response = _FakeResponse(200, {"store": {"id": 1}}, url=f"{BASE_URL}/store")
+    response.text = json.dumps({"store": {"id": 1}})
+    transport = _FakeAsyncTransport([response])
+    client = _make_client(transport)
+    client._cache = cache = MemoryResponseCache()
+
+    async def main():
+        return [await client.get(f"{BASE_URL}/store", response_key="store") for _ in range(2)]
+
+    assert asyncio.run(main()) == [{"id": 1}, {"id": 1}]
+    assert len(transport.calls) == 1
+    assert cache.hits == 1
+
+
+def test_async_client_reads_the_cache_off_the_event_loop(tmp_path):
+    response = _FakeResponse(200, {"store": {"id": 1}}, url=f"{BASE_URL}/store")
+    response.text = json.dumps({"store": {"id": 1}})
+    threads = []
+
+    class _Cache(SQLiteResponseCache):
+        def _get(self, key):
+            threads.append(threading.get_ident())
+            return super()._get(key)
+
+    client = _make_client(_FakeAsyncTransport([response]))
+    client._cache = cache = _Cache(str(tmp_path / "cache.db"))
+
+    async def main():
+        for _ in range(2):
+            await client.get(f"{BASE_URL}/store", response_key="store")
+        return threading.get_ident()
+
+    assert asyncio.run(main()) not in threads
+    assert (len(threads), cache.hits) == (2, 1)
+
+
+def test_sqlite_cache_is_shared_and_compressed(tmp_path):
+    path = str(tmp_path / "cache.db")
+    body = json.dumps({"plans": [{"id": i, "title": "Monthly"} for i in range(200)]}).encode()
+    writer = SQLiteResponseCache(path)
+    assert isinstance(writer, ResponseCache)
+    links = {"next": {"url": f"{BASE_URL}/plans?cursor=x"}}
+    writer.store("GET", f"{BASE_URL}/plans", None, "2021-11", CachedResponse(200, body, "u", links))
+    writer.close()
+
+    reader = SQLiteResponseCache(path)  # e.g. a freshly started worker
+    entry = reader.lookup("GET", f"{BASE_URL}/plans", None, "2021-11")
+    assert (entry.status_code, entry.body, entry.links) == (200, body, links)
+    assert entry.json()["plans"][199]["id"] == 199
+    stats = reader.stats()
+    assert (stats.hits, stats.entries) == (1, 1)
+    assert stats.size < len(body) // 5
+
+    reader.invalidate(f"{BASE_URL}/plans/2")
+    assert reader.lookup("GET", f"{BASE_URL}/plans", None, "2021-11") is None
+    reader.close()
+
+
+@responses_lib.activate
+def test_sqlite_cache_keeps_tokens_apart(tmp_path):
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/store", json={"store": {"id": 1}})
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/store", json={"store": {"id": 2}})
+    path = str(tmp_path / "cache.db")
+    first = _client(SQLiteResponseCache(path), "token-one")
+    second = _client(SQLiteResponseCache(path), "token-two")  # e.g. another worker
+
+    assert first.get(f"{BASE_URL}/store", response_key="store") == {"id": 1}
+    assert second.get(f"{BASE_URL}/store", response_key="store") == {"id": 2}
+    assert second.get(f"{BASE_URL}/store", response_key="store") == {"id": 2}
+    assert len(responses_lib.calls) == 2
+    cache = SQLiteResponseCache(path)
+    rows = cache._connection().execute("SELECT key FROM recharge_response_cache").fetchall()
+    assert len(rows) == 2
+    assert not any("token-" in key for (key,) in rows)
+    cache.close()
+
+
+def test_sqlite_entries_expire(tmp_path):
+    now = [1000.0]
+    cache = SQLiteResponseCache(
+        str(tmp_path / "cache.db"), ttls={"plans": 60}, clock=lambda: now[0]
+    )
+    cache.store("GET", f"{BASE_URL}/plans", None, None, CachedResponse(200, b"{}", "u"))
+    now[0] += 59
+    assert cache.lookup("GET", f"{BASE_URL}/plans", None, None) is not None
+    now[0] += 2
+    assert cache.lookup("GET", f"{BASE_URL}/plans", None, None) is None
+    assert cache.stats().entries == 0
+
+
+def test_sqlite_evicts_expired_then_least_recently_read(tmp_path):
+    now = [1000.0]
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteResponseCache(path, ttls={"plans": 60, "store": 10}, clock=lambda: now[0])
+    body = json.dumps(PLANS).encode()
+
+    def store(url):
+        cache.store("GET", url, None, None, CachedResponse(200, body, url))
+
+    store(f"{BASE_URL}/store")
+    entry_size = cache.stats().size
+    cache.max_size = 2 * entry_size
+    cache.touch_interval = 0
+    now[0] += 1
+    store(f"{BASE_URL}/plans?page=1")
+    now[0] += 10  # the store entry has expired
+    assert cache.lookup("GET", f"{BASE_URL}/plans?page=1", None, None) is not None
+    store(f"{BASE_URL}/plans?page=2")
+    assert cache.stats().entries == 2  # only the expired entry made room
+
+    now[0] += 1
+    assert cache.lookup("GET", f"{BASE_URL}/plans?page=1", None, None) is not None
+    now[0] += 1
+    store(f"{BASE_URL}/plans?page=3")
+    assert cache.lookup("GET", f"{BASE_URL}/plans?page=2", None, None) is None
+    assert cache.lookup("GET", f"{BASE_URL}/plans?page=1", None, None) is not None
+    assert cache.stats().size == 2 * entry_size
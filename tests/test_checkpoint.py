@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.aio.v2 import AsyncChargeResource
+from recharge.api.v2.charges import ChargeResource
+from recharge.checkpoint import (
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from recharge.client import RechargeClient
+from recharge.exceptions import RechargeRequestException
+from recharge.pagination import Page
+from recharge.retry import ExponentialBackoffRetry
+from tests.conftest import ALL_SCOPES, BASE_URL, TEST_TOKEN, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+from tests.test_export import _cursor_pages
+
+URL = f"{BASE_URL}/charges"
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCheckpointStore()
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoints"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+def test_store_round_trip(store):
+    assert isinstance(store, CheckpointStore)
+    assert store.load("charges") is None
+    store.save("charges", Page([{"id": 1}, {"id": 2}], f"{URL}?cursor=c2"))
+    store.save("charges", Page([{"id": 3}], f"{URL}?cursor=c3"))
+    store.save("orders", Page([{"id": 9}], None))
+    state = store.load("charges")
+    assert state.records == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert state.next_url == f"{URL}?cursor=c3"
+    store.clear("charges")
+    assert store.load("charges") is None
+    assert store.load("orders").records == [{"id": 9}]
+
+
+def test_store_accepts_long_keys(store):
+    key = (
+        f"{URL}?created_at_min=2024-01-01T00%3A00%3A00%2B00%3A00"
+        "&created_at_max=2024-12-31T23%3A59%3A59%2B00%3A00&status=queued"
+        "&customer_id=123456789&sort_by=created_at-desc&limit=250" * 2
+    )
+    store.save(key, Page([{"id": 1}], None))
+    assert store.load(key).records == [{"id": 1}]
+    assert store.load(key[:-1]) is None
+
+
+def test_file_store_drops_a_torn_page(tmp_path):
+    store = FileCheckpointStore(str(tmp_path))
+    store.save(URL, Page([{"id": 1}], f"{URL}?cursor=c2"))
+    with open(store._path(URL), "a") as file:
+        file.write('{"next_url": null, "rec')  # killed mid-write
+    assert store.load(URL).next_url == f"{URL}?cursor=c2"
+    store.save(URL, Page([{"id": 2}], None))
+    assert store.load(URL).records == [{"id": 1}, {"id": 2}]
+
+
+@responses_lib.activate
+def test_paginate_resumes_from_checkpoint(client, store):
+    _cursor_pages(fail_on="c3")
+    with pytest.raises(RechargeRequestException):
+        client.paginate(URL, {"limit": 2}, "charges", checkpoint=store)
+    assert len(store.load(f"{URL}?limit=2").records) == 4
+
+    data = client.paginate(URL, {"limit": 2}, "charges", checkpoint=store)
+    assert [record["id"] for record in data] == [1, 2, 3, 4, 5]
+    assert len(responses_lib.calls) == 4  # only the failed page is requested again
+    assert store.load(f"{URL}?limit=2") is None
+
+
+@responses_lib.activate
+def test_transport_errors_are_retried_per_page():
+    _cursor_pages(fail_on="c2")
+    client = RechargeClient(
+        access_token=TEST_TOKEN,
+        retry_strategy=ExponentialBackoffRetry(max_retries=1, base_delay=0.001, jitter=0),
+        logging_level=50,
+    )
+    data = client.paginate(URL, {"limit": 2}, "charges")
+    assert [record["id"] for record in data] == [1, 2, 3, 4, 5]
+    assert len(responses_lib.calls) == 4
+
+
+@responses_lib.activate
+def test_list_all_with_checkpoint(client):
+    _cursor_pages(fail_on="c2")
+    store = MemoryCheckpointStore()
+    resource = make_resource(ChargeResource, client).with_validation("none")
+    with pytest.raises(RechargeRequestException):
+        resource.with_checkpoint(store, key="nightly").list_all()
+    assert resource.checkpoint is None
+    assert [record["id"] for record in store.load("nightly").records] == [1, 2]
+    charges = resource.with_checkpoint(store, key="nightly").list_all()
+    assert [charge.id for charge in charges] == [1, 2, 3, 4, 5]
+
+
+def test_async_paginate_resumes_from_checkpoint():
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(200, {"charges": [{"id": 1}], "next_cursor": "c2"}),
+            RechargeRequestException("Request failed", cause=OSError("reset")),
+        ]
+    )
+    store = MemoryCheckpointStore()
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+    resource = resource.with_checkpoint(store).with_validation("none")
+    with pytest.raises(RechargeRequestException):
+        asyncio.run(resource.list_all())
+    transport.responses = [_FakeResponse(200, {"charges": [{"id": 2}], "next_cursor": None})]
+    charges = asyncio.run(resource.list_all())
+    assert [charge.id for charge in charges] == [1, 2]
+    assert "cursor=c2" in transport.calls[-1][1]
@@ -180,3 +180,115 @@ def test_thread_safe_retry_counters():
 
     assert not errors, f"Unexpected errors in threads: {errors}"
     assert len(results) == 8, f"Expected 8 results, got {len(results)}"
+
+
+def test_shared_client_mixed_versions_under_concurrency():
+    """v1 and v2 resources sharing one client must never send each other's version header.
+
+    The version used to be stored on the client before each request, so a v1 call on one
+    thread could send (or paginate with) the version set by a v2 call on another thread.
+    """
+    import json as _json
+    from concurrent.futures import ThreadPoolExecutor
+
+    from requests.exceptions import HTTPError
+
+    from recharge.api.v1.orders import OrderResource
+    from recharge.api.v2.charges import ChargeResource
+    from tests.conftest import ALL_SCOPES
+
+    class _FakeResponse:
+        def __init__(self, data, url, links=None):
+            self.status_code = 200
+            self._data = data
+            self.text = _json.dumps(data)
+            self.url = url
+            self.links = links or {}
+
+        def json(self):
+            return self._data
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise HTTPError(response=self)
+
+    expected_versions = {"orders": "2021-01", "charges": "2021-11"}
+    mismatches = []
+
+    class _VersionCheckingTransport:
+        def send(self, method, url, headers, params, json_body):
+            resource = "orders" if "/orders" in url else "charges"
+            if headers.get("X-Recharge-Version") != expected_versions[resource]:
+                mismatches.append((url, headers.get("X-Recharge-Version")))
+            time.sleep(0.0005)  # widen the window for interleaving
+            if resource == "orders":
+                if "page=2" in url:
+                    return _FakeResponse({"orders": [{"id": 2}]}, url)
+                return _FakeResponse(
+                    {"orders": [{"id": 1}]},
+                    url,
+                    links={"next": {"url": f"{BASE_URL}/orders?page=2"}},
+                )
+            if "cursor=next" in url:
+                return _FakeResponse({"charges": [{"id": 2}], "next_cursor": None}, url)
+            return _FakeResponse(
+                {"charges": [{"id": 1}], "next_cursor": "next"}, f"{BASE_URL}/charges"
+            )
+
+    shared_client = RechargeClient(
+        access_token="test",
+        transport=_VersionCheckingTransport(),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=50,
+    )
+    orders = OrderResource(shared_client, scopes=ALL_SCOPES)
+    charges = ChargeResource(shared_client, scopes=ALL_SCOPES)
+
+    def call(i):
+        if i % 2:
+            return [o.id for o in orders.list_all()]
+        return [c.id for c in charges.list_all()]
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        results = list(pool.map(call, range(1000)))
+
+    assert not mismatches, f"{len(mismatches)} requests sent the wrong version: {mismatches[:5]}"
+    assert all(result == [1, 2] for result in results)
+
+
+def test_paginate_decodes_each_page_once():
+    class _Response:
+        decodes = 0
+
+        def __init__(self, body, url):
+            self.status_code = 200
+            self.headers = {}
+            self.text = ""
+            self.url = url
+            self.links = {}
+            self._body = body
+
+        def json(self):
+            _Response.decodes += 1
+            return self._body
+
+        def raise_for_status(self):
+            pass
+
+    class _Transport:
+        def __init__(self):
+            self.urls = []
+
+        def send(self, method, url, headers, params, json_body):
+            self.urls.append((url, params))
+            cursor = "c2" if len(self.urls) == 1 else None
+            return _Response({"charges": [{"id": len(self.urls)}], "next_cursor": cursor}, url)
+
+    transport = _Transport()
+    client = RechargeClient(access_token="test", transport=transport, logging_level=50)
+    data = client.paginate(
+        f"{BASE_URL}/charges", {"status": "queued", "limit": 1}, "charges", version="2021-11"
+    )
+    assert data == [{"id": 1}, {"id": 2}]
+    assert _Response.decodes == 2
+    assert transport.urls[1] == (f"{BASE_URL}/charges?limit=1&cursor=c2", None)
@@ -0,0 +1,147 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+import responses as responses_lib
+from requests.exceptions import ConnectionError
+
+from recharge.api.aio.v2 import AsyncChargeResource
+from recharge.api.v1.addresses import AddressResource
+from recharge.api.v1.orders import OrderResource
+from recharge.api.v2.charges import ChargeResource
+from recharge.exceptions import RechargeAPIError, RechargeRequestException
+from recharge.export import (
+    CHECKPOINT_SUFFIX,
+    ExportCheckpoint,
+    aexport_ndjson,
+    export_ndjson,
+)
+from tests.conftest import ALL_SCOPES, BASE_URL, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+
+
+def _charges(*ids):
+    return [{"id": i, "status": "success", "note": "café"} for i in ids]
+
+
+def _cursor_pages(fail_on=None):
+    """Three charge pages chained by cursor; ``fail_on`` cursor raises a transport error once."""
+    pages = {None: (_charges(1, 2), "c2"), "c2": (_charges(3, 4), "c3"), "c3": (_charges(5), None)}
+    failures = {fail_on} - {None}
+
+    def callback(request):
+        cursor = request.url.partition("cursor=")[2] or None
+        if cursor in failures:
+            failures.discard(cursor)
+            raise ConnectionError("connection reset")
+        records, next_cursor = pages[cursor]
+        return 200, {}, json.dumps({"charges": records, "next_cursor": next_cursor})
+
+    responses_lib.add_callback(responses_lib.GET, f"{BASE_URL}/charges", callback=callback)
+
+
+def _ids(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line)["id"] for line in file]
+
+
+@responses_lib.activate
+def test_export_writes_one_record_per_line(client, tmp_path):
+    _cursor_pages()
+    path = tmp_path / "charges.ndjson"
+    result = export_ndjson(make_resource(ChargeResource, client), path, {"limit": 2})
+    assert (result.pages, result.records, result.next_url) == (3, 5, None)
+    assert _ids(path) == [1, 2, 3, 4, 5]
+    assert '"note":"café"' in path.read_text(encoding="utf-8")
+    assert not (tmp_path / f"charges.ndjson{CHECKPOINT_SUFFIX}").exists()
+    assert "limit=2&cursor=c2" in responses_lib.calls[1].request.url
+
+
+@responses_lib.activate
+def test_export_resumes_after_a_crash(client, tmp_path):
+    _cursor_pages(fail_on="c3")
+    path = tmp_path / "charges.ndjson.gz"
+    checkpoint = tmp_path / f"charges.ndjson.gz{CHECKPOINT_SUFFIX}"
+    resource = make_resource(ChargeResource, client)
+
+    with pytest.raises(RechargeRequestException):
+        export_ndjson(resource, path, {"limit": 2})
+    saved = ExportCheckpoint.load(checkpoint)
+    assert saved.pages == 2 and saved.next_url.endswith("cursor=c3")
+    assert saved.offset == path.stat().st_size
+    with open(path, "ab") as file:
+        file.write(b"\x1f\x8b half a page")  # killed mid-write
+
+    result = export_ndjson(resource, path, {"limit": 2})
+    assert (result.pages, result.records) == (3, 5)
+    assert _ids(path) == [1, 2, 3, 4, 5]
+    assert not checkpoint.exists()
+    assert len(responses_lib.calls) == 4  # the first two pages are not fetched again
+
+
+@responses_lib.activate
+def test_export_rejects_a_checkpoint_for_another_listing(client, tmp_path):
+    path = tmp_path / "charges.ndjson"
+    ExportCheckpoint(f"{BASE_URL}/charges?status=queued", None).save(f"{path}{CHECKPOINT_SUFFIX}")
+    with pytest.raises(ValueError, match="delete it to start over"):
+        export_ndjson(make_resource(ChargeResource, client), path, {"status": "success"})
+
+
+@responses_lib.activate
+def test_export_follows_v1_page_links(client, tmp_path):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/orders",
+        json={"orders": [{"id": 1}]},
+        headers={"Link": f'<{BASE_URL}/orders?page=2>; rel="next"'},
+    )
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/orders?page=2", json={"orders": [{"id": 2}]})
+    path = tmp_path / "orders.ndjson"
+    export_ndjson(make_resource(OrderResource, client), path)
+    assert _ids(path) == [1, 2]
+
+
+@responses_lib.activate
+def test_export_uses_the_resources_own_listing(client, tmp_path):
+    responses_lib.add(
+        responses_lib.GET, f"{BASE_URL}/customers/7/addresses", json={"addresses": [{"id": 3}]}
+    )
+    path = tmp_path / "addresses.ndjson"
+    result = export_ndjson(make_resource(AddressResource, client), path, args=("7",))
+    assert result.source == f"{BASE_URL}/customers/7/addresses"
+    assert _ids(path) == [3]
+
+
+def test_export_checks_the_list_scope(client, tmp_path):
+    resource = make_resource(ChargeResource, client, scopes=["read_customers"])
+    with pytest.raises(RechargeAPIError, match="read_orders"):
+        export_ndjson(resource, tmp_path / "charges.ndjson")
+    assert not (tmp_path / "charges.ndjson").exists()
+
+
+def test_listing_describes_the_first_request_of_iter_pages(client):
+    listing = make_resource(AddressResource, client).listing("7", {"limit": 50})
+    assert listing.first_url == f"{BASE_URL}/customers/7/addresses?limit=50"
+    assert (listing.response_key, listing.version) == ("addresses", "2021-01")
+
+    transport = _FakeAsyncTransport()
+    resource = AsyncChargeResource(_make_client(transport), scopes=["read_customers"])
+    with pytest.raises(RechargeAPIError, match="read_orders"):
+        resource.listing()  # not a coroutine: it sends nothing
+    assert transport.calls == []
+
+
+def test_async_export(tmp_path):
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(200, {"charges": _charges(1), "next_cursor": "c2"}),
+            _FakeResponse(200, {"charges": _charges(2), "next_cursor": None}),
+        ]
+    )
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+    path = tmp_path / "charges.ndjson"
+    result = asyncio.run(aexport_ndjson(resource, path))
+    assert result.records == 2
+    assert _ids(path) == [1, 2]
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.aio.v2 import AsyncChargeResource, AsyncCollectionResource, AsyncEventResource
+from recharge.api.v1.addresses import AddressResource
+from recharge.api.v1.shop import ShopResource
+from recharge.api.v2.events import EventResource
+from recharge.api.v2.metafields import MetafieldResource
+from recharge.api.v2.notifications import NotificationResource
+from recharge.api.v2.plans import PlanResource
+from recharge.api.v2.store import StoreResource
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.api.v2.tokens import TokenResource
+from recharge.exceptions import RechargeAPIError, RechargeHTTPError
+from tests.conftest import ALL_SCOPES, BASE_URL, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+from tests.test_loader import _serve_ids
+
+
+@responses_lib.activate
+def test_get_many_fetches_a_page_of_ids_per_request(client):
+    requested = _serve_ids(missing={7})
+    resource = make_resource(SubscriptionResource, client).with_validation("none")
+    ids = [*range(599, -1, -1), 3]
+    result = resource.get_many(ids, concurrency=3)
+    assert list(result) == [id for id in range(599, -1, -1) if id != 7]
+    assert result[42].id == 42
+    assert sorted(len(chunk) for chunk in requested) == [100, 250, 250]
+
+
+@responses_lib.activate
+def test_get_many_falls_back_to_get(client):
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/addresses/1", json={"address": {"id": 1}})
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/addresses/2", status=404, json={})
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/addresses/3", json={"address": {"id": 3}})
+    resource = make_resource(AddressResource, client)
+    assert not resource.ids_filter
+    result = resource.get_many(["3", "2", "1"])
+    assert list(result) == ["3", "1"]
+    assert result["1"].id == 1
+
+
+@responses_lib.activate
+def test_get_many_raises_other_errors(client):
+    responses_lib.add(responses_lib.GET, f"{BASE_URL}/addresses/1", status=500, json={})
+    with pytest.raises(RechargeHTTPError):
+        make_resource(AddressResource, client).get_many([1])
+
+
+@pytest.mark.parametrize(
+    "resource_class",
+    [
+        EventResource,
+        NotificationResource,
+        StoreResource,
+        TokenResource,
+        ShopResource,
+        MetafieldResource,  # get needs the owner resource as well as the id
+    ],
+)
+def test_get_many_needs_ids_filter_or_get_by_id(client, resource_class):
+    with pytest.raises(RechargeAPIError, match="cannot fetch records by id"):
+        make_resource(resource_class, client).get_many([1])
+
+
+def test_get_many_with_ids_filter_needs_no_get(client):
+    make_resource(PlanResource, client)._check_get_many()
+
+
+def test_async_get_many_needs_ids_filter_or_get_by_id():
+    resource = AsyncEventResource(_make_client(_FakeAsyncTransport()), scopes=ALL_SCOPES)
+    with pytest.raises(RechargeAPIError, match="AsyncEventResource cannot fetch"):
+        asyncio.run(resource.get_many([1]))
+
+
+def test_async_get_many():
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(200, {"charges": [{"id": 2}, {"id": 1}]})]
+    )
+    resource = AsyncChargeResource(_make_client(transport), scopes=ALL_SCOPES)
+    result = asyncio.run(resource.with_validation("none").get_many([1, 2, 3]))
+    assert list(result) == [1, 2]
+    assert transport.calls[0][3] == {"ids": "1,2,3", "limit": "3"}
+
+
+def test_async_get_many_falls_back_to_get():
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(200, {"collection": {"id": 5, "title": "Coffee"}}),
+            _FakeResponse(404, {"errors": "Not Found"}),
+        ]
+    )
+    resource = AsyncCollectionResource(_make_client(transport), scopes=ALL_SCOPES)
+    result = asyncio.run(resource.get_many([5, 6], concurrency=1))
+    assert list(result) == [5]
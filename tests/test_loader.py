@@ -0,0 +1,109 @@
+import asyncio
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.aio.v2 import AsyncSubscriptionResource
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.exceptions import RechargeHTTPError
+from recharge.loader import AsyncBatchLoader, BatchLoader
+from tests.conftest import ALL_SCOPES, BASE_URL, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+
+
+def _serve_ids(missing=()):
+    requested = []
+
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        ids = query["ids"][0].split(",")
+        requested.append(ids)
+        assert query["limit"] == [str(len(ids))]
+        records = [{"id": int(i)} for i in ids if int(i) not in missing]
+        return 200, {}, json.dumps({"subscriptions": records})
+
+    responses_lib.add_callback(responses_lib.GET, f"{BASE_URL}/subscriptions", callback=callback)
+    return requested
+
+
+@responses_lib.activate
+def test_concurrent_loads_share_one_request(client):
+    requested = _serve_ids(missing={4})
+    resource = make_resource(SubscriptionResource, client).with_validation("none")
+    loader = BatchLoader(resource, wait=0.05)
+    results: dict = {}
+    start = threading.Barrier(5)
+
+    def load(id):
+        start.wait()
+        try:
+            results[id] = loader.load(id).id
+        except RechargeHTTPError as exc:
+            results[id] = exc.status_code
+
+    threads = [threading.Thread(target=load, args=(id,)) for id in (1, 2, 3, 4, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {1: 1, 2: 2, 3: 3, 4: 404}
+    assert len(requested) == 1 and sorted(requested[0]) == ["1", "2", "3", "4"]
+
+
+@responses_lib.activate
+def test_load_many_chunks_by_page_size(client):
+    requested = _serve_ids()
+    loader = BatchLoader(make_resource(SubscriptionResource, client).with_validation("none"))
+    records = loader.load_many(range(600))
+    assert [record.id for record in records] == list(range(600))
+    assert sorted(len(ids) for ids in requested) == [100, 250, 250]
+
+
+def test_async_loads_are_batched_per_tick():
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(200, {"subscriptions": [{"id": 2}, {"id": 1}]})]
+    )
+    resource = AsyncSubscriptionResource(_make_client(transport), scopes=ALL_SCOPES)
+    loader = AsyncBatchLoader(resource.with_validation("none"))
+
+    async def main():
+        return await asyncio.gather(
+            loader.load(1), loader.load(2), loader.load(3), return_exceptions=True
+        )
+
+    one, two, three = asyncio.run(main())
+    assert (one.id, two.id) == (1, 2)
+    assert isinstance(three, RechargeHTTPError) and three.status_code == 404
+    assert len(transport.calls) == 1
+    assert transport.calls[0][3]["ids"] == "1,2,3"
+
+
+def test_async_batch_errors_reach_every_caller():
+    transport = _FakeAsyncTransport([_FakeResponse(500, {"errors": "boom"})])
+    resource = AsyncSubscriptionResource(_make_client(transport), scopes=ALL_SCOPES)
+    loader = AsyncBatchLoader(resource)
+
+    with pytest.raises(RechargeHTTPError):
+        asyncio.run(loader.load_many([1, 2]))
+
+
+def test_cancelled_batch_cancels_its_loads():
+    transport = _FakeAsyncTransport(
+        [_FakeResponse(200, {"subscriptions": [{"id": 1}]})], latency=10
+    )
+    resource = AsyncSubscriptionResource(_make_client(transport), scopes=ALL_SCOPES)
+    loader = AsyncBatchLoader(resource)
+
+    async def main():
+        load = asyncio.ensure_future(loader.load(1))
+        while not transport.calls:
+            await asyncio.sleep(0)
+        for task in loader._tasks:
+            task.cancel()
+        return await asyncio.wait_for(asyncio.gather(load, return_exceptions=True), 1)
+
+    (result,) = asyncio.run(main())
+    assert isinstance(result, asyncio.CancelledError)
@@ -0,0 +1,125 @@
+import json
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.v2.customers import CustomerResource
+from recharge.api.v2.products import ProductResource
+from recharge.api.v2.subscriptions import SubscriptionResource
+from recharge.exceptions import RechargeHTTPError
+from recharge.mirror import TABLES, Mirror
+from recharge.model.v2.customer import Customer
+from tests.conftest import BASE_URL, make_resource
+from tests.v2.test_customers_v2 import CUSTOMER_DATA
+
+
+class _Collection:
+    """Serves a listing honouring ``updated_at_min``, one page per request."""
+
+    def __init__(self, name: str, *records: dict) -> None:
+        self.name = name
+        self.records = list(records)
+        self.queries: list[dict] = []
+        responses_lib.add_callback(responses_lib.GET, f"{BASE_URL}/{name}", callback=self.callback)
+
+    def callback(self, request):
+        query = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        self.queries.append(query)
+        lower = query.get("updated_at_min", "")
+        records = [r for r in self.records if r.get("updated_at", "") >= lower]
+        return 200, {}, json.dumps({self.name: records, "next_cursor": None})
+
+
+def _customer(id, email, updated_at="2024-01-01T00:00:00"):
+    return {**CUSTOMER_DATA, "id": id, "email": email, "updated_at": updated_at}
+
+
+def _subscription(id, customer_id, status="active"):
+    return {
+        "id": id,
+        "customer_id": customer_id,
+        "address_id": 10 + customer_id,
+        "status": status,
+        "next_charge_scheduled_at": "2024-02-01",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+@pytest.fixture
+def mirror(client, tmp_path):
+    api = SimpleNamespace(
+        Customer=make_resource(CustomerResource, client),
+        Subscription=make_resource(SubscriptionResource, client).with_validation("none"),
+        Product=make_resource(ProductResource, client).with_validation("none"),
+    )
+    tables = [t for t in TABLES if t.resource in vars(api)]
+    mirror = Mirror(str(tmp_path / "mirror.db"), api, tables)
+    yield mirror
+    mirror.close()
+
+
+@responses_lib.activate
+def test_sync_and_query(mirror):
+    customers = _Collection("customers", _customer(1, "Joe@Example.com"), _customer(2, "ann@x.io"))
+    _Collection("subscriptions", _subscription(5, 1), _subscription(6, 1, "cancelled"))
+    _Collection("products", {"external_product_id": "p1", "title": "Coffee"})
+
+    assert mirror.sync() == {"customers": 2, "subscriptions": 2, "products": 1}
+
+    found = mirror.customers.list_({"email": "joe@example.com"})
+    assert [type(c) for c in found] == [Customer]
+    assert found[0].id == 1
+    assert [s.id for s in mirror.subscriptions.list_({"customer_id": 1, "status": "ACTIVE"})] == [5]
+    assert mirror.subscriptions.count({"ids": "5,6"}) == 2
+    assert mirror.subscriptions.get(6).status == "cancelled"
+    assert mirror.products.get("p1").title == "Coffee"
+    assert mirror.customers.get(3) is None
+
+    customers.records[1] = _customer(2, "ann@y.io", "2024-01-02T00:00:00")
+    assert mirror.sync("customers") == {"customers": 1}
+    assert customers.queries[-1]["updated_at_min"] == "2023-12-31T23:55:00"
+    assert mirror.customers.get(2).email == "ann@y.io"
+    assert mirror.customers.count() == 2
+
+
+@responses_lib.activate
+def test_full_sync_drops_deleted_records(mirror):
+    customers = _Collection("customers", _customer(1, "a@x.io"), _customer(2, "b@x.io"))
+    mirror.sync("customers")
+    del customers.records[0]
+    assert mirror.sync("customers", full=True) == {"customers": 1}
+    assert "updated_at_min" not in customers.queries[-1]
+    assert [c.id for c in mirror.customers.list_()] == [2]
+
+
+@responses_lib.activate
+def test_failed_full_sync_keeps_the_table_and_watermark(mirror):
+    _Collection("customers", _customer(1, "a@x.io"), _customer(2, "b@x.io"))
+    mirror.sync("customers")
+    watermark = mirror._watermarks.load("mirror:customers")
+
+    def fail_on_second_page(request):
+        if "cursor=c2" in request.url:
+            return 404, {}, json.dumps({"errors": "gone"})
+        return 200, {}, json.dumps({"customers": [_customer(3, "c@x.io")], "next_cursor": "c2"})
+
+    responses_lib.remove(responses_lib.GET, f"{BASE_URL}/customers")
+    responses_lib.add_callback(
+        responses_lib.GET, f"{BASE_URL}/customers", callback=fail_on_second_page
+    )
+    with pytest.raises(RechargeHTTPError):
+        mirror.sync("customers", full=True)
+    assert [c.id for c in mirror.customers.list_()] == [1, 2]
+    assert mirror._watermarks.load("mirror:customers") == watermark
+
+
+def test_filters_use_the_indexes(mirror):
+    conn = mirror._connection()
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM subscriptions WHERE customer_id = ?", (1,)
+    ).fetchall()
+    assert "subscriptions_customer_id" in str(plan)
+    with pytest.raises(ValueError, match="can be filtered by ids, customer_id"):
+        mirror.subscriptions.list_({"external_variant_id": "x"})
@@ -1,6 +1,21 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
 import responses as responses_lib
 
-from recharge.pagination import get_next_page_url
+from recharge.pagination import (
+    count_query,
+    get_next_page_url,
+    next_page_url,
+    page_base,
+    page_queries,
+    paginate_sharded,
+    paginate_sharded_async,
+    prefetch_pages,
+    prefetch_pages_async,
+)
 from recharge.transport import RequestsTransport
 
 import requests
@@ -64,3 +79,204 @@ def test_v2_cursor_strips_other_params():
     assert "status=" not in url
     assert "cursor=xyz999" in url
     assert "limit=50" in url
+
+
+def test_next_page_url_uses_decoded_body():
+    class _Undecodable(_FakeResponse):
+        def json(self):
+            raise AssertionError("body decoded twice")
+
+    resp = _Undecodable(url="https://api.rechargeapps.com/charges?status=QUEUED&limit=50")
+    body = {"charges": [], "next_cursor": "a/b"}
+    url = next_page_url(resp, body, "2021-11", "https://api.rechargeapps.com/charges", "50")
+    assert url == "https://api.rechargeapps.com/charges?limit=50&cursor=a%2Fb"
+    assert next_page_url(resp, {"next_cursor": None}, "2021-11", "x", "50") == ""
+
+
+def test_page_base_takes_limit_from_query_or_url():
+    assert page_base("https://api.rechargeapps.com/charges", {"limit": 250}) == (
+        "https://api.rechargeapps.com/charges",
+        "250",
+    )
+    assert page_base("https://api.rechargeapps.com/charges?limit=5&status=x") == (
+        "https://api.rechargeapps.com/charges",
+        "5",
+    )
+    assert page_base("https://api.rechargeapps.com/charges") == (
+        "https://api.rechargeapps.com/charges",
+        None,
+    )
+
+
+def _fake_listing(records, calls):
+    """An ``iter_pages`` stand-in that filters ``records`` by created_at window and pages them."""
+    def iter_pages(query):
+        calls.append(dict(query))
+        lower = datetime.fromisoformat(query["created_at_min"])
+        upper = datetime.fromisoformat(query["created_at_max"])
+        limit = int(query["limit"])
+        matching = [r for r in records if lower <= r["created_at"] <= upper]
+        for i in range(0, len(matching), limit):
+            yield matching[i : i + limit]
+
+    return iter_pages
+
+
+def _records():
+    start = datetime(2024, 1, 1)
+    # Sparse January, one very dense day in February.
+    sparse = [start + timedelta(days=i) for i in range(31)]
+    dense = [datetime(2024, 2, 1) + timedelta(minutes=i) for i in range(600)]
+    return [{"id": i, "created_at": ts} for i, ts in enumerate(sparse + dense)]
+
+
+def test_paginate_sharded_returns_every_record_once():
+    records = _records()
+    calls = []
+    result = paginate_sharded(
+        _fake_listing(records, calls),
+        {"created_at_min": "2024-01-01T00:00:00", "created_at_max": "2024-03-01T00:00:00"},
+        shards=4,
+    )
+    assert sorted(r["id"] for r in result) == [r["id"] for r in records]
+    assert len({r["id"] for r in result}) == len(result)
+    assert all(call["limit"] == "250" for call in calls)
+
+
+def test_paginate_sharded_splits_dense_windows_only():
+    records = _records()
+    calls = []
+    paginate_sharded(
+        _fake_listing(records, calls),
+        {"created_at_min": "2024-01-01T00:00:00", "created_at_max": "2024-03-01T00:00:00"},
+        shards=2,
+    )
+    windows = {(c["created_at_min"], c["created_at_max"]) for c in calls}
+    # The sparse January half is fetched once; the dense February half is subdivided.
+    january = [w for w in windows if w[1] <= "2024-01-31T00:00:00"]
+    february = [w for w in windows if w[0] >= "2024-01-31T00:00:00"]
+    assert len(january) == 1
+    assert len(february) > 3
+
+
+def test_paginate_sharded_respects_min_window():
+    records = _records()
+    calls = []
+    result = paginate_sharded(
+        _fake_listing(records, calls),
+        {"created_at_min": "2024-01-01T00:00:00", "created_at_max": "2024-03-01T00:00:00"},
+        shards=1,
+        min_window=timedelta(days=30),
+    )
+    assert len(result) == len(records)
+    assert len({(c["created_at_min"], c["created_at_max"]) for c in calls}) <= 3
+
+
+def test_paginate_sharded_requires_lower_bound():
+    with pytest.raises(ValueError):
+        paginate_sharded(_fake_listing([], []), {"created_at_max": "2024-03-01T00:00:00"})
+
+
+def test_paginate_sharded_async():
+    records = _records()
+    calls = []
+    sync_pages = _fake_listing(records, calls)
+
+    async def iter_pages(query):
+        for page in sync_pages(query):
+            await asyncio.sleep(0)
+            yield page
+
+    result = asyncio.run(
+        paginate_sharded_async(
+            iter_pages,
+            {"created_at_min": "2024-01-01T00:00:00", "created_at_max": "2024-03-01T00:00:00"},
+            shards=4,
+        )
+    )
+    assert sorted(r["id"] for r in result) == [r["id"] for r in records]
+
+
+def test_page_queries_cover_total_at_max_page_size():
+    queries = page_queries(501, {"status": "SUCCESS", "page": 7})
+    assert queries == [
+        {"status": "SUCCESS", "limit": 250, "page": 1},
+        {"status": "SUCCESS", "limit": 250, "page": 2},
+        {"status": "SUCCESS", "limit": 250, "page": 3},
+    ]
+    assert page_queries(0) == []
+    assert len(page_queries(10, {"limit": "5"})) == 2
+
+
+def test_count_query_drops_paging_parameters():
+    assert count_query({"status": "SUCCESS", "limit": 250, "page": 2}) == {"status": "SUCCESS"}
+    assert count_query(None) == {}
+
+
+def _wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+
+def test_prefetch_pages_fetches_ahead_up_to_depth():
+    fetched = []
+
+    def pages():
+        for n in range(1, 6):
+            fetched.append(n)
+            yield [n]
+
+    iterator = prefetch_pages(pages(), depth=2)
+    assert next(iterator) == [1]
+    # Page 1 is with the consumer; pages 2 and 3 are fetched behind its back.
+    assert _wait_for(lambda: fetched == [1, 2, 3])
+    time.sleep(0.01)
+    assert fetched == [1, 2, 3]
+    assert list(iterator) == [[2], [3], [4], [5]]
+
+
+def test_prefetch_pages_reraises_fetch_errors_in_order():
+    def pages():
+        yield [1]
+        raise RuntimeError("boom")
+
+    iterator = prefetch_pages(pages())
+    assert next(iterator) == [1]
+    with pytest.raises(RuntimeError, match="boom"):
+        next(iterator)
+
+
+def test_prefetch_pages_stops_fetching_when_consumer_stops():
+    fetched = []
+
+    def pages():
+        for n in range(100):
+            fetched.append(n)
+            yield [n]
+
+    iterator = prefetch_pages(pages(), depth=1)
+    next(iterator)
+    iterator.close()
+    time.sleep(0.01)
+    assert len(fetched) <= 3
+
+
+def test_prefetch_pages_async_overlaps_fetching_with_consumer():
+    async def pages():
+        for n in range(4):
+            await asyncio.sleep(0.02)
+            yield [n]
+
+    async def consume():
+        seen = []
+        async for page in prefetch_pages_async(pages(), depth=1):
+            await asyncio.sleep(0.02)
+            seen.extend(page)
+        return seen
+
+    start = time.perf_counter()
+    assert asyncio.run(consume()) == [0, 1, 2, 3]
+    # Serial would be 8 * 20ms; overlapped it is about 5 * 20ms.
+    assert time.perf_counter() - start < 0.15
@@ -0,0 +1,182 @@
+import threading
+
+import pytest
+
+from recharge.client import RechargeClient
+from recharge.ratelimit import (
+    LeakyBucketRateLimiter,
+    SQLiteRateLimiter,
+    parse_limit_header,
+)
+from recharge.retry import ExponentialBackoffRetry
+
+BASE_URL = "https://api.rechargeapps.com"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, headers=None, data=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data or {}
+        self.text = ""
+        self.url = BASE_URL
+        self.links = {}
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+def test_requests_within_bucket_are_not_delayed():
+    limiter = LeakyBucketRateLimiter(bucket_size=10, leak_rate=2.0, headroom=0, clock=_Clock())
+    assert [limiter.reserve() for _ in range(10)] == [0.0] * 10
+
+
+def test_overflowing_requests_are_paced_at_leak_rate():
+    limiter = LeakyBucketRateLimiter(bucket_size=4, leak_rate=2.0, headroom=0, clock=_Clock())
+    for _ in range(4):
+        limiter.reserve()
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_drains_over_time():
+    clock = _Clock()
+    limiter = LeakyBucketRateLimiter(bucket_size=4, leak_rate=2.0, headroom=0, clock=clock)
+    for _ in range(4):
+        limiter.reserve()
+    clock.now = 1.0  # two slots leaked out
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_headroom_reserves_slots_for_other_clients():
+    limiter = LeakyBucketRateLimiter(bucket_size=4, leak_rate=1.0, headroom=2, clock=_Clock())
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_parse_limit_header():
+    assert parse_limit_header(_FakeResponse(headers={"X-Recharge-Limit": "12/80"})) == (12, 80)
+    assert parse_limit_header(_FakeResponse()) is None
+    assert parse_limit_header(_FakeResponse(headers={"X-Recharge-Limit": "junk"})) is None
+
+
+def test_observe_syncs_level_and_bucket_size_from_header():
+    limiter = LeakyBucketRateLimiter(bucket_size=40, leak_rate=2.0, headroom=0, clock=_Clock())
+    limiter.observe(_FakeResponse(headers={"X-Recharge-Limit": "79/80"}))
+    assert limiter.bucket_size == 80
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_observe_429_without_header_fills_bucket():
+    limiter = LeakyBucketRateLimiter(bucket_size=4, leak_rate=2.0, headroom=0, clock=_Clock())
+    limiter.observe(_FakeResponse(status_code=429))
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_shared_limiter_is_thread_safe():
+    limiter = LeakyBucketRateLimiter(bucket_size=10, leak_rate=1.0, headroom=0, clock=_Clock())
+    delays = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(25):
+            delay = limiter.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Every reservation gets its own slot: 10 free, then one per second.
+    assert sorted(delays) == [0.0] * 10 + [float(i) for i in range(1, 191)]
+
+
+def test_client_waits_for_limiter_and_observes_responses(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("recharge.client.time.sleep", sleeps.append)
+
+    class _Transport:
+        def send(self, method, url, headers, params, json_body):
+            return _FakeResponse(headers={"X-Recharge-Limit": "3/40"}, data={"charge": {"id": 1}})
+
+    class _Limiter:
+        def __init__(self):
+            self.observed = []
+
+        def reserve(self):
+            return 0.25
+
+        def observe(self, response):
+            self.observed.append(response.headers["X-Recharge-Limit"])
+
+    limiter = _Limiter()
+    client = RechargeClient(
+        access_token="test",
+        transport=_Transport(),
+        retry_strategy=ExponentialBackoffRetry(max_retries=0),
+        logging_level=50,
+        rate_limiter=limiter,
+    )
+    assert client.get(f"{BASE_URL}/charges", response_key="charge") == {"id": 1}
+    assert sleeps == [0.25]
+    assert limiter.observed == ["3/40"]
+
+
+def test_sqlite_limiters_on_same_file_share_one_bucket(tmp_path):
+    clock = _Clock()
+    path = str(tmp_path / "ratelimit.sqlite3")
+    first = SQLiteRateLimiter(path, bucket_size=4, leak_rate=2.0, headroom=0, clock=clock)
+    second = SQLiteRateLimiter(path, bucket_size=4, leak_rate=2.0, headroom=0, clock=clock)
+    assert [first.reserve(), second.reserve(), first.reserve(), second.reserve()] == [0.0] * 4
+    assert second.reserve() == pytest.approx(0.5)
+    clock.now = 10.0
+    assert first.reserve() == 0.0
+
+
+def test_sqlite_limiter_observes_limit_header(tmp_path):
+    clock = _Clock()
+    path = str(tmp_path / "ratelimit.sqlite3")
+    limiter = SQLiteRateLimiter(path, bucket_size=40, leak_rate=2.0, headroom=0, clock=clock)
+    limiter.observe(_FakeResponse(headers={"X-Recharge-Limit": "80/80"}))
+    assert limiter.reserve() == pytest.approx(0.5)
+    other = SQLiteRateLimiter(path, clock=clock, headroom=0)
+    assert other.reserve() == pytest.approx(1.0)
+
+
+def test_sqlite_limiter_is_thread_safe(tmp_path):
+    path = str(tmp_path / "ratelimit.sqlite3")
+    limiter = SQLiteRateLimiter(path, bucket_size=10, leak_rate=1.0, headroom=0, clock=_Clock())
+    delays = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            delay = limiter.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(delays) == [0.0] * 10 + [float(i) for i in range(1, 31)]
@@ -45,3 +45,120 @@ def test_zero_retries_never_retries():
     strategy = ExponentialBackoffRetry(max_retries=0)
     assert strategy.should_retry(attempt=0, status_code=429) is False
     assert strategy.should_retry(attempt=0, status_code=500) is False
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_retry_after_seconds_is_honoured():
+    strategy = ExponentialBackoffRetry(base_delay=2.0, leak_rate=2.0)
+    delay = strategy.delay_for(2, response=_Response(503, {"Retry-After": "1"}))
+    assert 1.0 <= delay <= 1.5
+
+
+def test_retry_after_http_date_is_honoured():
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+
+    when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    strategy = ExponentialBackoffRetry()
+    delay = strategy.delay_for(0, response=_Response(429, {"Retry-After": when}))
+    assert 28 <= delay <= 31
+
+
+def test_rate_limit_header_gives_shortest_safe_delay():
+    strategy = ExponentialBackoffRetry(base_delay=2.0, leak_rate=2.0)
+    delay = strategy.delay_for(1, response=_Response(429, {"X-Recharge-Limit": "40/40"}))
+    # One slot leaks out after 0.5s, far sooner than the 4s exponential backoff.
+    assert 0.5 <= delay <= 1.0
+
+
+def test_falls_back_to_exponential_without_headers():
+    strategy = ExponentialBackoffRetry(base_delay=1.0, jitter=0.0)
+    assert strategy.delay_for(2, response=_Response(500)) == 4.0
+
+
+def test_max_delay_caps_backoff_but_not_retry_after():
+    assert ExponentialBackoffRetry(jitter=0).delay_for(10) == 2048.0
+    strategy = ExponentialBackoffRetry(max_delay=5.0)
+    assert strategy.delay_for(10) == 5.0
+    assert strategy.delay_for(0, response=_Response(429, {"Retry-After": "3600"})) >= 3600
+
+
+def test_client_passes_response_to_strategy(monkeypatch):
+    from recharge.client import RechargeClient
+
+    monkeypatch.setattr("recharge.client.time.sleep", lambda s: None)
+    seen = []
+
+    class _Strategy:
+        def should_retry(self, attempt, status_code):
+            return attempt < 1 and status_code == 429
+
+        def delay_for(self, attempt, response=None, elapsed=0.0):
+            seen.append((attempt, response.headers.get("Retry-After"), elapsed >= 0))
+            return 0.0
+
+    class _FakeResponse(_Response):
+        text = ""
+        url = "https://api.rechargeapps.com/charges"
+        links = {}
+
+        def json(self):
+            return {"charge": {"id": 1}}
+
+        def raise_for_status(self):
+            pass
+
+    responses = [_FakeResponse(429, {"Retry-After": "2"}), _FakeResponse(200)]
+
+    class _Transport:
+        def send(self, method, url, headers, params, json_body):
+            return responses.pop(0)
+
+    client = RechargeClient(
+        "test", transport=_Transport(), retry_strategy=_Strategy(), logging_level=50
+    )
+    assert client.get("https://api.rechargeapps.com/charges", response_key="charge") == {"id": 1}
+    assert seen == [(0, "2", True)]
+
+
+def test_client_supports_strategies_without_response(monkeypatch):
+    from recharge.client import RechargeClient
+
+    monkeypatch.setattr("recharge.client.time.sleep", lambda s: None)
+    seen = []
+
+    class _LegacyStrategy:
+        def should_retry(self, attempt, status_code):
+            return attempt < 1 and status_code == 503
+
+        def delay_for(self, attempt):
+            seen.append(attempt)
+            return 0.0
+
+    class _FakeResponse(_Response):
+        text = ""
+        url = "https://api.rechargeapps.com/charges"
+        links = {}
+
+        def json(self):
+            return {"charge": {"id": 1}}
+
+        def raise_for_status(self):
+            pass
+
+    responses = [_FakeResponse(503), _FakeResponse(200)]
+
+    class _Transport:
+        def send(self, method, url, headers, params, json_body):
+            return responses.pop(0)
+
+    client = RechargeClient(
+        "test", transport=_Transport(), retry_strategy=_LegacyStrategy(), logging_level=50
+    )
+    assert client.get("https://api.rechargeapps.com/charges", response_key="charge") == {"id": 1}
+    assert seen == [0]
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.aio.v2 import AsyncCustomerResource
+from recharge.api.v2.customers import CustomerResource
+from recharge.sync import (
+    FileWatermarkStore,
+    IncrementalSync,
+    MemoryWatermarkStore,
+    SQLiteWatermarkStore,
+    SyncState,
+    WatermarkStore,
+)
+from tests.conftest import ALL_SCOPES, BASE_URL, make_resource
+from tests.test_async_client import _FakeAsyncTransport, _FakeResponse, _make_client
+
+
+class _Customers:
+    """Serves ``/customers`` honouring ``updated_at_min``, one page per request."""
+
+    def __init__(self) -> None:
+        self.rows: dict[int, str] = {}
+        self.queries: list[dict] = []
+        responses_lib.add_callback(
+            responses_lib.GET, f"{BASE_URL}/customers", callback=self.callback
+        )
+
+    def callback(self, request):
+        query = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        self.queries.append(query)
+        lower = query.get("updated_at_min", "")
+        records = [
+            {"id": i, "updated_at": updated_at}
+            for i, updated_at in sorted(self.rows.items())
+            if updated_at >= lower
+        ]
+        return 200, {}, json.dumps({"customers": records, "next_cursor": None})
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryWatermarkStore()
+    if request.param == "file":
+        return FileWatermarkStore(str(tmp_path / "watermarks"))
+    return SQLiteWatermarkStore(str(tmp_path / "watermarks.db"))
+
+
+@responses_lib.activate
+def test_only_changed_records_are_emitted(client, store):
+    assert isinstance(store, WatermarkStore)
+    api = _Customers()
+    api.rows = {1: "2024-01-01T10:00:00", 2: "2024-01-01T11:00:00", 3: "2024-01-01T12:00:00"}
+    resource = make_resource(CustomerResource, client).with_validation("none")
+    sync = IncrementalSync(store, overlap=timedelta(hours=1, minutes=30))
+
+    assert [c.id for c in sync.changes(resource)] == [1, 2, 3]
+    assert "updated_at_min" not in api.queries[-1]
+
+    assert sync.changes(resource) == []  # 2 and 3 come back in the overlap, unchanged
+    assert api.queries[-1]["updated_at_min"] == "2024-01-01T10:30:00"
+
+    api.rows[2] = "2024-01-01T12:30:00"
+    api.rows[4] = "2024-01-01T12:00:00"  # committed late, inside the overlap
+    assert [c.id for c in sync.changes(resource)] == [2, 4]
+    state = store.load(f"{BASE_URL}/customers")
+    assert state.watermark == "2024-01-01T12:30:00"
+    assert set(state.seen) == {"2", "3", "4"}  # 1 is behind the overlap and forgotten
+
+
+def test_store_accepts_long_keys(store):
+    key = f"{BASE_URL}/customers?" + "&".join(f"filter_{i}=value-{i}" for i in range(30))
+    store.save(key, SyncState("2024-01-01T10:00:00", {"1": "2024-01-01T10:00:00"}))
+    assert store.load(key).seen == {"1": "2024-01-01T10:00:00"}
+    assert store.load(key[:-1]) is None
+
+
+@responses_lib.activate
+def test_watermark_is_kept_when_the_consumer_stops(client):
+    api = _Customers()
+    api.rows = {1: "2024-01-01T10:00:00"}
+    store = MemoryWatermarkStore()
+    resource = make_resource(CustomerResource, client).with_validation("none")
+    sync = IncrementalSync(store)
+
+    for _ in sync.iter_changes(resource, {"email": "a@example.com"}):
+        break
+    assert store.load(f"{BASE_URL}/customers?email=a%40example.com") is None
+    assert len(sync.changes(resource, {"email": "a@example.com"}, key="customers")) == 1
+    assert store.load("customers").watermark == "2024-01-01T10:00:00"
+
+
+def test_async_changes():
+    transport = _FakeAsyncTransport(
+        [
+            _FakeResponse(
+                200, {"customers": [{"id": 1, "updated_at": "2024-01-01T10:00:00+00:00"}]}
+            ),
+            _FakeResponse(
+                200, {"customers": [{"id": 1, "updated_at": "2024-01-01T10:00:00+00:00"}]}
+            ),
+        ]
+    )
+    store = MemoryWatermarkStore()
+    store.save("customers", SyncState("2024-01-01T09:00:00+00:00"))
+    resource = AsyncCustomerResource(_make_client(transport), scopes=ALL_SCOPES)
+    resource = resource.with_validation("none")
+    sync = IncrementalSync(store, overlap=timedelta(minutes=10))
+
+    assert len(asyncio.run(sync.achanges(resource, key="customers"))) == 1
+    assert transport.calls[0][3]["updated_at_min"] == "2024-01-01T08:50:00+00:00"
+    assert asyncio.run(sync.achanges(resource, key="customers")) == []
@@ -0,0 +1,160 @@
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses as responses_lib
+
+from recharge.api.v2.events import EventResource
+from recharge.sync import MemoryWatermarkStore
+from recharge.tailer import EventTailer
+from tests.conftest import BASE_URL, make_resource
+
+
+def _event(id, object_type, created_at, object_id=1):
+    return {
+        "id": id,
+        "object_id": object_id,
+        "customer_id": 1,
+        "created_at": created_at,
+        "object_type": object_type,
+        "verb": "updated",
+        "description": f"{object_type} updated",
+    }
+
+
+class _Events:
+    """Serves ``/events`` newest first, honouring ``created_at_min`` and ``created_at_max``."""
+
+    def __init__(self, *events) -> None:
+        self.events = list(events)
+        self.queries: list[dict] = []
+        responses_lib.add_callback(responses_lib.GET, f"{BASE_URL}/events", callback=self.callback)
+
+    def callback(self, request):
+        query = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        self.queries.append(query)
+        lower = query.get("created_at_min", "")
+        upper = query.get("created_at_max", "9999")
+        events = [e for e in self.events if lower <= e["created_at"] <= upper]
+        events.sort(key=lambda e: e["created_at"], reverse=True)
+        return 200, {}, json.dumps({"events": events, "next_cursor": None})
+
+
+@responses_lib.activate
+def test_poll_dispatches_new_events_once_in_order(client):
+    api = _Events(
+        _event(1, "subscription", "2024-01-01T10:00:00+00:00"),
+        _event(2, "charge", "2024-01-01T10:00:30+00:00"),
+        _event(3, "subscription", "2024-01-01T10:01:00+00:00"),
+    )
+    store = MemoryWatermarkStore()
+    subscriptions = []
+    tailer = EventTailer(
+        make_resource(EventResource, client),
+        store,
+        start="2024-01-01T10:00:00+00:00",
+    )
+    tailer.on("subscription")(lambda event: subscriptions.append(event.id))
+
+    assert tailer.poll() == 3
+    assert subscriptions == [1, 3]
+    assert api.queries[0]["created_at_min"] == "2024-01-01T09:59:00+00:00"
+
+    api.events.append(_event(4, "subscription", "2024-01-01T10:01:00+00:00"))
+    assert tailer.poll() == 1  # 3 is re-listed at the window boundary but not re-dispatched
+    assert subscriptions == [1, 3, 4]
+    assert store.load(f"{BASE_URL}/events").watermark == "2024-01-01T10:01:00+00:00"
+    tailer.close()
+
+
+@responses_lib.activate
+def test_failed_handler_keeps_the_watermark(client):
+    _Events(_event(1, "order", "2024-01-01T10:00:00+00:00"))
+    store = MemoryWatermarkStore()
+    calls = []
+
+    def flaky(event):
+        calls.append(event.id)
+        if len(calls) == 1:
+            raise RuntimeError("downstream unavailable")
+
+    tailer = EventTailer(
+        make_resource(EventResource, client),
+        store,
+        handlers={"order": flaky},
+        start="2024-01-01T09:00:00+00:00",
+    )
+    with pytest.raises(RuntimeError):
+        tailer.poll()
+    assert store.load(f"{BASE_URL}/events") is None
+    assert tailer.poll() == 1
+    assert calls == [1, 1]
+    tailer.close()
+
+
+@responses_lib.activate
+def test_large_backlog_is_halved_and_saved_half_by_half(client):
+    api = _Events(
+        _event(1, "order", "2024-01-01T10:00:00+00:00"),
+        _event(2, "order", "2024-01-01T10:10:00+00:00"),
+        _event(3, "order", "2024-01-01T10:50:00+00:00"),
+        _event(4, "order", "2024-01-01T10:55:00+00:00"),
+    )
+    store = MemoryWatermarkStore()
+    handled = []
+
+    def handle(event):
+        if event.id == 4 and 4 not in handled:
+            handled.append(4)
+            raise RuntimeError("downstream unavailable")
+        handled.append(event.id)
+
+    tailer = EventTailer(
+        make_resource(EventResource, client),
+        store,
+        handlers={"order": handle},
+        query={"created_at_max": "2024-01-01T11:00:00+00:00"},
+        start="2024-01-01T10:01:00+00:00",
+        max_events=2,
+    )
+    with pytest.raises(RuntimeError):
+        tailer.poll()
+    # 4 events overflow 10:00-11:00, so the range is re-read as two halves
+    assert [(q["created_at_min"], q["created_at_max"]) for q in api.queries] == [
+        ("2024-01-01T10:00:00+00:00", "2024-01-01T11:00:00+00:00"),
+        ("2024-01-01T10:00:00+00:00", "2024-01-01T10:30:00+00:00"),
+        ("2024-01-01T10:30:00+00:00", "2024-01-01T11:00:00+00:00"),
+    ]
+    assert handled == [1, 2, 3, 4]
+    # the first half was handled, so its newest event is the watermark; the failed half is not
+    assert store.load(f"{BASE_URL}/events").watermark == "2024-01-01T10:10:00+00:00"
+
+    assert tailer.poll() == 2  # re-read from 10:09; event 2 was seen and is not re-dispatched
+    assert handled == [1, 2, 3, 4, 3, 4]
+    assert len(api.queries) == 6  # 10:09-11:00 still holds 3 events, so it is halved too
+    assert store.load(f"{BASE_URL}/events").watermark == "2024-01-01T10:55:00+00:00"
+    tailer.close()
+
+
+@responses_lib.activate
+def test_run_backs_off_while_idle(client, monkeypatch):
+    _Events()
+    waits = []
+    stop = threading.Event()
+
+    def wait(timeout):
+        waits.append(timeout)
+        if len(waits) == 4:
+            stop.set()
+
+    monkeypatch.setattr(stop, "wait", wait)
+    tailer = EventTailer(
+        make_resource(EventResource, client),
+        MemoryWatermarkStore(),
+        min_interval=1,
+        max_interval=5,
+    )
+    tailer.run(stop)
+    assert waits == [2, 4, 5, 5]
+    assert tailer._pool is None
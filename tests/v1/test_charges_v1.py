@@ -1,3 +1,5 @@
+import json
+
 import responses as responses_lib
 
 from recharge.api.v1.charges import ChargeResource
@@ -53,3 +55,27 @@ def test_charge_with_extra_fields(client):
     result = resource.get(1)
     assert result.id == 1
     assert result.model_extra.get("future_api_field") == "value"
+
+
+@responses_lib.activate
+def test_list_all_with_concurrency_fetches_counted_pages_in_order(client):
+    def page(request):
+        number = int(request.params["page"])
+        limit = int(request.params["limit"])
+        ids = range((number - 1) * limit + 1, min(number * limit, 5) + 1)
+        return 200, {}, json.dumps({"charges": [{**CHARGE_DATA, "id": i} for i in ids]})
+
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges/count",
+        json={"count": 5},
+        status=200,
+    )
+    responses_lib.add_callback(responses_lib.GET, f"{BASE_URL}/charges", callback=page)
+    resource = make_resource(ChargeResource, client)
+    results = resource.list_all({"status": "SUCCESS", "limit": 2}, concurrency=3)
+    assert [c.id for c in results] == [1, 2, 3, 4, 5]
+    count_call = responses_lib.calls[0].request
+    assert count_call.params == {"status": "SUCCESS"}
+    pages = sorted(int(call.request.params["page"]) for call in responses_lib.calls[1:])
+    assert pages == [1, 2, 3]
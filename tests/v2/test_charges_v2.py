@@ -1,4 +1,6 @@
+import pytest
 import responses as responses_lib
+from pydantic import ValidationError
 
 from recharge.api.v2.charges import ChargeResource
 from tests.conftest import BASE_URL, make_resource
@@ -78,3 +80,114 @@ def test_capture_charge(client):
     resource = make_resource(ChargeResource, client)
     result = resource.capture(1)
     assert result.status == "SUCCESS"
+
+
+@responses_lib.activate
+def test_iter_pages_charges_is_lazy(client):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [CHARGE_DATA], "next_cursor": "abc"},
+        status=200,
+    )
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [{**CHARGE_DATA, "id": 2}], "next_cursor": None},
+        status=200,
+    )
+    resource = make_resource(ChargeResource, client)
+    pages = resource.iter_pages({"limit": "1"})
+    first = next(pages)
+    assert [c.id for c in first] == [1]
+    assert len(responses_lib.calls) == 1
+    second = next(pages)
+    assert [c.id for c in second] == [2]
+    assert "cursor=abc" in responses_lib.calls[1].request.url
+    assert next(pages, None) is None
+
+
+@responses_lib.activate
+def test_iter_all_charges(client):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [CHARGE_DATA], "next_cursor": "abc"},
+        status=200,
+    )
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [{**CHARGE_DATA, "id": 2}], "next_cursor": None},
+        status=200,
+    )
+    resource = make_resource(ChargeResource, client)
+    assert [c.id for c in resource.iter_all()] == [1, 2]
+
+
+@responses_lib.activate
+def test_list_charges_without_validation(client):
+    line_item = {"title": "Coffee", "tax_lines": [{"price": "1.00"}], "properties": None}
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [{**CHARGE_DATA, "status": "success", "line_items": [line_item]}]},
+        status=200,
+    )
+    resource = make_resource(ChargeResource, client).with_validation("none")
+    (charge,) = resource.list_()
+    assert charge.status == "success"  # field validators are skipped
+    assert charge.line_items[0].tax_lines[0].price == "1.00"
+    assert charge.line_items[0].properties == []
+    assert charge.discounts == []
+
+
+@responses_lib.activate
+def test_validation_mode_defaults_to_client_setting(client):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [{**CHARGE_DATA, "status": "success", "billing_address": {"zip": 1}}]},
+        status=200,
+    )
+    client.validation = "none"
+    resource = make_resource(ChargeResource, client)
+    (charge,) = resource.list_()
+    assert charge.status == "success"
+    assert charge.billing_address.zip == 1
+    with pytest.raises(ValidationError):
+        resource.with_validation("full").list_()
+
+
+@responses_lib.activate
+def test_list_charges_lazily(client):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [{**CHARGE_DATA, "billing_address": {"zip": 1}}]},
+        status=200,
+    )
+    (charge,) = make_resource(ChargeResource, client).with_validation("lazy").list_()
+    assert charge.id == 1
+    with pytest.raises(ValidationError):
+        charge.billing_address
+
+
+@responses_lib.activate
+def test_list_charges_compact(client):
+    responses_lib.add(
+        responses_lib.GET,
+        f"{BASE_URL}/charges",
+        json={"charges": [{**CHARGE_DATA, "id": i, "undocumented": {"x": 1}} for i in (1, 2)]},
+        status=200,
+    )
+    resource = make_resource(ChargeResource, client)
+    first, second = resource.with_compact().list_()
+    assert first.model_extra == {}
+    assert first.currency is second.currency
+    client.compact = True
+    (charge, _) = resource.list_()
+    assert charge.model_extra == {}
+    (charge, _) = resource.with_compact(False).list_()
+    assert charge.model_extra["undocumented"] == {"x": 1}
+
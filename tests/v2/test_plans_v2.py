@@ -2,6 +2,7 @@
 import responses as responses_lib
 
 from recharge.api.v2.plans import PlanResource
+from recharge.model.v2.plan import Plan
 from tests.conftest import BASE_URL, make_resource
 
 PLAN_DATA = {
@@ -48,6 +49,21 @@ def test_bulk_update_returns_list(client):
     assert results[0].id == 1
 
 
+@responses_lib.activate
+def test_bulk_writes_ignore_list_validation_modes(client):
+    responses_lib.add(
+        responses_lib.POST,
+        f"{BASE_URL}/products/123/plans-bulk",
+        json={"plans": [{**PLAN_DATA, "unknown_field": "kept"}]},
+        status=200,
+    )
+    client.validation = "lazy"
+    client.compact = True
+    results = make_resource(PlanResource, client).bulk_create("123", {"plans": []})
+    assert type(results[0]) is Plan
+    assert results[0].model_extra == {"unknown_field": "kept"}
+
+
 @responses_lib.activate
 def test_create_plan(client):
     responses_lib.add(